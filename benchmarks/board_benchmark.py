@@ -0,0 +1,102 @@
+"""Сравнение поля из отдельных виджетов (FisherArea) и поля,
+рисуемого одним виджетом (BoardWidget), на 10 и 1000 рыбаках.
+
+Запуск: QT_QPA_PLATFORM=offscreen python benchmarks/board_benchmark.py
+"""
+import os
+import sys
+import time
+import random
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from PyQt6.QtCore import QObject
+from PyQt6.QtWidgets import QApplication
+
+from game.engine import GameEngine, EVENT_FINISH, EVENT_ALARM
+from widgets.animation_driver import AnimationDriver
+from widgets.board import BoardWidget
+from widgets.fisher_area import FisherArea
+
+
+def resident_memory():
+    """Резидентная память процесса в килобайтах (Linux)"""
+    with open('/proc/self/statm') as f:
+        pages = int(f.read().split()[1])
+    return pages * os.sysconf('SC_PAGE_SIZE') // 1024
+
+
+def make_engine(size, seed=0):
+    rng = random.Random(seed)
+    people = [
+        {'count': rng.randint(0, 9), 'color': '#%06x' % rng.randint(0, 0xffffff)}
+        for _ in range(size)
+    ]
+    return GameEngine(people, alarm=15, seed=seed)
+
+
+def measure(app, area_class, size, ticks=500):
+    engine = make_engine(size)
+
+    memory_before = resident_memory()
+    area = area_class(engine)
+    area.resize(1366, 700)
+    area.show()
+    area.refresh()
+    app.processEvents()
+
+    animations = AnimationDriver()
+    animations.set_board(area)
+    memory_after = resident_memory()
+
+    frame_times = []
+    for _ in range(ticks):
+        started = time.perf_counter()
+
+        event, index = engine.tick()
+        if event == EVENT_FINISH:
+            engine.reset()
+            area.refresh()
+        elif index >= 0:
+            area.update_index(index)
+            if event == EVENT_ALARM:
+                animations.animate_alarm(index)
+            else:
+                animations.animate_catch(index)
+
+        app.processEvents()
+        frame_times.append((time.perf_counter() - started) * 1000)
+
+    frame_times.sort()
+    result = {
+        'renderer': area_class.__name__,
+        'fishers': size,
+        'objects': len(area.findChildren(QObject)) + 1,
+        'memory_kb': memory_after - memory_before,
+        'frame_ms_mean': sum(frame_times) / len(frame_times),
+        'frame_ms_p95': frame_times[int(len(frame_times) * 0.95)],
+    }
+
+    animations.clear()
+    area.close()
+    area.deleteLater()
+    app.processEvents()
+
+    return result
+
+
+def main():
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    print(f"{'renderer':<12} {'fishers':>8} {'objects':>8} {'memory kB':>10} "
+          f"{'mean ms':>8} {'p95 ms':>8}")
+
+    for size in (10, 1000):
+        for area_class in (FisherArea, BoardWidget):
+            r = measure(app, area_class, size)
+            print(f"{r['renderer']:<12} {r['fishers']:>8} {r['objects']:>8} "
+                  f"{r['memory_kb']:>10} {r['frame_ms_mean']:>8.3f} {r['frame_ms_p95']:>8.3f}")
+
+
+if __name__ == '__main__':
+    main()
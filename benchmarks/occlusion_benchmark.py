@@ -0,0 +1,131 @@
+"""Затраты на отображение, когда окна не видно: процессорное время и число
+событий Qt в секунду для одной и той же игры в видимом и свернутом окне.
+
+Запуск: QT_QPA_PLATFORM=offscreen python benchmarks/occlusion_benchmark.py
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(ROOT, 'src'))
+
+from PyQt6.QtCore import QObject, QTimer, QEventLoop
+from PyQt6.QtWidgets import QApplication, QMessageBox
+
+from windows.main_window import MainWindow
+
+FISHERS = 300
+
+# Режим, турбо-режим и скорость
+MODES = (
+    ("обычный", False, 100),
+    ("турбо", True, 20),
+    ("турбо", True, 50),
+)
+
+
+class EventCounter(QObject):
+    """Считает все события, которые доставляет приложение"""
+
+    def __init__(self):
+        super().__init__()
+        self.count = 0
+
+    def eventFilter(self, watched, event):
+        self.count += 1
+        return False
+
+
+def wait(milliseconds):
+    loop = QEventLoop()
+    QTimer.singleShot(milliseconds, loop.quit)
+    loop.exec()
+
+
+def measure(app, window, counter, turbo, speed, minimized, duration):
+    if minimized:
+        window.showMinimized()
+    else:
+        window.showNormal()
+    wait(100)
+
+    window.turbo_action.setChecked(turbo)
+    window.speed_slider.setValue(speed)
+    window.start_game()
+
+    ticks = window.engine.ticks
+    events = counter.count if counter else 0
+    cpu = time.process_time()
+    started = time.perf_counter()
+
+    wait(int(duration * 1000))
+
+    elapsed = time.perf_counter() - started
+    result = {
+        'minimized': window.isMinimized(),
+        'ticks_per_s': (window.engine.ticks - ticks) / elapsed,
+        'cpu_ms_per_s': (time.process_time() - cpu) * 1000 / elapsed,
+        'events_per_s': ((counter.count if counter else 0) - events) / elapsed,
+    }
+
+    window.stop_game()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--duration', type=float, default=5.0,
+                        help="секунд на каждый замер")
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    os.chdir(ROOT)
+
+    temp_dir = tempfile.mkdtemp(prefix='fisher-occlusion-')
+    MainWindow.LOG_DIR = os.path.join(temp_dir, 'logs')
+    MainWindow.AUTOSAVE_DIR = os.path.join(temp_dir, 'autosave')
+    MainWindow.SOLVER_CACHE_DIR = os.path.join(temp_dir, 'cache')
+    QMessageBox.information = lambda *args, **kwargs: QMessageBox.StandardButton.Ok
+    QMessageBox.question = lambda *args, **kwargs: QMessageBox.StandardButton.No
+
+    window = MainWindow()
+    window.record_action.setChecked(False)
+    window.people = [{'id': i, 'count': 0, 'color': '#0ea5e9'} for i in range(FISHERS)]
+    window.update_characters_display()
+    window.show()
+
+    # Отложенная подгрузка модулей и первые кадры не должны попасть в замер
+    wait(2000)
+    measure(app, window, None, False, 100, False, 1.0)
+
+    counter = EventCounter()
+    app.installEventFilter(counter)
+
+    print(f"{'режим':<10} {'скорость':>8} {'окно':<9} {'ход/с':>8} "
+          f"{'CPU мс/с':>9} {'событий/с':>10}")
+
+    for name, turbo, speed in MODES:
+        results = []
+        for minimized in (False, True):
+            r = measure(app, window, counter, turbo, speed, minimized, args.duration)
+            results.append(r)
+            state = "свернуто" if r['minimized'] else "видно"
+            print(f"{name:<10} {speed:>8} {state:<9} {r['ticks_per_s']:>8.0f} "
+                  f"{r['cpu_ms_per_s']:>9.1f} {r['events_per_s']:>10.0f}")
+
+        visible, hidden = results
+        print(f"{'':<10} {'':>8} {'выигрыш':<9} {'':>8} "
+              f"{visible['cpu_ms_per_s'] / max(hidden['cpu_ms_per_s'], 1e-9):>8.1f}x "
+              f"{visible['events_per_s'] / max(hidden['events_per_s'], 1e-9):>9.1f}x")
+
+    app.removeEventFilter(counter)
+    window.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+"""Время пересчета стилей за ход: прежние вызовы setStyleSheet
+против переключения заранее подготовленных состояний.
+
+Запуск: QT_QPA_PLATFORM=offscreen python benchmarks/style_benchmark.py
+"""
+import os
+import sys
+import time
+import random
+import tempfile
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(ROOT, 'src'))
+
+from PyQt6.QtWidgets import QApplication, QLabel
+
+from windows.main_window import MainWindow
+from widgets.fisher_area import STATE_ALARM
+
+# Строки стилей, которые раньше задавались на каждом ходу
+OLD_COUNT_STYLE = """
+    font-size: 18px;
+    font-weight: bold;
+    padding: 5px;
+    color: {color};
+"""
+
+OLD_LAMP_STYLE = """
+    QLabel {{
+        background-color: {fill};
+        border-radius: 10px;
+        border: 1px solid {border};
+    }}
+"""
+
+
+def run_stylesheets(app, window, lamp, events):
+    slots = window.area_container.slots
+
+    started = time.perf_counter()
+    for index, is_alarm, count in events:
+        label = slots[index]['count_label']
+        label.setText(str(count))
+        label.setStyleSheet(OLD_COUNT_STYLE.format(color='#16a34a' if count >= 10 else 'black'))
+
+        if is_alarm:
+            label.setStyleSheet(OLD_COUNT_STYLE.format(color='#ef4444'))
+            lamp.setStyleSheet(OLD_LAMP_STYLE.format(fill='#ef4444', border='#dc2626'))
+            lamp.setStyleSheet(OLD_LAMP_STYLE.format(fill='#d1d5db', border='#9ca3af'))
+            label.setStyleSheet(OLD_COUNT_STYLE.format(color='black'))
+        else:
+            slots[index]['fisher_widget'].setStyleSheet("")
+
+        app.processEvents()
+
+    return (time.perf_counter() - started) / len(events)
+
+
+def run_states(app, window, events):
+    area = window.area_container
+    slots = area.slots
+
+    started = time.perf_counter()
+    for index, is_alarm, count in events:
+        area.update_label(slots[index], count)
+
+        if is_alarm:
+            area.set_state(slots[index], STATE_ALARM)
+            window.alarm_lamp.set_on(True)
+            window.alarm_lamp.set_on(False)
+            area.update_label(slots[index], count)
+
+        app.processEvents()
+
+    return (time.perf_counter() - started) / len(events)
+
+
+def main(ticks=3000):
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    # Окно ищет конфигурацию и ресурсы по путям от корня репозитория
+    os.chdir(ROOT)
+    MainWindow.SOLVER_CACHE_DIR = os.path.join(tempfile.mkdtemp(prefix='fisher-style-'), 'cache')
+
+    window = MainWindow()
+    window.show()
+    app.processEvents()
+
+    rng = random.Random(0)
+    events = [
+        (rng.randrange(len(window.area_container.slots)), rng.random() < 0.15, rng.randint(0, 10))
+        for _ in range(ticks)
+    ]
+
+    # Прежняя лампа была QLabel со стилями, воспроизводим ее рядом с новой
+    old_lamp = QLabel()
+    window.alarm_lamp.parentWidget().layout().addWidget(old_lamp)
+    stylesheet_time = run_stylesheets(app, window, old_lamp, events)
+    old_lamp.deleteLater()
+
+    window.update_characters_display()
+    state_time = run_states(app, window, events)
+
+    print(f"setStyleSheet: {stylesheet_time * 1e6:8.1f} us/ход")
+    print(f"состояния:     {state_time * 1e6:8.1f} us/ход")
+    print(f"ускорение:     {stylesheet_time / state_time:8.1f}x")
+
+    window.close()
+
+
+if __name__ == '__main__':
+    main()
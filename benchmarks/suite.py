@@ -0,0 +1,364 @@
+"""Набор замеров без экрана: создание окна, загрузка конфигурации, ходы игры,
+обновление поля, отрисовка уменьшенного поля, перекраска рыбака и открытие диалогов.
+
+Результаты пишутся в JSON; с --baseline каждый замер сравнивается с
+сохраненным прогоном, и замедление больше --threshold считается регрессией
+(код выхода 1). Все значения — время, меньше значит лучше.
+
+Запуск:
+    QT_QPA_PLATFORM=offscreen python benchmarks/suite.py --output current.json
+    QT_QPA_PLATFORM=offscreen python benchmarks/suite.py --baseline baseline.json
+"""
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import argparse
+import platform
+import tempfile
+import statistics
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(ROOT, 'src'))
+
+from PyQt6.QtCore import QT_VERSION_STR
+from PyQt6.QtWidgets import QApplication, QMessageBox
+
+from game.engine import GameEngine
+from game.scenario import write_scenario
+from windows.main_window import MainWindow
+from widgets.fisher import Fisher
+
+LARGE_SIZE = 100000
+BOARD_SIZE = 1000
+OVERVIEW_SIZE = 50000
+DIALOG_SIZE = 10000
+
+BENCHMARKS = {}
+
+
+def benchmark(name, unit, repeat=None):
+    """Регистрирует замер: функция получает окружение и возвращает время в секундах
+    на одну операцию; результат переводится в unit"""
+    scale = {'s': 1, 'ms': 1e3, 'us': 1e6}[unit.split('/')[0]]
+
+    def register(function):
+        BENCHMARKS[name] = (function, unit, scale, repeat)
+        return function
+
+    return register
+
+
+def make_people(size, seed=0):
+    rng = random.Random(seed)
+    return [
+        {'id': i, 'count': rng.randint(0, 9), 'color': '#%06x' % rng.randint(0, 0xffffff)}
+        for i in range(size)
+    ]
+
+
+class Environment:
+    """Приложение Qt, временные каталоги и сгенерированные файлы сценариев"""
+
+    def __init__(self):
+        self.app = QApplication.instance() or QApplication(sys.argv)
+
+        # Окно ищет конфигурацию и ресурсы по путям от корня репозитория
+        os.chdir(ROOT)
+        self.temp_dir = tempfile.mkdtemp(prefix='fisher-bench-')
+        self.windows = []
+
+        # Журналы и автосохранения замеров не должны попадать в рабочий каталог
+        MainWindow.LOG_DIR = os.path.join(self.temp_dir, 'logs')
+        MainWindow.AUTOSAVE_DIR = os.path.join(self.temp_dir, 'autosave')
+        MainWindow.SOLVER_CACHE_DIR = os.path.join(self.temp_dir, 'cache')
+
+        # Окна сообщений не должны останавливать замер
+        QMessageBox.information = lambda *args, **kwargs: QMessageBox.StandardButton.Ok
+        QMessageBox.warning = lambda *args, **kwargs: QMessageBox.StandardButton.Ok
+        QMessageBox.question = lambda *args, **kwargs: QMessageBox.StandardButton.No
+
+        people = make_people(LARGE_SIZE)
+        self.large_json = os.path.join(self.temp_dir, 'large.json')
+        with open(self.large_json, 'w', encoding='utf-8') as f:
+            json.dump({'speed': 30, 'alarm': 15, 'people': people}, f)
+
+        self.large_scenario = os.path.join(self.temp_dir, 'large.fshs')
+        write_scenario(
+            self.large_scenario, 30, 15,
+            [person['count'] for person in people], [person['color'] for person in people]
+        )
+
+    def window(self, people=None):
+        window = MainWindow()
+        window.record_action.setChecked(False)
+        if people is not None:
+            window.people = people
+        window.show()
+        self.app.processEvents()
+        self.windows.append(window)
+        return window
+
+    def close(self, window):
+        """Закрытие окна останавливает и фоновый расчет оценки времени"""
+        window.close()
+        window.deleteLater()
+        self.app.processEvents()
+        self.windows.remove(window)
+
+    def cleanup(self):
+        # Окна замера, прерванного ошибкой
+        for window in list(self.windows):
+            self.close(window)
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+
+@benchmark('main_window_init', 'ms', repeat=5)
+def main_window_init(env):
+    started = time.perf_counter()
+    window = env.window()
+    elapsed = time.perf_counter() - started
+
+    env.close(window)
+    return elapsed
+
+
+@benchmark('load_config_small', 'ms')
+def load_config_small(env):
+    window = env.window()
+
+    started = time.perf_counter()
+    window.load_config(os.path.join(ROOT, 'src', 'config.json'))
+    elapsed = time.perf_counter() - started
+
+    env.close(window)
+    return elapsed
+
+
+@benchmark('load_config_large_json', 'ms', repeat=3)
+def load_config_large_json(env):
+    window = env.window()
+
+    started = time.perf_counter()
+    window.load_config(env.large_json)
+    elapsed = time.perf_counter() - started
+
+    env.close(window)
+    return elapsed
+
+
+@benchmark('load_config_large_scenario', 'ms')
+def load_config_large_scenario(env):
+    window = env.window()
+
+    started = time.perf_counter()
+    window.load_config(env.large_scenario)
+    elapsed = time.perf_counter() - started
+
+    env.close(window)
+    return elapsed
+
+
+@benchmark('game_tick', 'us/tick')
+def game_tick(env, ticks=2000):
+    window = env.window(make_people(BOARD_SIZE))
+    window.alarm = 15
+
+    started = time.perf_counter()
+    for _ in range(ticks):
+        if window.engine.finished:
+            window.reset_game()
+        window.game_tick()
+    env.app.processEvents()
+    elapsed = time.perf_counter() - started
+
+    window.animations.clear()
+    env.close(window)
+    return elapsed / ticks
+
+
+@benchmark('engine_step', 'us/tick')
+def engine_step(env, ticks=200000):
+    engine = GameEngine(make_people(LARGE_SIZE), alarm=15, seed=0)
+
+    started = time.perf_counter()
+    engine.step(ticks)
+    return (time.perf_counter() - started) / ticks
+
+
+@benchmark('update_characters_display', 'ms')
+def update_characters_display(env, rounds=20):
+    window = env.window(make_people(BOARD_SIZE))
+
+    started = time.perf_counter()
+    for _ in range(rounds):
+        window.update_characters_display()
+        env.app.processEvents()
+    elapsed = time.perf_counter() - started
+
+    env.close(window)
+    return elapsed / rounds
+
+
+@benchmark('board_overview_paint', 'ms')
+def board_overview_paint(env, rounds=20):
+    """Отрисовка большого поля, уменьшенного до гистограммы и до столбиков"""
+    window = env.window(make_people(OVERVIEW_SIZE))
+    window.zoom_board('zoom_to_fit')
+    board = window.area_container
+    env.app.processEvents()
+
+    started = time.perf_counter()
+    for _ in range(rounds):
+        board.set_zoom(4 / board.base_pitch)
+        board.viewport().repaint()
+        board.zoom_to_fit()
+        board.viewport().repaint()
+    elapsed = time.perf_counter() - started
+
+    env.close(window)
+    return elapsed / (2 * rounds)
+
+
+@benchmark('fisher_update_color', 'us/op')
+def fisher_update_color(env, rounds=500):
+    fisher = Fisher()
+    fisher.show()
+    env.app.processEvents()
+
+    colors = ('#ff0000', '#0000ff')
+    started = time.perf_counter()
+    for i in range(rounds):
+        fisher.update_color(colors[i % 2])
+        env.app.processEvents()
+    elapsed = time.perf_counter() - started
+
+    fisher.close()
+    fisher.deleteLater()
+    return elapsed / rounds
+
+
+def dialog_open_accept(env, dialog_class):
+    people = make_people(DIALOG_SIZE)
+
+    started = time.perf_counter()
+    dialog = dialog_class(None, people=people)
+    dialog.show()
+    env.app.processEvents()
+    dialog.accept()
+    elapsed = time.perf_counter() - started
+
+    dialog.deleteLater()
+    env.app.processEvents()
+    return elapsed
+
+
+@benchmark('color_dialog_open_accept', 'ms')
+def color_dialog_open_accept(env):
+    from dialogs.color_dialog import ColorDialog
+
+    return dialog_open_accept(env, ColorDialog)
+
+
+@benchmark('initial_dialog_open_accept', 'ms')
+def initial_dialog_open_accept(env):
+    from dialogs.initial_dialog import InitialDialog
+
+    return dialog_open_accept(env, InitialDialog)
+
+
+def run(names, repeat):
+    env = Environment()
+    results = {}
+
+    try:
+        for name in names:
+            function, unit, scale, own_repeat = BENCHMARKS[name]
+
+            # Первый прогон прогревает импорты и кэши и в результат не входит
+            function(env)
+            samples = [function(env) * scale for _ in range(own_repeat or repeat)]
+
+            results[name] = {
+                'unit': unit,
+                'median': statistics.median(samples),
+                'min': min(samples),
+                'samples': samples,
+            }
+            print(f"{name:<28} {results[name]['median']:>12.3f} {unit}", flush=True)
+    finally:
+        env.cleanup()
+
+    return {
+        'meta': {
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'qt': QT_VERSION_STR,
+            'platform': platform.platform(),
+        },
+        'results': results,
+    }
+
+
+def compare(current, baseline, threshold):
+    """Печатает сравнение с базовым прогоном, возвращает имена замеров с регрессией"""
+    regressions = []
+
+    print()
+    print(f"{'benchmark':<28} {'baseline':>12} {'current':>12} {'change':>8}")
+
+    for name, result in current['results'].items():
+        base = baseline['results'].get(name)
+        if base is None or base['unit'] != result['unit']:
+            print(f"{name:<28} {'—':>12} {result['median']:>12.3f}")
+            continue
+
+        change = result['median'] / base['median'] - 1 if base['median'] else 0.0
+        mark = ''
+        if change > threshold:
+            regressions.append(name)
+            mark = '  РЕГРЕССИЯ'
+
+        print(f"{name:<28} {base['median']:>12.3f} {result['median']:>12.3f} {change:>+8.1%}{mark}")
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Замеры производительности без экрана")
+    parser.add_argument('--output', help="файл JSON для результатов")
+    parser.add_argument('--baseline', help="файл JSON базового прогона для сравнения")
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help="допустимое замедление относительно базы, доля (по умолчанию 0.2)")
+    parser.add_argument('--repeat', type=int, default=7, help="число повторов каждого замера")
+    parser.add_argument('--only', nargs='+', choices=sorted(BENCHMARKS), help="выполнить только эти замеры")
+    args = parser.parse_args()
+
+    # Замеры идут из корня репозитория, пути к файлам считаются от текущего каталога
+    output = args.output and os.path.abspath(args.output)
+    baseline_path = args.baseline and os.path.abspath(args.baseline)
+
+    current = run(args.only or list(BENCHMARKS), args.repeat)
+
+    if output:
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump(current, f, ensure_ascii=False, indent=2)
+
+    if baseline_path:
+        with open(baseline_path, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+
+        regressions = compare(current, baseline, args.threshold)
+        if regressions:
+            print(f"\nРегрессия больше {args.threshold:.0%}: {', '.join(regressions)}")
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
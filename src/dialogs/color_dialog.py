@@ -1,133 +1,291 @@
 import random
 
 from PyQt6.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QComboBox, 
-    QMessageBox, QPushButton
+    QDialog, QVBoxLayout, QHBoxLayout, QComboBox, QMessageBox, QPushButton,
+    QTableView, QHeaderView, QStyledItemDelegate, QAbstractItemView
 )
-from PyQt6.QtGui import QColor, QIcon, QPixmap, QPainter
-from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QColor, QIcon, QPixmap, QPainter, QStandardItemModel, QStandardItem
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QTimer, pyqtSignal
+
+PALETTE = [
+    ("#000000", "Чёрный"),
+    ("#800000", "Тёмно-красный"),
+    ("#008000", "Зелёный"),
+    ("#808000", "Оливковый"),
+    ("#000080", "Тёмно-синий"),
+    ("#800080", "Фиолетовый"),
+    ("#008080", "Бирюзовый"),
+    ("#c0c0c0", "Светло-серый"),
+    ("#808080", "Серый"),
+    ("#ff0000", "Красный"),
+    ("#00ff00", "Светло-зеленый"),
+    ("#ffff00", "Жёлтый"),
+    ("#0000ff", "Синий"),
+    ("#ff00ff", "Розовый"),
+    ("#00ffff", "Голубой"),
+    ("#ffffff", "Белый")
+]
+
+PALETTE_NAMES = dict(PALETTE)
+
+COLOR_ROLE = Qt.ItemDataRole.UserRole
+
+DIALOG_STYLE = """
+    QComboBox {
+        padding: 6.5px;
+        border: none;
+        border: 1px solid #cbd5e1;
+        border-radius: 4px;
+    }
+    QComboBox::drop-down {
+        border: none;
+        border-left: 1px solid #cbd5e1;
+    }
+    QComboBox::down-arrow {
+        image: url(src/resources/chevron-down.svg);
+        width: 16px;
+        height: 16px;
+    }
+    QComboBox QAbstractItemView {
+        background-color: white;
+        border: 1px solid #cbd5e1;
+        border-radius: 4px;
+        outline: none;
+        selection-color: #000000;
+    }
+    QComboBox QAbstractItemView::item {
+        padding: 5px 10px;
+        border-top: 1px solid #cbd5e1;
+    }
+    QComboBox QAbstractItemView::item:hover {
+        color: #000000;
+        background-color: #ede9fe;
+    }
+    QTableView {
+        border: 1px solid #cbd5e1;
+        border-radius: 4px;
+        gridline-color: #e2e8f0;
+    }
+"""
+
+# Иконки цветов и модель палитры общие для всего процесса
+_icons = {}
+_palette_model = None
+
+
+def color_icon(color_hex):
+    icon = _icons.get(color_hex)
+    if icon is not None:
+        return icon
+
+    pixmap = QPixmap(20, 20)
+    pixmap.fill(Qt.GlobalColor.transparent)
+
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+    painter.setBrush(QColor("#000000"))
+    painter.setPen(Qt.PenStyle.NoPen)
+    painter.drawRoundedRect(0, 0, 20, 20, 2, 2)
+    painter.setBrush(QColor(color_hex))
+    painter.drawRoundedRect(1, 1, 18, 18, 2, 2)
+
+    painter.end()
+
+    icon = _icons[color_hex] = QIcon(pixmap)
+    return icon
+
+
+def color_name(color_hex):
+    return PALETTE_NAMES.get(color_hex, color_hex)
+
+
+def palette_model():
+    """Общая модель палитры для всех выпадающих списков цветов"""
+    global _palette_model
+
+    if _palette_model is None:
+        _palette_model = QStandardItemModel()
+        for color_hex, name in PALETTE:
+            # Пробел перед названием дает отступ от иконки
+            item = QStandardItem(color_icon(color_hex), " " + name)
+            item.setData(color_hex, COLOR_ROLE)
+            _palette_model.appendRow(item)
+
+    return _palette_model
+
+
+class PeopleColorModel(QAbstractTableModel):
+    """Цвета рыбаков для редактирования с обратным индексом цвет → рыбаки"""
+
+    COLUMN_NAME = 0
+    COLUMN_COLOR = 1
+
+    color_rejected = pyqtSignal(str)
+
+    def __init__(self, people, parent=None):
+        super().__init__(parent)
+
+        self.people = people
+        self.colors = [person['color'] for person in people]
+
+        self.owners = {}
+        self.rebuild_owners()
+
+    def rebuild_owners(self):
+        self.owners.clear()
+        for row, color in enumerate(self.colors):
+            self.owners.setdefault(color, set()).add(row)
+
+    def is_used(self, color, row):
+        """Занят ли цвет кем-то, кроме рыбака в строке row"""
+        owners = self.owners.get(color)
+        return bool(owners) and (len(owners) > 1 or row not in owners)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.colors)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else 2
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return ("Рыбак", "Цвет")[section]
+        return None
+
+    def flags(self, index):
+        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        if index.column() == self.COLUMN_COLOR:
+            flags |= Qt.ItemFlag.ItemIsEditable
+        return flags
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        row = index.row()
+
+        if index.column() == self.COLUMN_NAME:
+            if role == Qt.ItemDataRole.DisplayRole:
+                return f"Рыбак {self.people[row]['id'] + 1}"
+            return None
+
+        color = self.colors[row]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return " " + color_name(color)
+        if role == Qt.ItemDataRole.DecorationRole:
+            return color_icon(color)
+        if role == COLOR_ROLE:
+            return color
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if not index.isValid() or index.column() != self.COLUMN_COLOR:
+            return False
+
+        row = index.row()
+        old_color = self.colors[row]
+        if value == old_color:
+            return True
+
+        if self.is_used(value, row):
+            self.color_rejected.emit(value)
+            return False
+
+        self.set_color(row, value)
+        self.dataChanged.emit(index, index)
+        return True
+
+    def set_color(self, row, color):
+        old_owners = self.owners[self.colors[row]]
+        old_owners.discard(row)
+        if not old_owners:
+            del self.owners[self.colors[row]]
+
+        self.colors[row] = color
+        self.owners.setdefault(color, set()).add(row)
+
+    def set_colors(self, colors):
+        self.beginResetModel()
+        self.colors = list(colors)
+        self.rebuild_owners()
+        self.endResetModel()
+
+    def get_updated_people(self):
+        updated_people = []
+        for person, color in zip(self.people, self.colors):
+            updated_person = person.copy()
+            updated_person['color'] = color
+            updated_people.append(updated_person)
+        return updated_people
+
+
+class ColorDelegate(QStyledItemDelegate):
+    """Выпадающий список палитры создается только для редактируемой строки"""
+
+    def createEditor(self, parent, option, index):
+        combo = QComboBox(parent)
+        combo.setModel(palette_model())
+        combo.activated.connect(lambda _, cb=combo: self.commit(cb))
+
+        # Список открывается сразу, без второго щелчка
+        QTimer.singleShot(0, combo.showPopup)
+        return combo
+
+    def commit(self, combo):
+        self.commitData.emit(combo)
+        self.closeEditor.emit(combo)
+
+    def setEditorData(self, editor, index):
+        editor.setCurrentIndex(editor.findData(index.data(COLOR_ROLE), COLOR_ROLE))
+
+    def setModelData(self, editor, model, index):
+        color = editor.currentData(COLOR_ROLE)
+        if color is not None:
+            model.setData(index, color)
 
-class ColorDialog(QDialog):
-    __colors = [
-        ("#000000", "Чёрный"),
-        ("#800000", "Тёмно-красный"),
-        ("#008000", "Зелёный"),
-        ("#808000", "Оливковый"),
-        ("#000080", "Тёмно-синий"),
-        ("#800080", "Фиолетовый"),
-        ("#008080", "Бирюзовый"),
-        ("#c0c0c0", "Светло-серый"),
-        ("#808080", "Серый"),
-        ("#ff0000", "Красный"),
-        ("#00ff00", "Светло-зеленый"),
-        ("#ffff00", "Жёлтый"),
-        ("#0000ff", "Синий"),
-        ("#ff00ff", "Розовый"),
-        ("#00ffff", "Голубой"),
-        ("#ffffff", "Белый")
-    ]
 
+class ColorDialog(QDialog):
     def __init__(self, parent=None, people=[]):
         super().__init__(parent)
 
         self.people = people
         self.updated_people = []
-        self.comboboxes = []
-        self.current_colors = {}
-        self.initial_colors = {}
 
         self.setWindowTitle("Выбор цвета")
         self.setFixedSize(640, 480)
+        self.setStyleSheet(DIALOG_STYLE)
 
         self.main_layout = QVBoxLayout(self)
         self.main_layout.addSpacing(0)
         self.main_layout.setContentsMargins(8, 8, 8, 2)
 
-        self.init_ui()
-
-    def create_color_icon(self, color_hex):
-        pixmap = QPixmap(20, 20)
-        pixmap.fill(Qt.GlobalColor.transparent)
-        
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-
-        painter.setBrush(QColor("#000000"))
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.drawRoundedRect(0, 0, 20, 20, 2, 2)
-        painter.setBrush(QColor(color_hex))
-        painter.drawRoundedRect(1, 1, 18, 18, 2, 2)
-
-        painter.end()
+        self.model = PeopleColorModel(people, self)
+        self.model.color_rejected.connect(self.on_color_rejected)
 
-        return QIcon(pixmap)
+        self.init_ui()
 
     def init_ui(self):
-        for person in self.people:
-            self.current_colors[person['id']] = person['color']
-            self.initial_colors[person['id']] = person['color']
-
-        for i, person in enumerate(self.people):
-            h_layout = QHBoxLayout()
-
-            label = QLabel(f"Рыбак {person['id'] + 1}:")
-            label.setFixedWidth(100)
-            combo = QComboBox()
-
-            combo.setStyleSheet("""
-                QComboBox {
-                    padding: 6.5px;
-                    border: none;
-                    border: 1px solid #cbd5e1;
-                    border-radius: 4px;
-                }
-                QComboBox::drop-down {
-                    border: none;
-                    border-left: 1px solid #cbd5e1;
-                }
-                QComboBox::down-arrow {
-                    image: url(src/resources/chevron-down.svg);
-                    width: 16px;
-                    height: 16px;
-                }
-                QComboBox QAbstractItemView {
-                    background-color: white;
-                    border: 1px solid #cbd5e1;
-                    border-radius: 4px;
-                    outline: none;
-                    selection-color: #000000;
-                }
-                QComboBox QAbstractItemView::item {
-                    padding: 5px 10px;
-                    border-top: 1px solid #cbd5e1;
-                }
-                QComboBox QAbstractItemView::item:hover {
-                    color: #000000;
-                    background-color: #ede9fe;
-                }
-            """)
-
-            combo.blockSignals(True)
-
-            # Заполняем комбобокс цветами с иконками
-            for color_hex, color_name in self.__colors:
-                icon = self.create_color_icon(color_hex)
-                combo.addItem(icon, " " + color_name, color_hex)  # Добавляем пробел для отступа
-
-            current_index = combo.findData(person['color'])
-            combo.setCurrentIndex(current_index)
-
-            combo.blockSignals(False)
-
-            combo.currentIndexChanged.connect(
-                lambda index, cb=combo, pid=person['id']: self.on_color_changed(cb, pid)
-            )
-
-            h_layout.addWidget(label)
-            h_layout.addWidget(combo)
-
-            self.main_layout.addLayout(h_layout)
-            self.comboboxes.append(combo)
+        self.view = QTableView()
+        self.view.setModel(self.model)
+        self.view.setItemDelegateForColumn(PeopleColorModel.COLUMN_COLOR, ColorDelegate(self.view))
+        self.view.setEditTriggers(
+            QAbstractItemView.EditTrigger.SelectedClicked
+            | QAbstractItemView.EditTrigger.DoubleClicked
+            | QAbstractItemView.EditTrigger.EditKeyPressed
+        )
+        self.view.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.view.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.view.verticalHeader().setVisible(False)
+
+        # Одинаковая высота строк позволяет не измерять каждую строку
+        self.view.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.view.verticalHeader().setDefaultSectionSize(36)
+        self.view.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Fixed)
+        self.view.horizontalHeader().resizeSection(0, 100)
+        self.view.horizontalHeader().setStretchLastSection(True)
+
+        self.main_layout.addWidget(self.view)
 
         h_layout = QHBoxLayout()
 
@@ -146,83 +304,32 @@ class ColorDialog(QDialog):
 
         self.main_layout.addLayout(h_layout)
 
-    def on_color_changed(self, combo, person_id):
-        new_color = combo.currentData()
-
-        is_used = False
-
-        for i, other_combo in enumerate(self.comboboxes):
-            if other_combo != combo and other_combo.currentData() == new_color:
-                is_used = True
-                break
-
-        if is_used:
-            combo.blockSignals(True)
+    def on_color_rejected(self, color):
+        QMessageBox.warning(
+            self,
+            "Цвет уже используется",
+            f"Цвет {self.get_color_name(color)} уже занят."
+        )
 
-            previous_color = self.current_colors[person_id]
-            previous_index = combo.findData(previous_color)
+    def get_color_name(self, color_hex):
+        return color_name(color_hex)
 
-            combo.setCurrentIndex(previous_index)
-            combo.blockSignals(False)
+    def randomize_colors(self):
+        count = len(self.model.colors)
 
-            QMessageBox.warning(
-                self,
-                "Цвет уже используется",
-                f"Цвет {self.get_color_name(new_color)} уже занят."
-            )
-        else:
-            self.current_colors[person_id] = new_color
+        if count <= len(PALETTE):
+            available_colors = [color[0] for color in PALETTE]
+            random.shuffle(available_colors)
+            self.model.set_colors(available_colors[:count])
+            return
 
-    def get_color_name(self, color_hex):
-        for hex_val, name in self.__colors:
-            if hex_val == color_hex:
-                return name
-        return color_hex
+        # Палитры не хватает: различимые цвета подбираются в пространстве OKLab
+        from game.colors import ColorAllocator
 
-    def randomize_colors(self):
-        available_colors = [color[0] for color in self.__colors]        
-        random.shuffle(available_colors)
-        selected_colors = available_colors[:len(self.comboboxes)]
-
-        for combo in self.comboboxes:
-            combo.blockSignals(True)
-
-        for i, combo in enumerate(self.comboboxes):
-            color_hex = selected_colors[i]
-            color_index = combo.findData(color_hex)
-            if color_index >= 0:
-                combo.setCurrentIndex(color_index)
-                person_id = self.people[i]['id']
-                self.current_colors[person_id] = color_hex
-
-        for combo in self.comboboxes:
-            combo.blockSignals(False)
-
-    def reset_to_initial(self):
-        for combo in self.comboboxes:
-            combo.blockSignals(True)
-        
-        for i, person in enumerate(self.people):
-            initial_color = self.initial_colors[person['id']]
-            initial_index = self.comboboxes[i].findData(initial_color)
-            if initial_index >= 0:
-                self.comboboxes[i].setCurrentIndex(initial_index)
-                self.current_colors[person['id']] = initial_color
-
-        for combo in self.comboboxes:
-            combo.blockSignals(False)
-
-    def reject(self):
-        self.reset_to_initial()
-        super().reject()
+        self.model.set_colors(ColorAllocator().allocate(count))
 
     def get_updated_people(self):
-        updated_people = []
-        for i, person in enumerate(self.people):
-            updated_person = person.copy()
-            updated_person['color'] = self.comboboxes[i].currentData()
-            updated_people.append(updated_person)
-        return updated_people
+        return self.model.get_updated_people()
 
     def accept(self):
         self.updated_people = self.get_updated_people()
@@ -0,0 +1,67 @@
+from PyQt6.QtCore import Qt, QThread, QTimer, pyqtSignal
+from PyQt6.QtWidgets import QProgressDialog
+
+from game.scenario import ConversionCancelled
+
+class ConvertWorker(QThread):
+    """Выполняет преобразование файла сценария вне потока интерфейса"""
+
+    progress = pyqtSignal(int)
+    failed = pyqtSignal(str)
+
+    def __init__(self, convert, source, target, parent=None):
+        super().__init__(parent)
+
+        self.convert = convert
+        self.source = source
+        self.target = target
+        self.succeeded = False
+
+    def run(self):
+        try:
+            self.convert(self.source, self.target, self.report)
+            self.succeeded = True
+        except ConversionCancelled:
+            pass
+        except (OSError, ValueError, KeyError, TypeError) as error:
+            self.failed.emit(str(error))
+
+    def report(self, done, total):
+        if self.isInterruptionRequested():
+            raise ConversionCancelled()
+        self.progress.emit(int(done * 100 / total) if total else 100)
+
+
+class ConvertDialog(QProgressDialog):
+    """Окно с ходом преобразования и кнопкой отмены"""
+
+    def __init__(self, parent, title, convert, source, target):
+        super().__init__(title, "Отмена", 0, 100, parent)
+
+        self.error = None
+
+        self.setWindowTitle(title)
+        self.setWindowModality(Qt.WindowModality.WindowModal)
+        self.setMinimumDuration(0)
+        self.setAutoClose(False)
+        self.setAutoReset(False)
+
+        self.worker = ConvertWorker(convert, source, target, self)
+        self.worker.progress.connect(self.setValue)
+        self.worker.failed.connect(self.on_failed)
+        self.worker.finished.connect(self.on_finished)
+        self.canceled.connect(self.worker.requestInterruption)
+
+    def run(self):
+        """Запускает преобразование и ждет его завершения, возвращает успех"""
+        # Поток запускается из цикла событий окна, чтобы сигнал завершения не опередил exec
+        QTimer.singleShot(0, self.worker.start)
+        self.exec()
+        self.worker.wait()
+        return self.worker.succeeded
+
+    def on_failed(self, message):
+        self.error = message
+
+    def on_finished(self):
+        self.done(0)
@@ -1,7 +1,138 @@
 from PyQt6.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QSpinBox, QPushButton
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QSpinBox, QDoubleSpinBox, QPushButton,
+    QComboBox, QTableView, QHeaderView, QStyledItemDelegate, QAbstractItemView,
+    QApplication, QMessageBox
 )
-from PyQt6.QtGui import QIntValidator
+from PyQt6.QtGui import QKeySequence, QShortcut
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+MIN_COUNT = 0
+MAX_COUNT = 9
+
+DISTRIBUTION_UNIFORM = 0
+DISTRIBUTION_NORMAL = 1
+
+
+class InitialCountsModel(QAbstractTableModel):
+    """Начальные счетчики рыбаков одним массивом байтов.
+
+    Массовые операции заменяют массив целиком и сбрасывают модель, поэтому
+    их стоимость не зависит от числа строк, видимых в таблице."""
+
+    COLUMN_NAME = 0
+    COLUMN_COUNT = 1
+
+    def __init__(self, people, parent=None):
+        super().__init__(parent)
+
+        self.people = people
+        # Как и прежние поля ввода, значения вне диапазона приводятся к его границам
+        self.original_counts = bytes(
+            min(max(person['count'], MIN_COUNT), MAX_COUNT) for person in people
+        )
+        self.counts = bytearray(self.original_counts)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.counts)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else 2
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return ("Рыбак", "Улов")[section]
+        return None
+
+    def flags(self, index):
+        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        if index.column() == self.COLUMN_COUNT:
+            flags |= Qt.ItemFlag.ItemIsEditable
+        return flags
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        row = index.row()
+
+        if index.column() == self.COLUMN_NAME:
+            if role == Qt.ItemDataRole.DisplayRole:
+                return f"Рыбак {self.people[row]['id'] + 1}:"
+            return None
+
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return self.counts[row]
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if not index.isValid() or index.column() != self.COLUMN_COUNT:
+            return False
+
+        value = int(value)
+        if not MIN_COUNT <= value <= MAX_COUNT:
+            return False
+
+        self.counts[index.row()] = value
+        self.dataChanged.emit(index, index)
+        return True
+
+    def set_counts(self, counts, start=0):
+        """Заменяет счетчики, начиная со строки start, одним присваиванием среза"""
+        self.beginResetModel()
+        self.counts[start:start + len(counts)] = counts
+        self.endResetModel()
+
+    def fill(self, value):
+        self.set_counts(bytes([value]) * len(self.counts))
+
+    def fill_random(self, distribution, first, second, seed):
+        """Случайное заполнение: равномерно на [first, second] или нормально
+        со средним first и отклонением second, с округлением в допустимый диапазон"""
+        import numpy as np
+
+        rng = np.random.default_rng(seed)
+        size = len(self.counts)
+
+        if distribution == DISTRIBUTION_NORMAL:
+            values = np.rint(rng.normal(first, second, size))
+        else:
+            low, high = sorted((round(first), round(second)))
+            values = rng.integers(low, high, size, endpoint=True)
+
+        values = np.clip(values, MIN_COUNT, MAX_COUNT).astype(np.uint8)
+        self.set_counts(values.tobytes())
+
+    def paste(self, text, start=0):
+        """Вставляет столбец чисел из текста, начиная со строки start.
+        Возвращает число вставленных значений"""
+        values = [int(value) for value in text.split()[:len(self.counts) - start]]
+
+        if any(not MIN_COUNT <= value <= MAX_COUNT for value in values):
+            raise ValueError(f"Значения должны быть в диапазоне от {MIN_COUNT} до {MAX_COUNT}.")
+
+        self.set_counts(bytes(values), start)
+        return len(values)
+
+    def revert(self):
+        self.set_counts(self.original_counts)
+
+    def get_updated_people(self):
+        updated_people = []
+        for person, count in zip(self.people, self.counts):
+            updated_person = person.copy()
+            updated_person['count'] = count
+            updated_people.append(updated_person)
+        return updated_people
+
+
+class CountDelegate(QStyledItemDelegate):
+    """Поле ввода создается только для редактируемой строки"""
+
+    def createEditor(self, parent, option, index):
+        spinbox = QSpinBox(parent)
+        spinbox.setRange(MIN_COUNT, MAX_COUNT)
+        return spinbox
+
 
 class InitialDialog(QDialog):
     def __init__(self, parent=None, people=[]):
@@ -9,7 +140,6 @@ class InitialDialog(QDialog):
 
         self.people = people
         self.original_people = people
-        self.spinboxes = []
 
         self.setWindowTitle("Начальное заполнение")
         self.setFixedSize(640, 480)
@@ -18,35 +148,31 @@ class InitialDialog(QDialog):
         self.main_layout.addSpacing(0)
         self.main_layout.setContentsMargins(8, 8, 8, 2)
 
+        self.model = InitialCountsModel(people, self)
+
         self.init_ui()
 
     def init_ui(self):
-        for i, person in enumerate(self.people):
-            h_layout = QHBoxLayout()
-
-            label = QLabel(f"Рыбак {person['id'] + 1}:")
-            label.setFixedWidth(100)
-            spinbox = QSpinBox()
-
-            spinbox.setRange(0, 9)
-            spinbox.setValue(person["count"])
-            spinbox.person_id = person["id"]
-            
-            validator = QIntValidator(0, 9, self)
-            spinbox.lineEdit().setValidator(validator)
-            
-            spinbox.lineEdit().textChanged.connect(
-                lambda text, sb=spinbox: self.prevent_leading_zeros(sb, text)
-            )
-            spinbox.editingFinished.connect(
-                lambda sb=spinbox: self.final_validation(sb)
-            )
+        self.view = QTableView()
+        self.view.setModel(self.model)
+        self.view.setItemDelegateForColumn(InitialCountsModel.COLUMN_COUNT, CountDelegate(self.view))
+        self.view.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.view.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.view.verticalHeader().setVisible(False)
+
+        # Одинаковая высота строк позволяет не измерять каждую строку
+        self.view.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.view.verticalHeader().setDefaultSectionSize(32)
+        self.view.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Fixed)
+        self.view.horizontalHeader().resizeSection(0, 100)
+        self.view.horizontalHeader().setStretchLastSection(True)
 
-            h_layout.addWidget(label)
-            h_layout.addWidget(spinbox)
+        self.main_layout.addWidget(self.view)
 
-            self.main_layout.addLayout(h_layout)
-            self.spinboxes.append(spinbox)
+        QShortcut(QKeySequence.StandardKey.Paste, self.view, activated=self.paste_column)
+
+        self.init_fill_controls()
+        self.init_random_controls()
 
         h_layout = QHBoxLayout()
 
@@ -65,24 +191,99 @@ class InitialDialog(QDialog):
 
         self.main_layout.addLayout(h_layout)
 
-    def prevent_leading_zeros(self, spinbox, text):
-        if text and len(text) > 1 and text.startswith('0'):
-            clean_text = text.lstrip('0') or '0'
-            spinbox.lineEdit().setText(clean_text)
-
-    def final_validation(self, spinbox):
-        text = spinbox.lineEdit().text()
-        if text and text.startswith('0') and len(text) > 1:
-            clean_text = text.lstrip('0') or '0'
-            try:
-                value = int(clean_text)
-                spinbox.setValue(min(max(value, spinbox.minimum()), spinbox.maximum()))
-            except ValueError:
-                spinbox.setValue(0)
+    def init_fill_controls(self):
+        h_layout = QHBoxLayout()
+
+        self.fill_value = QSpinBox()
+        self.fill_value.setRange(MIN_COUNT, MAX_COUNT)
+
+        fill_button = QPushButton("Заполнить все")
+        fill_button.clicked.connect(lambda: self.model.fill(self.fill_value.value()))
+
+        paste_button = QPushButton("Вставить столбец")
+        paste_button.clicked.connect(self.paste_column)
+
+        h_layout.addWidget(QLabel("Значение:"))
+        h_layout.addWidget(self.fill_value)
+        h_layout.addWidget(fill_button)
+        h_layout.addStretch()
+        h_layout.addWidget(paste_button)
+
+        self.main_layout.addLayout(h_layout)
+
+    def init_random_controls(self):
+        h_layout = QHBoxLayout()
+
+        self.distribution = QComboBox()
+        self.distribution.addItem("Равномерно", DISTRIBUTION_UNIFORM)
+        self.distribution.addItem("Нормально", DISTRIBUTION_NORMAL)
+        self.distribution.currentIndexChanged.connect(self.on_distribution_changed)
+
+        self.first_label = QLabel()
+        self.first_value = QDoubleSpinBox()
+        self.first_value.setRange(MIN_COUNT, MAX_COUNT)
+        self.first_value.setDecimals(1)
+
+        self.second_label = QLabel()
+        self.second_value = QDoubleSpinBox()
+        self.second_value.setRange(MIN_COUNT, MAX_COUNT)
+        self.second_value.setDecimals(1)
+
+        self.seed = QSpinBox()
+        self.seed.setRange(0, 2 ** 31 - 1)
+
+        random_button = QPushButton("Случайно")
+        random_button.clicked.connect(self.fill_random)
+
+        h_layout.addWidget(self.distribution)
+        h_layout.addWidget(self.first_label)
+        h_layout.addWidget(self.first_value)
+        h_layout.addWidget(self.second_label)
+        h_layout.addWidget(self.second_value)
+        h_layout.addWidget(QLabel("Зерно:"))
+        h_layout.addWidget(self.seed)
+        h_layout.addWidget(random_button)
+
+        self.main_layout.addLayout(h_layout)
+
+        self.on_distribution_changed()
+
+    def on_distribution_changed(self):
+        if self.distribution.currentData() == DISTRIBUTION_NORMAL:
+            self.first_label.setText("Среднее:")
+            self.second_label.setText("Откл.:")
+            self.first_value.setValue(4.5)
+            self.second_value.setValue(2.0)
+        else:
+            self.first_label.setText("От:")
+            self.second_label.setText("До:")
+            self.first_value.setValue(MIN_COUNT)
+            self.second_value.setValue(MAX_COUNT)
+
+    def fill_random(self):
+        self.model.fill_random(
+            self.distribution.currentData(),
+            self.first_value.value(),
+            self.second_value.value(),
+            self.seed.value()
+        )
+
+    def paste_column(self):
+        current = self.view.currentIndex()
+        start = current.row() if current.isValid() else 0
+
+        try:
+            self.model.paste(QApplication.clipboard().text(), start)
+        except ValueError:
+            QMessageBox.warning(
+                self,
+                "Ошибка вставки",
+                f"Вставлять можно только числа от {MIN_COUNT} до {MAX_COUNT}, "
+                "по одному в строке."
+            )
 
     def clear_all(self):
-        for spinbox in self.spinboxes:
-            spinbox.setValue(0)
+        self.model.fill(0)
 
     def accept(self):
         self.update_people_data()
@@ -93,19 +294,10 @@ class InitialDialog(QDialog):
         super().reject()
 
     def update_people_data(self):
-        for spinbox in self.spinboxes:
-            for person in self.people:
-                if person["id"] == spinbox.person_id:
-                    person["count"] = spinbox.value()
-                    break
+        self.people = self.model.get_updated_people()
 
     def restore_original_values(self):
-        for spinbox in self.spinboxes:
-            for person in self.original_people:
-                if person["id"] == spinbox.person_id:
-                    spinbox.setValue(person["count"])
-                    break
-        
+        self.model.revert()
         self.people = self.original_people
 
     def get_updated_people(self):
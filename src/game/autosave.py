@@ -0,0 +1,289 @@
+import os
+import json
+import time
+import queue
+import threading
+
+from game.engine import GameEngine, EVENT_CATCH, EVENT_ALARM
+from game.event_log import RECORD
+
+AUTOSAVE_VERSION = 1
+
+SNAPSHOT_FILE = 'snapshot.json'
+JOURNAL_FILE = 'journal.bin'
+
+# Запись журнала о смене вероятности аварии: в поле индекса новое значение
+JOURNAL_ALARM = 3
+
+
+def fsync_directory(path):
+    """Закрепляет на диске переименование внутри каталога (где это поддерживается)"""
+    if not hasattr(os, 'O_DIRECTORY'):
+        return
+    fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def write_json_atomic(path, data, indent=None):
+    """Записывает JSON так, что при сбое на диске остается либо старый, либо новый файл"""
+    temp_path = path + '.tmp'
+
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=indent)
+        f.flush()
+        os.fsync(f.fileno())
+
+    os.replace(temp_path, path)
+    fsync_directory(os.path.dirname(path) or '.')
+
+
+class Autosave:
+    """Автосохранение идущей игры.
+
+    Ходы копятся в буфере на потоке интерфейса и через очередь передаются
+    фоновому потоку, который дописывает их в журнал. Время от времени поток
+    получает полное состояние игры, атомарно заменяет им снимок
+    (временный файл, fsync, rename) и начинает журнал заново.
+    Игра восстанавливается из снимка и доигрыванием журнала."""
+
+    SNAPSHOT_INTERVAL = 10.0
+
+    def __init__(self, path, snapshot_interval=None):
+        self.path = path
+        self.snapshot_interval = snapshot_interval or self.SNAPSHOT_INTERVAL
+
+        self.engine = None
+        self.alarm = None
+        self.buffer = bytearray()
+        self.pack = RECORD.pack
+        self.last_snapshot = 0.0
+
+        self.queue = queue.Queue()
+        self.thread = None
+        self.error = None
+
+    # Поток интерфейса
+
+    def start(self, engine):
+        """Начинает сохранять игру engine и сразу пишет ее снимок"""
+        if self.thread is None:
+            self.thread = threading.Thread(target=self.run, name="autosave", daemon=True)
+            self.thread.start()
+
+        if self.engine is not engine:
+            self.detach()
+            self.engine = engine
+            engine.recorders.append(self)
+
+        self.snapshot()
+
+    def detach(self):
+        if self.engine is not None and self in self.engine.recorders:
+            self.engine.recorders.remove(self)
+        self.engine = None
+        self.buffer.clear()
+
+    def record(self, tick, event, index):
+        alarm = self.engine.alarm
+        if alarm != self.alarm:
+            self.alarm = alarm
+            self.buffer += self.pack(tick - 1, JOURNAL_ALARM, alarm)
+
+        self.buffer += self.pack(tick, event, index)
+
+    def flush(self):
+        """Передает накопленные ходы потоку записи; снимок — раз в snapshot_interval секунд"""
+        if self.engine is None:
+            return
+
+        if time.monotonic() - self.last_snapshot >= self.snapshot_interval:
+            self.snapshot()
+        elif self.buffer:
+            self.queue.put(('journal', bytes(self.buffer)))
+            self.buffer.clear()
+
+    def snapshot(self):
+        engine = self.engine
+        if engine is None:
+            return
+
+        if self.buffer:
+            self.queue.put(('journal', bytes(self.buffer)))
+            self.buffer.clear()
+
+        self.alarm = engine.alarm
+        self.last_snapshot = time.monotonic()
+
+        data = {
+            'version': AUTOSAVE_VERSION,
+            'speed': engine.speed,
+            'alarm': engine.alarm,
+            'colors': list(engine.colors),
+            'initial_counts': list(engine.initial_counts),
+            'weights': list(engine.weights) if engine.weights is not None else None,
+            'state': engine.get_state(),
+        }
+        self.queue.put(('snapshot', data))
+
+    def clear(self):
+        """Игра закончена или сброшена: сохранять больше нечего"""
+        self.detach()
+        if self.thread is not None:
+            self.queue.put(('clear', None))
+        else:
+            self.remove_files()
+
+    def close(self):
+        """Дописывает очередь и останавливает поток (снимок не делается)"""
+        if self.engine is not None and self.buffer:
+            self.queue.put(('journal', bytes(self.buffer)))
+            self.buffer.clear()
+
+        if self.thread is not None:
+            self.queue.put(None)
+            self.thread.join()
+            self.thread = None
+
+    # Поток записи
+
+    def run(self):
+        while True:
+            item = self.queue.get()
+            if item is None:
+                return
+
+            kind, payload = item
+            try:
+                if kind == 'journal':
+                    self.append_journal(payload)
+                elif kind == 'snapshot':
+                    self.write_snapshot(payload)
+                elif kind == 'clear':
+                    self.remove_files()
+            except Exception as error:
+                # Ошибка записи не должна останавливать ни игру, ни поток записи
+                self.error = error
+
+    def append_journal(self, data):
+        os.makedirs(self.path, exist_ok=True)
+        with open(os.path.join(self.path, JOURNAL_FILE), 'ab') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def write_snapshot(self, data):
+        os.makedirs(self.path, exist_ok=True)
+
+        write_json_atomic(os.path.join(self.path, SNAPSHOT_FILE), data)
+
+        # Ходы до снимка больше не нужны
+        with open(os.path.join(self.path, JOURNAL_FILE), 'wb') as f:
+            os.fsync(f.fileno())
+
+    def remove_files(self):
+        for name in (SNAPSHOT_FILE, SNAPSHOT_FILE + '.tmp', JOURNAL_FILE):
+            try:
+                os.remove(os.path.join(self.path, name))
+            except FileNotFoundError:
+                pass
+
+    # Восстановление
+
+    def has_saved_game(self):
+        return os.path.exists(os.path.join(self.path, SNAPSHOT_FILE))
+
+    def restore(self, engine=None):
+        """Восстанавливает игру из снимка и журнала. Возвращает движок
+        или None, если сохранения нет или оно повреждено"""
+        try:
+            with open(os.path.join(self.path, SNAPSHOT_FILE), 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(data, dict) or data.get('version') != AUTOSAVE_VERSION:
+            return None
+
+        engine = engine or GameEngine()
+        try:
+            self.load_snapshot(engine, data)
+        except (KeyError, TypeError, ValueError, IndexError):
+            return None
+
+        self.replay_journal(engine)
+        return engine
+
+    @staticmethod
+    def load_snapshot(engine, data):
+        people = [
+            {'count': count, 'color': color}
+            for count, color in zip(data['initial_counts'], data['colors'])
+        ]
+        if data['weights'] is not None:
+            for person, weight in zip(people, data['weights']):
+                person['weight'] = weight
+
+        engine.speed = data['speed']
+        engine.alarm = data['alarm']
+        engine.set_people(people)
+        engine.set_state(data['state'])
+
+    def replay_journal(self, engine):
+        """Доигрывает ходы журнала, записанные после снимка.
+
+        Пока ходы движка совпадают с журналом, генератор случайных чисел остается
+        точно в записанном состоянии; при расхождении счетчики берутся из журнала."""
+        try:
+            with open(os.path.join(self.path, JOURNAL_FILE), 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            return
+
+        # Недописанная при сбое последняя запись отбрасывается
+        data = data[:len(data) - len(data) % RECORD.size]
+
+        in_sync = True
+        for tick, event, index in RECORD.iter_unpack(data):
+            if event == JOURNAL_ALARM:
+                if tick >= engine.ticks:
+                    engine.alarm = index
+                continue
+
+            if tick <= engine.ticks:
+                continue
+
+            if in_sync and tick == engine.ticks + 1:
+                played = engine.tick()
+                if played == (event, index):
+                    continue
+
+                in_sync = False
+                undo_event(engine, *played)
+
+            apply_event(engine, tick, event, index)
+
+
+def apply_event(engine, tick, event, index):
+    """Применяет записанный ход к движку без генератора случайных чисел"""
+    engine.ticks = tick
+    if event == EVENT_CATCH:
+        engine.catches += 1
+        engine.change_count(index, 1)
+    else:
+        engine.alarms += 1
+        if index >= 0:
+            engine.change_count(index, -1)
+
+
+def undo_event(engine, event, index):
+    engine.ticks -= 1
+    if event == EVENT_CATCH:
+        engine.catches -= 1
+        engine.change_count(index, -1)
+    elif event == EVENT_ALARM:
+        engine.alarms -= 1
+        if index >= 0:
+            engine.change_count(index, 1)
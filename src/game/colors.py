@@ -0,0 +1,174 @@
+import numpy as np
+
+# Границы области OKLab, из которой берутся цвета рыбаков: слишком темные
+# и слишком светлые цвета плохо различаются на фоне поля
+LIGHTNESS_RANGE = (0.35, 0.85)
+CHROMA_LIMIT = 0.25
+
+# До этого числа цветов выбор идет жадно, по самой удаленной точке;
+# дальше используется сама низкодисперсная последовательность
+GREEDY_LIMIT = 512
+CANDIDATES_PER_COLOR = 6
+MIN_CANDIDATES = 4096
+
+# Шаги последовательности R3 (Робертс): обратные степени корня x^4 = x + 1
+_PHI3 = 1.2207440846057596
+R3_STEPS = np.array([1 / _PHI3, 1 / _PHI3 ** 2, 1 / _PHI3 ** 3])
+
+OKLAB_TO_LMS = np.array([
+    [1.0, 0.3963377774, 0.2158037573],
+    [1.0, -0.1055613458, -0.0638541728],
+    [1.0, -0.0894841775, -1.2914855480],
+])
+LMS_TO_LINEAR_RGB = np.array([
+    [4.0767416621, -3.3077115913, 0.2309699292],
+    [-1.2684380046, 2.6097574011, -0.3413193965],
+    [-0.0041960863, -0.7034186147, 1.7076147010],
+])
+LINEAR_RGB_TO_LMS = np.array([
+    [0.4122214708, 0.5363325363, 0.0514459929],
+    [0.2119034982, 0.6806995451, 0.1073969566],
+    [0.0883024619, 0.2817188376, 0.6299787005],
+])
+LMS_TO_OKLAB = np.array([
+    [0.2104542553, 0.7936177850, -0.0040720468],
+    [1.9779984951, -2.4285922050, 0.4505937099],
+    [0.0259040371, 0.7827717662, -0.8086757660],
+])
+
+
+def oklab_to_linear_rgb(lab):
+    lms = (lab @ OKLAB_TO_LMS.T) ** 3
+    return lms @ LMS_TO_LINEAR_RGB.T
+
+
+def linear_to_srgb(rgb):
+    return np.where(rgb <= 0.0031308, 12.92 * rgb, 1.055 * np.abs(rgb) ** (1 / 2.4) - 0.055)
+
+
+def srgb_to_linear(rgb):
+    return np.where(rgb <= 0.04045, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+
+
+def hex_to_rgb(colors):
+    """Строки '#rrggbb' в массив (n, 3) байтов"""
+    data = bytes.fromhex(''.join(color[1:] for color in colors))
+    return np.frombuffer(data, dtype=np.uint8).reshape(-1, 3)
+
+
+def rgb_to_hex(rgb):
+    digits = np.ascontiguousarray(rgb, dtype=np.uint8).tobytes().hex()
+    return ['#' + digits[i:i + 6] for i in range(0, len(digits), 6)]
+
+
+def rgb_keys(rgb):
+    """Цвет как одно целое 0xrrggbb для сравнения массивами"""
+    rgb = rgb.astype(np.int32)
+    return (rgb[:, 0] << 16) | (rgb[:, 1] << 8) | rgb[:, 2]
+
+
+def rgb_to_oklab(rgb):
+    linear = srgb_to_linear(np.asarray(rgb, dtype=np.float64) / 255)
+    lms = np.cbrt(linear @ LINEAR_RGB_TO_LMS.T)
+    return lms @ LMS_TO_OKLAB.T
+
+
+def candidates(count, offset):
+    """Цвета области OKLab по последовательности R3, попавшие в охват sRGB.
+
+    Возвращает пару: байты RGB (n, 3) и координаты OKLab (n, 3)."""
+    low, high = LIGHTNESS_RANGE
+    span = np.array([high - low, 2 * CHROMA_LIMIT, 2 * CHROMA_LIMIT])
+    start = np.array([low, -CHROMA_LIMIT, -CHROMA_LIMIT])
+
+    steps = np.arange(1, count + 1, dtype=np.float64)[:, None]
+    lab = start + span * ((offset + steps * R3_STEPS) % 1.0)
+
+    linear = oklab_to_linear_rgb(lab)
+    in_gamut = np.all((linear >= 0) & (linear <= 1), axis=1)
+
+    rgb = np.round(linear_to_srgb(linear[in_gamut]) * 255).astype(np.uint8)
+    return rgb, lab[in_gamut]
+
+
+class ColorAllocator:
+    """Выдача попарно различимых цветов с учетом уже занятых.
+
+    Занятые цвета хранятся множеством строк '#rrggbb', поэтому проверка
+    конфликта — поиск в множестве, а новые цвета выбираются так, чтобы
+    быть дальше всего друг от друга и от занятых в пространстве OKLab."""
+
+    def __init__(self, used=(), seed=None):
+        self.used = set(used)
+        self.rng = np.random.default_rng(seed)
+
+    def is_used(self, color):
+        return color in self.used
+
+    def add(self, color):
+        self.used.add(color)
+
+    def discard(self, color):
+        self.used.discard(color)
+
+    def allocate(self, count):
+        """Возвращает count новых различимых цветов и помечает их занятыми"""
+        if count <= 0:
+            return []
+
+        offset = self.rng.random(3)
+        size = max(MIN_CANDIDATES, count * CANDIDATES_PER_COLOR)
+
+        while True:
+            rgb, lab = candidates(size, offset)
+
+            # Повторы после округления до байтов убираются с сохранением порядка последовательности
+            _, unique = np.unique(rgb_keys(rgb), return_index=True)
+            unique.sort()
+            rgb, lab = rgb[unique], lab[unique]
+
+            free = self.free_mask(rgb)
+            if free.sum() >= count:
+                break
+            size *= 2
+
+        rgb, lab = rgb[free], lab[free]
+
+        if count <= GREEDY_LIMIT:
+            chosen = self.farthest_points(lab, count)
+        else:
+            # Любое начало последовательности R3 равномерно покрывает область,
+            # поэтому для больших полей достаточно взять первые count точек
+            chosen = np.arange(count)
+
+        colors = rgb_to_hex(rgb[chosen])
+        self.used.update(colors)
+        return colors
+
+    def free_mask(self, rgb):
+        if not self.used:
+            return np.ones(len(rgb), dtype=bool)
+
+        used = hex_to_rgb(sorted(self.used))
+        return ~np.isin(rgb_keys(rgb), rgb_keys(used))
+
+    def farthest_points(self, lab, count):
+        """Жадный выбор: каждый следующий цвет дальше всех от уже выбранных и занятых"""
+        distances = np.full(len(lab), np.inf)
+
+        if self.used:
+            used_lab = rgb_to_oklab(hex_to_rgb(sorted(self.used)))
+            for block in range(0, len(used_lab), 256):
+                part = used_lab[block:block + 256]
+                block_distances = ((lab[:, None, :] - part[None, :, :]) ** 2).sum(axis=2)
+                np.minimum(distances, block_distances.min(axis=1), out=distances)
+
+        chosen = np.empty(count, dtype=np.intp)
+        index = int(np.argmax(distances)) if self.used else int(self.rng.integers(len(lab)))
+
+        for i in range(count):
+            chosen[i] = index
+            np.minimum(distances, ((lab - lab[index]) ** 2).sum(axis=1), out=distances)
+            index = int(np.argmax(distances))
+
+        return chosen
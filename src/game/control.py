@@ -0,0 +1,292 @@
+import json
+import socket
+import asyncio
+import ipaddress
+import threading
+from collections import deque
+
+from game.engine import EVENT_CATCH, EVENT_ALARM
+
+EVENT_NAMES = {EVENT_CATCH: 'catch', EVENT_ALARM: 'alarm'}
+
+# Пачек событий в очереди клиента; у медленного клиента отбрасываются самые старые
+MAX_PENDING_BATCHES = 64
+# Порог буфера записи сокета, после которого отправка ждет клиента
+WRITE_BUFFER_LIMIT = 256 * 1024
+# Длиннее строки команды не бывает
+MAX_LINE = 64 * 1024
+
+
+def parse_address(address):
+    """'unix:/путь', 'хост:порт' или 'порт'; TCP разрешен только на локальном адресе"""
+    if address.startswith('unix:'):
+        return 'unix', address[len('unix:'):]
+
+    host, _, port = address.rpartition(':')
+    host = host.strip('[]') or '127.0.0.1'
+
+    if host != 'localhost' and not ipaddress.ip_address(host).is_loopback:
+        raise ValueError(f"Сервер управления слушает только локальный адрес, а не {host}")
+    return 'tcp', (host, int(port))
+
+
+def encode(message):
+    return (json.dumps(message, ensure_ascii=False) + '\n').encode('utf-8')
+
+
+class EventBuffer:
+    """Получатель событий движка: копит ходы кадра до отправки одной пачкой"""
+
+    def __init__(self):
+        self.events = []
+
+    def record(self, tick, event, index):
+        self.events.append((tick, event, index))
+
+    def take(self):
+        events, self.events = self.events, []
+        return [[tick, EVENT_NAMES[event], index] for tick, event, index in events]
+
+
+class ControlClientConnection:
+    """Соединение с клиентом внутри цикла asyncio"""
+
+    def __init__(self, writer):
+        self.writer = writer
+        self.subscribed = False
+        self.batches = deque()
+        self.dropped_batches = 0
+        self.dropped_events = 0
+        self.ready = asyncio.Event()
+
+    def push(self, data, count):
+        """Ставит пачку в очередь, не дожидаясь клиента"""
+        if len(self.batches) >= MAX_PENDING_BATCHES:
+            _, lost = self.batches.popleft()
+            self.dropped_batches += 1
+            self.dropped_events += lost
+
+        self.batches.append((data, count))
+        self.ready.set()
+
+    def send(self, message):
+        self.writer.write(encode(message))
+
+    async def pump(self):
+        """Отправляет очередь клиенту; ждет только эта задача, а не поток интерфейса"""
+        while True:
+            await self.ready.wait()
+            self.ready.clear()
+
+            while self.batches:
+                if self.dropped_batches:
+                    self.send({
+                        'type': 'dropped',
+                        'batches': self.dropped_batches,
+                        'events': self.dropped_events,
+                    })
+                    self.dropped_batches = 0
+                    self.dropped_events = 0
+
+                data, _ = self.batches.popleft()
+                self.writer.write(data)
+                try:
+                    await self.writer.drain()
+                except ConnectionError:
+                    return
+
+
+class ControlServer:
+    """Локальный сервер управления игрой по строкам JSON.
+
+    Цикл asyncio работает в отдельном потоке. Команды передаются вызовом
+    dispatch(request, reply) — его реализация переносит команду в поток
+    интерфейса и вызывает reply(response) из любого потока. События хода
+    поток интерфейса отдает раз в кадр через publish, который только ставит
+    пачку в цикл asyncio и никогда не ждет клиентов."""
+
+    def __init__(self, address, dispatch, on_subscribers=None):
+        self.kind, self.address = parse_address(address)
+        self.dispatch = dispatch
+        self.on_subscribers = on_subscribers
+
+        self.loop = None
+        self.server = None
+        self.thread = None
+        self.clients = set()
+        self.started = threading.Event()
+        self.error = None
+
+    def start(self):
+        """Запускает поток сервера; ошибка открытия адреса поднимается здесь"""
+        self.thread = threading.Thread(target=self.run, name='control-server', daemon=True)
+        self.thread.start()
+        self.started.wait()
+
+        if self.error is not None:
+            self.thread.join()
+            raise self.error
+
+    def run(self):
+        self.loop = asyncio.new_event_loop()
+
+        try:
+            if self.kind == 'unix':
+                start = asyncio.start_unix_server(self.handle, self.address, limit=MAX_LINE)
+            else:
+                start = asyncio.start_server(self.handle, *self.address, limit=MAX_LINE)
+            self.server = self.loop.run_until_complete(start)
+        except OSError as error:
+            self.error = error
+            self.loop.close()
+            self.started.set()
+            return
+
+        self.started.set()
+        try:
+            self.loop.run_forever()
+        finally:
+            self.loop.run_until_complete(self.shutdown())
+            self.loop.close()
+
+    @property
+    def port(self):
+        """Фактический порт TCP (при порте 0 его выбирает система)"""
+        return self.server.sockets[0].getsockname()[1]
+
+    async def shutdown(self):
+        self.server.close()
+        for client in list(self.clients):
+            client.writer.close()
+
+        tasks = [task for task in asyncio.all_tasks(self.loop) if task is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await self.server.wait_closed()
+
+    def close(self):
+        if self.thread is None:
+            return
+
+        if self.loop is not None and not self.loop.is_closed():
+            self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.thread = None
+
+    async def handle(self, reader, writer):
+        client = ControlClientConnection(writer)
+        self.clients.add(client)
+
+        transport = writer.transport
+        transport.set_write_buffer_limits(high=WRITE_BUFFER_LIMIT)
+        if self.kind == 'tcp':
+            transport.get_extra_info('socket').setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        pump = asyncio.ensure_future(client.pump())
+
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if line.strip():
+                    self.handle_line(client, line)
+        except (ConnectionError, ValueError):
+            # ValueError — строка длиннее MAX_LINE
+            pass
+        finally:
+            pump.cancel()
+            self.clients.discard(client)
+            if client.subscribed:
+                self.notify_subscribers()
+            writer.close()
+
+    def handle_line(self, client, line):
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("Команда должна быть объектом JSON")
+        except ValueError as error:
+            client.send({'ok': False, 'error': f"Неверная команда: {error}"})
+            return
+
+        command = request.get('cmd')
+        if command in ('subscribe', 'unsubscribe'):
+            client.subscribed = command == 'subscribe'
+            self.notify_subscribers()
+
+        def reply(response):
+            response = dict(response, id=request.get('id'))
+            self.call_soon(lambda: client in self.clients and client.send(response))
+
+        self.dispatch(request, reply)
+
+    def notify_subscribers(self):
+        if self.on_subscribers is not None:
+            self.on_subscribers(sum(client.subscribed for client in self.clients))
+
+    def call_soon(self, callback):
+        """Передает вызов в цикл сервера; после остановки сервера вызов отбрасывается"""
+        try:
+            self.loop.call_soon_threadsafe(callback)
+        except RuntimeError:
+            pass
+
+    def publish(self, events, state):
+        """Пачка событий кадра для подписчиков; вызывается из потока интерфейса"""
+        self.call_soon(lambda: self.broadcast(events, state))
+
+    def broadcast(self, events, state):
+        message = {'type': 'events', 'events': events, 'state': state}
+        data = encode(message)
+
+        for client in self.clients:
+            if client.subscribed:
+                client.push(data, len(events))
+
+
+class ControlClient:
+    """Простой блокирующий клиент: для скриптов и проверки сервера"""
+
+    def __init__(self, address, timeout=5.0):
+        kind, target = parse_address(address)
+        family = socket.AF_UNIX if kind == 'unix' else socket.AF_INET
+        self.socket = socket.socket(family, socket.SOCK_STREAM)
+        self.socket.settimeout(timeout)
+        self.socket.connect(target)
+
+        self.file = self.socket.makefile('rb')
+        self.next_id = 0
+        # Сообщения, пришедшие до ответа на команду
+        self.messages = deque()
+
+    def send(self, message):
+        self.socket.sendall(encode(message))
+
+    def read(self):
+        line = self.file.readline()
+        if not line:
+            raise ConnectionError("Сервер закрыл соединение")
+        return json.loads(line)
+
+    def request(self, command, **params):
+        """Отправляет команду и возвращает ответ на нее"""
+        self.next_id += 1
+        self.send(dict(params, cmd=command, id=self.next_id))
+
+        while True:
+            message = self.read()
+            if message.get('id') == self.next_id:
+                return message
+            self.messages.append(message)
+
+    def message(self):
+        """Следующее сообщение потока событий"""
+        if self.messages:
+            return self.messages.popleft()
+        return self.read()
+
+    def close(self):
+        self.file.close()
+        self.socket.close()
@@ -0,0 +1,276 @@
+import json
+import random
+
+from game.sampler import FisherSampler
+
+TARGET_COUNT = 10
+
+# Без явного предела игра с частой аварией может не закончиться никогда
+DEFAULT_MAX_TICKS = 1000000
+
+# С этой вероятности аварии счетчики в среднем не растут и игра длится астрономически долго
+STALL_ALARM = 50
+
+# Диапазон скорости турбо-режима, ходов в секунду
+MIN_TURBO_RATE = 1
+MAX_TURBO_RATE = 100000
+
+EVENT_CATCH = 0
+EVENT_ALARM = 1
+EVENT_FINISH = 2
+
+
+class GameEngine:
+    """Правила игры «Рыбаки» без зависимости от Qt"""
+
+    def __init__(self, people=None, speed=0, alarm=0, seed=None):
+        self.speed = speed
+        self.alarm = alarm
+
+        # Каждая игра идет от явного зерна; зерна игр выдает генератор,
+        # инициализированный переданным seed, поэтому серия игр воспроизводима
+        self.seed_source = random.Random(seed)
+        self.seed = None
+        self.rng = random.Random()
+
+        # Получатели событий хода: объекты с методом record(tick, event, index)
+        self.recorders = []
+
+        self.colors = []
+        self.weights = None
+        self.counts = []
+        self.initial_counts = []
+        self.sampler = None
+
+        self.ticks = 0
+        self.catches = 0
+        self.alarms = 0
+        self.completed = 0
+
+        self.set_people(people or [])
+
+    @classmethod
+    def from_file(cls, file_path, seed=None):
+        from game.scenario import Scenario, SCENARIO_SUFFIX
+
+        engine = cls(seed=seed)
+
+        if file_path.endswith(SCENARIO_SUFFIX):
+            engine.load_scenario(Scenario(file_path))
+            return engine
+
+        with open(file_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        engine.load(data)
+        return engine
+
+    def load(self, data):
+        self.speed = data['speed']
+        self.alarm = data['alarm']
+        self.set_people(data['people'])
+
+    def load_scenario(self, scenario):
+        """Берет массивы бинарного сценария как есть, без разбора по рыбакам"""
+        self.speed = scenario.speed
+        self.alarm = scenario.alarm
+        self.colors = scenario.colors
+        self.initial_counts = scenario.counts
+        self.weights = scenario.weights
+
+        self.reset()
+
+    def set_people(self, people):
+        """Задает состав рыбаков и делает его начальным состоянием игры"""
+        self.colors = [person['color'] for person in people]
+        self.initial_counts = [person['count'] for person in people]
+
+        # Вес улова необязателен и задается только вместе для всех рыбаков
+        if any('weight' in person for person in people):
+            self.weights = [person.get('weight', 1) for person in people]
+        else:
+            self.weights = None
+
+        self.reset()
+
+    def get_people(self):
+        people = [
+            {'id': i, 'count': count, 'color': color}
+            for i, (count, color) in enumerate(zip(self.counts, self.colors))
+        ]
+
+        if self.weights is not None:
+            for person, weight in zip(people, self.weights):
+                person['weight'] = weight
+
+        return people
+
+    def reset(self, seed=None):
+        """Сброс игры к начальным значениям и выбор зерна для новой игры"""
+        self.seed = seed if seed is not None else self.seed_source.getrandbits(63)
+        self.rng.seed(self.seed)
+
+        # Счетчики сценария из отображенного файла копируются одним блоком
+        if isinstance(self.initial_counts, memoryview):
+            self.counts = bytearray(self.initial_counts)
+        else:
+            self.counts = list(self.initial_counts)
+        self.sampler = FisherSampler(self.counts, TARGET_COUNT, self.weights)
+        self.ticks = 0
+        self.catches = 0
+        self.alarms = 0
+        self.completed = sum(1 for count in self.counts if count >= TARGET_COUNT)
+
+    def get_state(self):
+        """Состояние идущей игры, достаточное для ее точного продолжения"""
+        return {
+            'seed': self.seed,
+            'rng': self.rng.getstate(),
+            'counts': list(self.counts),
+            'ticks': self.ticks,
+            'catches': self.catches,
+            'alarms': self.alarms,
+        }
+
+    def set_state(self, state):
+        version, internal, gauss = state['rng']
+        self.seed = state['seed']
+        self.rng.setstate((version, tuple(internal), gauss))
+
+        self.counts = list(state['counts'])
+        self.sampler = FisherSampler(self.counts, TARGET_COUNT, self.weights)
+        self.ticks = state['ticks']
+        self.catches = state['catches']
+        self.alarms = state['alarms']
+        self.completed = sum(1 for count in self.counts if count >= TARGET_COUNT)
+
+    @property
+    def finished(self):
+        return self.completed == len(self.counts)
+
+    @property
+    def interval(self):
+        """Интервал таймера игры в миллисекундах для текущей скорости"""
+        return max(10, 1000 - self.speed * 7)
+
+    @property
+    def turbo_rate(self):
+        """Число ходов в секунду в турбо-режиме: логарифмическая шкала скорости 0..100"""
+        ratio = MAX_TURBO_RATE / MIN_TURBO_RATE
+        return round(MIN_TURBO_RATE * ratio ** (self.speed / 100))
+
+    def tick(self):
+        """Один ход игры. Возвращает пару (событие, индекс рыбака)"""
+        if self.finished:
+            return EVENT_FINISH, -1
+
+        self.ticks += 1
+
+        # Авария происходит с процентной вероятностью alarm
+        if self.alarm > 0 and self.rng.random() * 100 < self.alarm:
+            self.alarms += 1
+            index = self.sampler.pick_alarm(self.rng.random())
+
+            if index >= 0:
+                self.change_count(index, -1)
+
+            for recorder in self.recorders:
+                recorder.record(self.ticks, EVENT_ALARM, index)
+
+            return EVENT_ALARM, index
+
+        index = self.sampler.pick_catch(self.rng.random())
+        self.change_count(index, 1)
+        self.catches += 1
+
+        for recorder in self.recorders:
+            recorder.record(self.ticks, EVENT_CATCH, index)
+
+        return EVENT_CATCH, index
+
+    def change_count(self, index, delta):
+        old_count = self.counts[index]
+        new_count = old_count + delta
+        self.counts[index] = new_count
+        self.sampler.update(index, old_count, new_count)
+
+        if new_count == TARGET_COUNT:
+            self.completed += 1
+        elif old_count == TARGET_COUNT:
+            self.completed -= 1
+
+    def step(self, n=1, dirty=None):
+        """Выполняет до n ходов подряд, возвращает число выполненных ходов.
+
+        Если передано множество dirty, в него добавляются индексы рыбаков,
+        чьи счетчики изменились."""
+        mark = dirty.add if dirty is not None else None
+        records = [recorder.record for recorder in self.recorders]
+        first_tick = self.ticks + 1
+        counts = self.counts
+        size = len(counts)
+        rng_random = self.rng.random
+        pick_catch = self.sampler.pick_catch
+        pick_alarm = self.sampler.pick_alarm
+        update = self.sampler.update
+        alarm = self.alarm
+
+        done = 0
+        catches = 0
+        alarms = 0
+        completed = self.completed
+
+        while done < n and completed < size:
+            done += 1
+
+            if alarm > 0 and rng_random() * 100 < alarm:
+                alarms += 1
+                index = pick_alarm(rng_random())
+                if index >= 0:
+                    count = counts[index]
+                    counts[index] = count - 1
+                    update(index, count, count - 1)
+                    if mark:
+                        mark(index)
+                if records:
+                    for record in records:
+                        record(first_tick + done - 1, EVENT_ALARM, index)
+                continue
+
+            index = pick_catch(rng_random())
+            count = counts[index] + 1
+            counts[index] = count
+            update(index, count - 1, count)
+            catches += 1
+            if mark:
+                mark(index)
+            if records:
+                for record in records:
+                    record(first_tick + done - 1, EVENT_CATCH, index)
+
+            if count == TARGET_COUNT:
+                completed += 1
+
+        self.ticks += done
+        self.catches += catches
+        self.alarms += alarms
+        self.completed = completed
+
+        return done
+
+    def run_until_complete(self, max_ticks=None):
+        """Играет до завершения (или до max_ticks ходов), возвращает число ходов"""
+        if max_ticks is not None:
+            return self.step(max_ticks)
+
+        done = 0
+        while not self.finished:
+            done += self.step(100000)
+        return done
+
+    def to_dict(self):
+        return {
+            'speed': self.speed,
+            'alarm': self.alarm,
+            'people': self.get_people(),
+        }
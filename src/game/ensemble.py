@@ -0,0 +1,177 @@
+import math
+
+import numpy as np
+
+from game.engine import GameEngine, TARGET_COUNT
+
+
+class Ensemble:
+    """Одновременная симуляция множества независимых игр с общими правилами"""
+
+    def __init__(self, initial_counts, alarm, n_games, seed=None, weights=None):
+        self.alarm = alarm
+        self.rng = np.random.default_rng(seed)
+        self.weights = None if weights is None else np.asarray(weights, dtype=np.float64)
+
+        initial = np.asarray(initial_counts, dtype=np.int16)
+        self.counts = np.tile(initial, (n_games, 1))
+        self.ticks = np.zeros(n_games, dtype=np.int64)
+        self.alarms = np.zeros(n_games, dtype=np.int64)
+
+        # Индексы игр, которые еще не завершены
+        self.active = np.flatnonzero((self.counts < TARGET_COUNT).any(axis=1))
+
+    @property
+    def finished(self):
+        return self.active.size == 0
+
+    def step(self):
+        """Один ход во всех незавершенных играх, возвращает число таких игр"""
+        active = self.active
+        size = active.size
+
+        if not size:
+            return 0
+
+        counts = self.counts[active]
+
+        # Бросок аварии, затем равновероятный выбор среди подходящих рыбаков
+        is_alarm = self.rng.random(size) * 100 < self.alarm
+
+        catch_mask = counts < TARGET_COUNT
+        alarm_mask = catch_mask & (counts >= 1)
+        eligible = np.where(is_alarm[:, None], alarm_mask, catch_mask)
+
+        if self.weights is None:
+            sizes = eligible.sum(axis=1)
+            picks = (self.rng.random(size) * sizes).astype(np.int64)
+            columns = (np.cumsum(eligible, axis=1) > picks[:, None]).argmax(axis=1)
+        else:
+            # Улов пропорционален весам, потеря при аварии равновероятна
+            weighted = np.where(is_alarm[:, None], alarm_mask, catch_mask * self.weights)
+            totals = np.cumsum(weighted, axis=1)
+            sizes = eligible.sum(axis=1)
+            picks = self.rng.random(size) * totals[:, -1]
+            columns = (totals > picks[:, None]).argmax(axis=1)
+
+        # При аварии без подходящих рыбаков счетчики не меняются
+        rows = np.flatnonzero(sizes > 0)
+        counts[rows, columns[rows]] += np.where(is_alarm[rows], -1, 1).astype(counts.dtype)
+
+        self.counts[active] = counts
+        self.ticks[active] += 1
+        self.alarms[active] += is_alarm
+
+        finished = (counts >= TARGET_COUNT).all(axis=1)
+        if finished.any():
+            self.active = active[~finished]
+
+        return size
+
+    def run_until_complete(self, max_ticks=None):
+        """Играет все игры до завершения (или до max_ticks ходов)"""
+        done = 0
+        while not self.finished and (max_ticks is None or done < max_ticks):
+            self.step()
+            done += 1
+        return done
+
+    def to_dict(self):
+        return {
+            'alarm': self.alarm,
+            'ticks': self.ticks.tolist(),
+            'alarms': self.alarms.tolist(),
+            'counts': self.counts.tolist(),
+            'finished': [bool(row) for row in (self.counts >= TARGET_COUNT).all(axis=1)],
+        }
+
+
+def summarize(ticks):
+    ticks = np.asarray(ticks)
+    return {
+        'mean': float(ticks.mean()),
+        'median': float(np.median(ticks)),
+        'p95': float(np.percentile(ticks, 95)),
+        'min': int(ticks.min()),
+        'max': int(ticks.max()),
+    }
+
+
+def ks_statistic(first, second):
+    """Статистика двухвыборочного критерия Колмогорова-Смирнова"""
+    first = np.sort(np.asarray(first))
+    second = np.sort(np.asarray(second))
+    values = np.concatenate([first, second])
+
+    first_cdf = np.searchsorted(first, values, side='right') / first.size
+    second_cdf = np.searchsorted(second, values, side='right') / second.size
+
+    return float(np.abs(first_cdf - second_cdf).max())
+
+
+def check_equivalence(initial_counts, alarm, n_games=2000, seed=0, alpha=0.001, weights=None,
+                      max_ticks=None):
+    """Сравнивает распределения длины игры и числа аварий
+    у векторизованной и пошаговой реализаций правил.
+
+    Игры, не закончившиеся за max_ticks ходов, в критерий не входят и
+    считаются отдельно для каждой реализации."""
+    ensemble = Ensemble(initial_counts, alarm, n_games, seed=seed, weights=weights)
+    ensemble.run_until_complete(max_ticks)
+
+    people = [{'count': count, 'color': '#000000'} for count in initial_counts]
+    if weights is not None:
+        for person, weight in zip(people, weights):
+            person['weight'] = weight
+    engine = GameEngine(people, alarm=alarm, seed=seed)
+
+    scalar_ticks = []
+    scalar_alarms = []
+    scalar_unfinished = 0
+    for _ in range(n_games):
+        engine.reset()
+        engine.run_until_complete(max_ticks)
+        if not engine.finished:
+            scalar_unfinished += 1
+            continue
+        scalar_ticks.append(engine.ticks)
+        scalar_alarms.append(engine.alarms)
+
+    finished = (ensemble.counts >= TARGET_COUNT).all(axis=1)
+    ensemble_ticks = ensemble.ticks[finished]
+    ensemble_alarms = ensemble.alarms[finished]
+
+    result = {
+        'games': n_games,
+        'alpha': alpha,
+        'unfinished': {
+            'ensemble': int(n_games - finished.sum()),
+            'scalar': scalar_unfinished,
+        },
+        'critical': None,
+        'ticks_statistic': None,
+        'alarms_statistic': None,
+        'ensemble': None,
+        'scalar': None,
+        'equivalent': None,
+    }
+
+    # Без законченных игр хотя бы у одной реализации сравнивать нечего
+    if not ensemble_ticks.size or not scalar_ticks:
+        return result
+
+    n, m = ensemble_ticks.size, len(scalar_ticks)
+    critical = math.sqrt(-math.log(alpha / 2) / 2) * math.sqrt((n + m) / (n * m))
+
+    ticks_statistic = ks_statistic(ensemble_ticks, scalar_ticks)
+    alarms_statistic = ks_statistic(ensemble_alarms, scalar_alarms)
+
+    result.update({
+        'critical': critical,
+        'ticks_statistic': ticks_statistic,
+        'alarms_statistic': alarms_statistic,
+        'ensemble': summarize(ensemble_ticks),
+        'scalar': summarize(scalar_ticks),
+        'equivalent': ticks_statistic <= critical and alarms_statistic <= critical,
+    })
+    return result
@@ -0,0 +1,198 @@
+import os
+import json
+import struct
+from bisect import bisect_right
+
+from game.engine import EVENT_CATCH, EVENT_ALARM
+
+# Запись хода: номер хода, тип события, индекс рыбака (-1, если авария никого не задела)
+RECORD = struct.Struct('<IBi')
+# Запись индекса снимков: номер хода и смещение снимка в файле снимков
+INDEX_ENTRY = struct.Struct('<QQ')
+
+LOG_VERSION = 1
+SNAPSHOT_INTERVAL = 4096
+
+META_FILE = 'meta.json'
+EVENTS_FILE = 'events.bin'
+SNAPSHOTS_FILE = 'snapshots.bin'
+INDEX_FILE = 'index.bin'
+
+
+class EventLogWriter:
+    """Запись партии в каталог журнала.
+
+    Каждый ход дописывается в events.bin записью фиксированной длины, поэтому
+    ход t лежит по смещению (t - first_tick - 1) * RECORD.size. Каждые
+    snapshot_interval ходов в snapshots.bin сохраняются все счетчики,
+    а в index.bin — пара (ход, смещение снимка)."""
+
+    BUFFER_RECORDS = 8192
+
+    def __init__(self, path, engine, snapshot_interval=SNAPSHOT_INTERVAL):
+        self.path = path
+        self.engine = engine
+        self.snapshot_interval = snapshot_interval
+        self.first_tick = engine.ticks
+        self.last_tick = engine.ticks
+
+        os.makedirs(path, exist_ok=True)
+        self.write_meta()
+
+        self.events = open(os.path.join(path, EVENTS_FILE), 'wb')
+        self.snapshots = open(os.path.join(path, SNAPSHOTS_FILE), 'wb')
+        self.index = open(os.path.join(path, INDEX_FILE), 'wb')
+
+        self.buffer = bytearray()
+        self.pack = RECORD.pack
+        self.snapshot(engine.ticks)
+
+    def write_meta(self, ticks=None):
+        engine = self.engine
+        meta = {
+            'version': LOG_VERSION,
+            'seed': engine.seed,
+            'alarm': engine.alarm,
+            'colors': list(engine.colors),
+            'record_size': RECORD.size,
+            'snapshot_interval': self.snapshot_interval,
+            'first_tick': self.first_tick,
+            'ticks': ticks,
+        }
+
+        meta_path = os.path.join(self.path, META_FILE)
+        with open(meta_path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(meta, f, ensure_ascii=False)
+        os.replace(meta_path + '.tmp', meta_path)
+
+    def record(self, tick, event, index):
+        self.buffer += self.pack(tick, event, index)
+        self.last_tick = tick
+
+        if tick % self.snapshot_interval == 0:
+            self.snapshot(tick)
+        elif len(self.buffer) >= self.BUFFER_RECORDS * RECORD.size:
+            self.flush_events()
+
+    def flush_events(self):
+        if self.buffer:
+            self.events.write(self.buffer)
+            self.events.flush()
+            self.buffer.clear()
+
+    def snapshot(self, tick):
+        """Полное состояние счетчиков после хода tick"""
+        self.flush_events()
+
+        offset = self.snapshots.tell()
+        self.snapshots.write(struct.pack(f'<{len(self.engine.counts)}H', *self.engine.counts))
+        self.index.write(INDEX_ENTRY.pack(tick, offset))
+
+        # Журнал идущей партии можно открыть для просмотра
+        self.snapshots.flush()
+        self.index.flush()
+
+    def close(self):
+        if self.events.closed:
+            return
+
+        self.flush_events()
+        for f in (self.events, self.snapshots, self.index):
+            f.close()
+
+        self.write_meta(self.last_tick)
+
+
+class EventLogReader:
+    """Чтение журнала партии с переходом к любому ходу.
+
+    В памяти держится только индекс снимков; переход к ходу ищет ближайший
+    снимок бинарным поиском и доигрывает не больше snapshot_interval записей."""
+
+    def __init__(self, path):
+        self.path = path
+
+        with open(os.path.join(path, META_FILE), 'r', encoding='utf-8') as f:
+            self.meta = json.load(f)
+
+        if self.meta['version'] != LOG_VERSION or self.meta['record_size'] != RECORD.size:
+            raise ValueError(f"Неподдерживаемый формат журнала: {path}")
+
+        self.seed = self.meta['seed']
+        self.alarm = self.meta['alarm']
+        self.colors = self.meta['colors']
+        self.first_tick = self.meta['first_tick']
+        self.snapshot_format = struct.Struct(f'<{len(self.colors)}H')
+
+        self.index_ticks = []
+        self.index_offsets = []
+        with open(os.path.join(path, INDEX_FILE), 'rb') as f:
+            for tick, offset in INDEX_ENTRY.iter_unpack(f.read()):
+                self.index_ticks.append(tick)
+                self.index_offsets.append(offset)
+
+        self.events = open(os.path.join(path, EVENTS_FILE), 'rb')
+        self.snapshots = open(os.path.join(path, SNAPSHOTS_FILE), 'rb')
+
+        # Текущее положение воспроизведения
+        self.tick = self.first_tick
+        self.counts = self.read_snapshot(0)
+
+    @property
+    def last_tick(self):
+        """Последний записанный ход (журнал может еще дописываться)"""
+        size = os.fstat(self.events.fileno()).st_size
+        return self.first_tick + size // RECORD.size
+
+    def read_snapshot(self, position):
+        self.snapshots.seek(self.index_offsets[position])
+        return list(self.snapshot_format.unpack(self.snapshots.read(self.snapshot_format.size)))
+
+    def read_events(self, start, stop):
+        """Записи ходов start+1..stop"""
+        self.events.seek((start - self.first_tick) * RECORD.size)
+        data = self.events.read((stop - start) * RECORD.size)
+        return RECORD.iter_unpack(data[:len(data) - len(data) % RECORD.size])
+
+    def apply(self, counts, start, stop):
+        changed = set()
+        for _, event, index in self.read_events(start, stop):
+            if index < 0:
+                continue
+            if event == EVENT_CATCH:
+                counts[index] += 1
+            elif event == EVENT_ALARM:
+                counts[index] -= 1
+            changed.add(index)
+        return changed
+
+    def seek(self, tick):
+        """Переходит к состоянию после хода tick, возвращает индексы изменившихся рыбаков
+        или None, если состояние было загружено из снимка целиком"""
+        tick = max(self.first_tick, min(tick, self.last_tick))
+
+        position = bisect_right(self.index_ticks, tick) - 1
+        snapshot_tick = self.index_ticks[position]
+
+        # Вперед от текущего хода дешевле, чем от снимка
+        if snapshot_tick <= self.tick <= tick:
+            changed = self.apply(self.counts, self.tick, tick)
+            self.tick = tick
+            return changed
+
+        self.counts = self.read_snapshot(position)
+        self.apply(self.counts, snapshot_tick, tick)
+        self.tick = tick
+        return None
+
+    def event_at(self, tick):
+        """Событие хода tick: пара (тип события, индекс рыбака)"""
+        if tick <= self.first_tick or tick > self.last_tick:
+            return None
+        for _, event, index in self.read_events(tick - 1, tick):
+            return event, index
+        return None
+
+    def close(self):
+        self.events.close()
+        self.snapshots.close()
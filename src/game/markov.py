@@ -0,0 +1,266 @@
+import os
+import math
+import time
+
+import numpy as np
+
+from game.engine import TARGET_COUNT, STALL_ALARM
+
+# Каталог, в котором сохраняются решенные таблицы
+CACHE_DIR = 'cache'
+CACHE_VERSION = 1
+
+# Число состояний растет как C(n + 10, 10); дальше таблица не строится
+MAX_STATES = 400000
+
+# Точность решения и хвост распределения, после которого счет останавливается
+TOLERANCE = 1e-12
+TAIL = 1e-10
+MAX_SWEEPS = 20000
+
+
+class SolverCancelled(Exception):
+    """Решение прервано по запросу вызывающей стороны"""
+
+
+def state_count(size):
+    return math.comb(size + TARGET_COUNT, TARGET_COUNT)
+
+
+def is_solvable(size, weights=None):
+    """Точное решение возможно при равновероятном выборе и не слишком большом поле"""
+    return weights is None and state_count(size) <= MAX_STATES
+
+
+def enumerate_states(size):
+    """Все гистограммы h[0..TARGET_COUNT-1] с суммой не больше size, строка на состояние"""
+    states = np.zeros((1, 0), dtype=np.int16)
+    totals = np.zeros(1, dtype=np.int64)
+
+    for _ in range(TARGET_COUNT):
+        repeats = size - totals + 1
+        rows = np.repeat(np.arange(len(states)), repeats)
+        starts = np.repeat(np.cumsum(repeats) - repeats, repeats)
+        values = np.arange(len(rows)) - starts
+
+        states = np.column_stack([states[rows], values]).astype(np.int16)
+        totals = totals[rows] + values
+
+    return states
+
+
+class MarkovSolver:
+    """Точная длина игры как поглощающей цепи Маркова.
+
+    При равновероятном выборе рыбаки взаимозаменяемы, поэтому состояние игры —
+    гистограмма: сколько незавершенных рыбаков стоит на каждом счетчике от 0
+    до 9. Улов уменьшает дефицит D = сумма (10 - счетчик) на единицу, авария
+    увеличивает, так что состояния, упорядоченные по D, образуют уровни, а
+    ожидаемое число ходов решается итерациями Гаусса-Зейделя по уровням:
+    без аварий решение точное за один проход, а число проходов растет с
+    вероятностью аварии. Таблица ожидания для всех состояний поля данного
+    размера и вероятности аварии сохраняется на диск."""
+
+    def __init__(self, size, alarm, cache_dir=CACHE_DIR):
+        if state_count(size) > MAX_STATES:
+            raise ValueError(
+                f"Слишком много состояний для точного решения: {state_count(size)} "
+                f"(не больше {MAX_STATES})"
+            )
+
+        self.size = size
+        self.alarm = alarm
+        self.cache_dir = cache_dir
+
+        self.radix = size + 1
+        self.powers = self.radix ** np.arange(TARGET_COUNT + 1, dtype=np.int64)
+
+        states = enumerate_states(size)
+        deficits = states @ np.arange(TARGET_COUNT, 0, -1)
+        keys = states.astype(np.int64) @ self.powers[:TARGET_COUNT]
+
+        # Состояния идут по возрастанию дефицита, каждый уровень — непрерывный отрезок
+        order = np.lexsort((keys, deficits))
+        self.states = states[order]
+        self.deficits = deficits[order]
+        self.keys = keys[order]
+        self.level_bounds = np.searchsorted(self.deficits, np.arange(self.deficits[-1] + 2))
+
+        self.key_order = np.argsort(self.keys)
+        self.sorted_keys = self.keys[self.key_order]
+
+        # Переходы нужны только для решения; при готовой таблице в кэше они не строятся
+        self.targets = None
+        self.expected_table = None
+
+    def lookup(self, keys):
+        return self.key_order[np.searchsorted(self.sorted_keys, keys)]
+
+    def build_transitions(self):
+        """Для каждого перехода: индексы состояний-целей и вероятности"""
+        if self.targets is not None:
+            return
+
+        states = self.states.astype(np.float64)
+        active = states.sum(axis=1)
+        losable = active - states[:, 0]
+        catch_p = 1 - self.alarm / 100
+        alarm_p = self.alarm / 100
+
+        targets = []
+        probabilities = []
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for k in range(TARGET_COUNT):
+                # Улов: рыбак со счетчиком k переходит на k + 1, с 9 — завершает игру
+                shift = self.powers[k + 1] if k + 1 < TARGET_COUNT else 0
+                p = np.where(active > 0, catch_p * states[:, k] / active, 0.0)
+                targets.append(self.valid_targets(self.keys - self.powers[k] + shift, p))
+                probabilities.append(p)
+
+            for k in range(1, TARGET_COUNT):
+                # Авария: рыбак со счетчиком k теряет единицу
+                p = np.where(losable > 0, alarm_p * states[:, k] / losable, 0.0)
+                targets.append(self.valid_targets(self.keys - self.powers[k] + self.powers[k - 1], p))
+                probabilities.append(p)
+
+        self.targets = np.array(targets)
+        self.probabilities = np.array(probabilities)
+
+        # Авария, когда все незавершенные рыбаки на нуле, ничего не меняет
+        self.stay = np.where((active > 0) & (losable == 0), alarm_p, 0.0)
+
+    def valid_targets(self, keys, p):
+        """Переходы с нулевой вероятностью направляются в поглощающее состояние"""
+        return np.where(p > 0, self.lookup(np.where(p > 0, keys, 0)), 0)
+
+    def cache_path(self, name):
+        return os.path.join(
+            self.cache_dir, f"markov-v{CACHE_VERSION}-n{self.size}-a{self.alarm}-{name}.npy"
+        )
+
+    def load_cached(self, name):
+        try:
+            return np.load(self.cache_path(name))
+        except (OSError, ValueError):
+            return None
+
+    def save_cached(self, name, data):
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        path = self.cache_path(name)
+        temp_path = path + '.tmp'
+        with open(temp_path, 'wb') as f:
+            np.save(f, data)
+        os.replace(temp_path, path)
+
+    def expected(self, cancelled=None, max_seconds=None):
+        """Ожидаемое число ходов до завершения для каждого состояния.
+
+        cancelled — необязательная функция, проверяемая после каждого прохода;
+        max_seconds ограничивает время решения"""
+        if self.expected_table is None:
+            table = self.load_cached('expected')
+            if table is None or table.shape != self.keys.shape:
+                table = self.solve_expected(cancelled, max_seconds)
+                self.save_cached('expected', table)
+            self.expected_table = table
+
+        return self.expected_table
+
+    def solve_expected(self, cancelled=None, max_seconds=None):
+        if self.alarm >= STALL_ALARM:
+            raise ValueError(f"Игра с вероятностью аварии от {STALL_ALARM}% не завершается")
+
+        self.build_transitions()
+        deadline = time.monotonic() + max_seconds if max_seconds is not None else None
+
+        expected = np.zeros(len(self.keys))
+        targets = self.targets
+        probabilities = self.probabilities
+        bounds = self.level_bounds
+
+        for _ in range(MAX_SWEEPS):
+            change = 0.0
+
+            # Уровень D опирается на уже обновленный уровень D - 1 и прежний D + 1
+            for level in range(1, len(bounds) - 1):
+                lo, hi = bounds[level], bounds[level + 1]
+
+                total = 1 + (probabilities[:, lo:hi] * expected[targets[:, lo:hi]]).sum(axis=0)
+                values = total / (1 - self.stay[lo:hi])
+
+                change = max(change, float(np.abs(values - expected[lo:hi]).max()))
+                expected[lo:hi] = values
+
+            if change <= TOLERANCE * max(1.0, float(expected.max())):
+                return expected
+            if cancelled and cancelled():
+                raise SolverCancelled()
+            if deadline is not None and time.monotonic() > deadline:
+                raise ValueError("Решение не сошлось за отведенное время")
+
+        raise ValueError("Решение не сошлось: игра с такой вероятностью аварии не завершается")
+
+    def state_key(self, counts):
+        histogram = [0] * TARGET_COUNT
+        for count in counts:
+            if count < TARGET_COUNT:
+                histogram[count] += 1
+        return sum(h * int(power) for h, power in zip(histogram, self.powers))
+
+    def state_index(self, counts):
+        return int(self.lookup(self.state_key(counts)))
+
+    def expected_ticks(self, counts):
+        """Ожидаемое число оставшихся ходов из состояния со счетчиками counts"""
+        if len(counts) != self.size:
+            raise ValueError(f"Решение построено для {self.size} рыбаков, передано {len(counts)}")
+        return float(self.expected()[self.state_index(counts)])
+
+    def distribution(self, counts, tail=TAIL, max_ticks=1000000):
+        """Вероятности завершения игры ровно на ходу t = 0, 1, ... из состояния counts.
+
+        Масса вероятности переносится по переходам ход за ходом, пока не
+        останется хвост меньше tail."""
+        start = self.state_index(counts)
+        name = f"pmf-{self.state_key(counts)}"
+
+        pmf = self.load_cached(name)
+        if pmf is not None:
+            return pmf
+
+        self.build_transitions()
+
+        size = len(self.keys)
+        mass = np.zeros(size)
+        mass[start] = 1.0
+
+        targets = self.targets.ravel()
+        pmf = [mass[0]]
+        mass[0] = 0.0
+        remaining = 1.0 - pmf[0]
+
+        while remaining > tail and len(pmf) <= max_ticks:
+            moved = np.bincount(targets, weights=(self.probabilities * mass).ravel(), minlength=size)
+            mass = moved + self.stay * mass
+
+            pmf.append(mass[0])
+            mass[0] = 0.0
+            remaining = float(mass.sum())
+
+        pmf = np.array(pmf)
+        self.save_cached(name, pmf)
+        return pmf
+
+
+def summarize_distribution(pmf):
+    """Среднее, медиана и p95 числа ходов по распределению"""
+    ticks = np.arange(len(pmf))
+    cdf = np.cumsum(pmf)
+    return {
+        'mean': float((ticks * pmf).sum()),
+        'median': int(np.searchsorted(cdf, 0.5)),
+        'p95': int(np.searchsorted(cdf, 0.95)),
+        'tail': float(1 - cdf[-1]),
+    }
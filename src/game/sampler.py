@@ -0,0 +1,151 @@
+# Веса хранятся целыми числами, чтобы суммы в дереве не накапливали ошибку
+WEIGHT_SCALE = 1 << 20
+
+
+class IndexSet:
+    """Множество индексов с добавлением, удалением и случайным выбором за O(1)"""
+
+    def __init__(self, size):
+        self.items = []
+        self.positions = [-1] * size
+
+    def __len__(self):
+        return len(self.items)
+
+    def __contains__(self, index):
+        return self.positions[index] >= 0
+
+    def add(self, index):
+        if self.positions[index] < 0:
+            self.positions[index] = len(self.items)
+            self.items.append(index)
+
+    def remove(self, index):
+        position = self.positions[index]
+        if position < 0:
+            return
+
+        # Переносим последний элемент на место удаляемого
+        last = self.items.pop()
+        if last != index:
+            self.items[position] = last
+            self.positions[last] = position
+        self.positions[index] = -1
+
+    def pick(self, u):
+        """Равновероятный выбор элемента для u из [0, 1)"""
+        items = self.items
+        return items[min(int(u * len(items)), len(items) - 1)]
+
+
+class WeightedIndexSet:
+    """Множество индексов с весами на дереве Фенвика: изменение и выбор за O(log n)"""
+
+    def __init__(self, weights):
+        self.weights = [to_weight(weight) for weight in weights]
+        self.tree = [0] * (len(self.weights) + 1)
+        self.members = [False] * len(self.weights)
+        self.size = 0
+        self.total = 0
+
+        self.top_bit = 1
+        while self.top_bit * 2 <= len(self.weights):
+            self.top_bit *= 2
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, index):
+        return self.members[index]
+
+    def _add(self, index, delta):
+        self.total += delta
+        position = index + 1
+        tree = self.tree
+        while position < len(tree):
+            tree[position] += delta
+            position += position & -position
+
+    def add(self, index):
+        if not self.members[index]:
+            self.members[index] = True
+            self.size += 1
+            self._add(index, self.weights[index])
+
+    def remove(self, index):
+        if self.members[index]:
+            self.members[index] = False
+            self.size -= 1
+            self._add(index, -self.weights[index])
+
+    def pick(self, u):
+        """Выбор элемента с вероятностью, пропорциональной весу, для u из [0, 1)"""
+        value = min(int(u * self.total), self.total - 1)
+        tree = self.tree
+        size = len(tree)
+        position = 0
+        step = self.top_bit
+
+        # Спуск по дереву к первому индексу, префиксная сумма которого больше value
+        while step:
+            following = position + step
+            if following < size and tree[following] <= value:
+                position = following
+                value -= tree[following]
+            step >>= 1
+
+        return position
+
+
+def to_weight(weight):
+    if weight <= 0:
+        raise ValueError(f"Вес рыбака должен быть положительным: {weight}")
+    return max(1, round(weight * WEIGHT_SCALE))
+
+
+class FisherSampler:
+    """Поддерживает множества рыбаков, доступных для улова (count < target)
+    и для потери при аварии (1 <= count < target)"""
+
+    def __init__(self, counts, target, weights=None):
+        size = len(counts)
+        self.target = target
+
+        if weights is None:
+            self.catchable = IndexSet(size)
+        else:
+            self.catchable = WeightedIndexSet(weights)
+        self.losable = IndexSet(size)
+
+        for index, count in enumerate(counts):
+            self.update(index, target, count)
+
+    def update(self, index, old_count, new_count):
+        """Переносит рыбака между множествами после изменения счетчика"""
+        was_catchable = old_count < self.target
+        is_catchable = new_count < self.target
+
+        if was_catchable != is_catchable:
+            if is_catchable:
+                self.catchable.add(index)
+            else:
+                self.catchable.remove(index)
+
+        was_losable = was_catchable and old_count >= 1
+        is_losable = is_catchable and new_count >= 1
+
+        if was_losable != is_losable:
+            if is_losable:
+                self.losable.add(index)
+            else:
+                self.losable.remove(index)
+
+    def pick_catch(self, u):
+        if not self.catchable:
+            return -1
+        return self.catchable.pick(u)
+
+    def pick_alarm(self, u):
+        if not self.losable:
+            return -1
+        return self.losable.pick(u)
@@ -0,0 +1,299 @@
+import os
+import json
+import mmap
+import codecs
+import struct
+from array import array
+
+from game.engine import TARGET_COUNT
+
+SCENARIO_SUFFIX = '.fshs'
+SCENARIO_MAGIC = b'FSHS'
+SCENARIO_VERSION = 1
+
+# Заголовок: сигнатура, версия, флаги, скорость, авария, порог улова, число рыбаков.
+# За ним идут выровненные по 4 байтам массивы: счетчики uint8[n], цвета RGB uint8[3n]
+# и, если выставлен FLAG_WEIGHTS, веса улова float32[n]
+HEADER = struct.Struct('<4sHHBBHI')
+FLAG_WEIGHTS = 1
+
+PROGRESS_STEP = 4096
+
+
+class ConversionCancelled(Exception):
+    """Преобразование прервано из функции отчета о ходе работы"""
+
+
+def align(offset):
+    return (offset + 3) & ~3
+
+
+def parse_color(text):
+    """'#rgb' или '#rrggbb' в три байта RGB"""
+    if not isinstance(text, str) or not text.startswith('#') or len(text) not in (4, 7):
+        raise ValueError(f"Цвет должен быть в виде #rrggbb: {text!r}")
+
+    digits = text[1:]
+    if len(digits) == 3:
+        digits = ''.join(digit * 2 for digit in digits)
+    return bytes.fromhex(digits)
+
+
+class ColorArray:
+    """Цвета рыбаков поверх упакованного массива RGB.
+
+    Строка '#rrggbb' создается только при обращении к конкретному рыбаку."""
+
+    def __init__(self, rgb):
+        self.rgb = rgb
+
+    def __len__(self):
+        return len(self.rgb) // 3
+
+    def __getitem__(self, index):
+        size = len(self)
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(size))]
+
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("индекс цвета вне диапазона")
+
+        offset = index * 3
+        return '#' + self.rgb[offset:offset + 3].hex()
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+
+class Scenario:
+    """Сценарий из бинарного файла, отображенного в память.
+
+    Массивы не разбираются по рыбакам: counts — memoryview байтов счетчиков,
+    colors — ColorArray над байтами RGB, weights — memoryview float32 или None."""
+
+    def __init__(self, path):
+        self.path = path
+
+        with open(path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < HEADER.size:
+                raise ValueError(f"Файл слишком мал для сценария: {path}")
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, flags, speed, alarm, threshold, count = HEADER.unpack_from(self.map)
+
+        if magic != SCENARIO_MAGIC:
+            raise ValueError(f"Файл не является сценарием: {path}")
+        if version != SCENARIO_VERSION:
+            raise ValueError(f"Неподдерживаемая версия сценария {version}: {path}")
+        if threshold != TARGET_COUNT:
+            raise ValueError(f"Порог улова {threshold} не поддерживается (ожидается {TARGET_COUNT})")
+
+        counts_offset = HEADER.size
+        colors_offset = align(counts_offset + count)
+        weights_offset = align(colors_offset + 3 * count)
+        end = weights_offset + (4 * count if flags & FLAG_WEIGHTS else 0)
+
+        if size < end:
+            raise ValueError(f"Сценарий поврежден: ожидалось {end} байт, в файле {size}")
+
+        data = memoryview(self.map)
+        self.speed = speed
+        self.alarm = alarm
+        self.threshold = threshold
+        self.counts = data[counts_offset:counts_offset + count]
+        self.colors = ColorArray(data[colors_offset:colors_offset + 3 * count])
+        self.weights = None
+        if flags & FLAG_WEIGHTS:
+            self.weights = data[weights_offset:end].cast('f')
+
+    def __len__(self):
+        return len(self.counts)
+
+
+def write_scenario(path, speed, alarm, counts, colors, weights=None):
+    """Записывает сценарий; colors — ColorArray или последовательность строк '#rrggbb'"""
+    count = len(counts)
+
+    if isinstance(colors, ColorArray):
+        rgb = bytes(colors.rgb)
+    else:
+        rgb = b''.join(parse_color(color) for color in colors)
+
+    if len(rgb) != 3 * count:
+        raise ValueError("Число цветов не совпадает с числом рыбаков")
+    if any(not 0 <= value <= 255 for value in counts):
+        raise ValueError("Счетчик рыбака вне диапазона 0..255")
+
+    flags = FLAG_WEIGHTS if weights is not None else 0
+    header = HEADER.pack(
+        SCENARIO_MAGIC, SCENARIO_VERSION, flags, speed, alarm, TARGET_COUNT, count
+    )
+
+    temp_path = path + '.tmp'
+    with open(temp_path, 'wb') as f:
+        f.write(header)
+        f.write(bytes(counts))
+        f.write(b'\0' * (align(f.tell()) - f.tell()))
+        f.write(rgb)
+        f.write(b'\0' * (align(f.tell()) - f.tell()))
+        if weights is not None:
+            array('f', weights).tofile(f)
+
+    os.replace(temp_path, path)
+
+
+class JsonStream:
+    """Потоковый разбор JSON: файл читается кусками, значения берутся по одному"""
+
+    CHUNK_SIZE = 1 << 16
+
+    def __init__(self, f):
+        self.f = f
+        self.decoder = codecs.getincrementaldecoder('utf-8-sig')()
+        self.json_decoder = json.JSONDecoder()
+        self.buffer = ''
+        self.pos = 0
+        self.bytes_read = 0
+        self.eof = False
+
+    def fill(self):
+        if self.eof:
+            return False
+
+        chunk = self.f.read(self.CHUNK_SIZE)
+        self.bytes_read += len(chunk)
+        if not chunk:
+            self.eof = True
+
+        self.buffer = self.buffer[self.pos:] + self.decoder.decode(chunk, final=self.eof)
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """Первый значимый символ, пробелы пропускаются"""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in ' \t\r\n':
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                raise ValueError("Неожиданный конец JSON")
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise ValueError(f"Ожидался символ {char!r} в позиции {self.bytes_read}")
+        self.pos += 1
+
+    def skip(self, char):
+        if self.peek() == char:
+            self.pos += 1
+            return True
+        return False
+
+    def value(self):
+        self.peek()
+        while True:
+            try:
+                value, end = self.json_decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if not self.fill():
+                    raise
+                continue
+
+            # Число у конца буфера может продолжаться в следующем куске
+            if end == len(self.buffer) and not self.eof:
+                self.fill()
+                continue
+
+            self.pos = end
+            return value
+
+
+def iter_scenario_json(f):
+    """Разбирает файл игры по частям: пары (ключ, значение) верхнего уровня,
+    а рыбаки из 'people' — по одному как ('person', словарь)"""
+    stream = JsonStream(f)
+    stream.expect('{')
+
+    while not stream.skip('}'):
+        key = stream.value()
+        stream.expect(':')
+
+        if key == 'people':
+            stream.expect('[')
+            while not stream.skip(']'):
+                yield 'person', stream.value(), stream.bytes_read
+                stream.skip(',')
+        else:
+            yield key, stream.value(), stream.bytes_read
+
+        stream.skip(',')
+
+
+def json_to_scenario(source, target, progress=None):
+    """Преобразует файл игры JSON в бинарный сценарий, не загружая JSON целиком"""
+    total = os.path.getsize(source)
+
+    speed = 0
+    alarm = 0
+    counts = bytearray()
+    rgb = bytearray()
+    weights = None
+
+    with open(source, 'rb') as f:
+        for key, value, position in iter_scenario_json(f):
+            if key == 'speed':
+                speed = value
+            elif key == 'alarm':
+                alarm = value
+            elif key == 'person':
+                if 'weight' in value and weights is None:
+                    weights = array('f', [1.0]) * len(counts)
+                if weights is not None:
+                    weights.append(value.get('weight', 1))
+
+                counts.append(value['count'])
+                rgb += parse_color(value['color'])
+
+                if progress and len(counts) % PROGRESS_STEP == 0:
+                    progress(position, total)
+
+    write_scenario(target, speed, alarm, counts, ColorArray(rgb), weights)
+
+    if progress:
+        progress(total, total)
+
+
+def scenario_to_json(source, target, progress=None):
+    """Преобразует бинарный сценарий в файл игры JSON, записывая рыбаков по одному"""
+    scenario = Scenario(source)
+    total = len(scenario)
+
+    temp_path = target + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        f.write('{\n')
+        f.write(f'    "speed": {scenario.speed},\n')
+        f.write(f'    "alarm": {scenario.alarm},\n')
+        f.write('    "people": [')
+
+        for index in range(total):
+            person = {'id': index, 'count': scenario.counts[index], 'color': scenario.colors[index]}
+            if scenario.weights is not None:
+                person['weight'] = scenario.weights[index]
+
+            f.write(',\n        ' if index else '\n        ')
+            f.write(json.dumps(person, ensure_ascii=False))
+
+            if progress and (index + 1) % PROGRESS_STEP == 0:
+                progress(index + 1, total)
+
+        f.write('\n    ]\n}\n')
+
+    os.replace(temp_path, target)
+
+    if progress:
+        progress(total, total)
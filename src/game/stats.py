@@ -0,0 +1,159 @@
+from array import array
+
+# Период снятия показаний и глубина истории графика
+SAMPLE_INTERVAL = 0.25
+HISTORY_SECONDS = 60
+
+
+class RingBuffer:
+    """Кольцевой буфер чисел фиксированной емкости поверх заранее выделенного массива"""
+
+    def __init__(self, capacity):
+        self.data = array('d', bytes(8 * capacity))
+        self.capacity = capacity
+        self.head = 0
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def append(self, value):
+        self.data[self.head] = value
+        self.head = (self.head + 1) % self.capacity
+        if self.size < self.capacity:
+            self.size += 1
+
+    def clear(self):
+        self.head = 0
+        self.size = 0
+
+    def last(self, default=0.0):
+        return self.data[self.head - 1] if self.size else default
+
+    def values(self):
+        """Значения от старых к новым"""
+        if self.size < self.capacity:
+            return self.data[:self.size]
+        return self.data[self.head:] + self.data[:self.head]
+
+    def max(self, default=0.0):
+        return max(self.values(), default=default)
+
+
+class GameStats:
+    """Показатели идущей игры, снятые со счетчиков движка через равные промежутки.
+
+    Движок сам ведет счетчики ходов, уловов и аварий, поэтому на ход игры
+    статистика не тратит ничего: за одно снятие в буферы добавляется по
+    одному значению."""
+
+    def __init__(self, engine, interval=SAMPLE_INTERVAL, history=HISTORY_SECONDS):
+        self.engine = engine
+        self.interval = interval
+
+        capacity = max(1, round(history / interval))
+        self.rate = RingBuffer(capacity)
+        self.alarm_rate = RingBuffer(capacity)
+        self.catches = RingBuffer(capacity)
+        self.alarms = RingBuffer(capacity)
+        self.completed = RingBuffer(capacity)
+
+        self.clear()
+
+    @property
+    def buffers(self):
+        return (self.rate, self.alarm_rate, self.catches, self.alarms, self.completed)
+
+    def clear(self):
+        for buffer in self.buffers:
+            buffer.clear()
+
+        self.seed = self.engine.seed
+        self.last_ticks = self.engine.ticks
+        self.last_alarms = self.engine.alarms
+        self.elapsed = 0.0
+
+    def sample(self, dt, running=True):
+        """Снимает показания за прошедшие dt секунд; время идет, только пока игра запущена"""
+        engine = self.engine
+
+        # Новая игра или загрузка: прежняя история к ней не относится
+        if engine.seed != self.seed or engine.ticks < self.last_ticks:
+            self.clear()
+
+        ticks = engine.ticks - self.last_ticks
+
+        # Ходы за промежуток означают, что игра шла, даже если уже успела закончиться
+        if running or ticks:
+            self.elapsed += dt
+
+        alarms = engine.alarms - self.last_alarms
+        self.last_ticks = engine.ticks
+        self.last_alarms = engine.alarms
+
+        self.rate.append(ticks / dt if dt > 0 else 0.0)
+        self.alarm_rate.append(100 * alarms / ticks if ticks else self.alarm_rate.last())
+        self.catches.append(engine.catches)
+        self.alarms.append(engine.alarms)
+        self.completed.append(engine.completed)
+
+    def observed_alarm_rate(self):
+        """Доля аварий среди всех ходов игры, в процентах"""
+        if not self.engine.ticks:
+            return 0.0
+        return 100 * self.engine.alarms / self.engine.ticks
+
+
+class Histogram:
+    """Гистограмма длительностей в микросекундах с логарифмическими корзинами.
+
+    Внутри каждой степени двойки SUB_BUCKETS равных корзин, поэтому запись —
+    несколько целочисленных операций, а процентиль определяется с
+    относительной погрешностью не больше 1/SUB_BUCKETS."""
+
+    SUB_BUCKETS = 16
+    SUB_BITS = 4
+    MAX_SHIFT = 40
+
+    def __init__(self):
+        self.buckets = array('Q', bytes(8 * self.SUB_BUCKETS * (self.MAX_SHIFT + 2)))
+        self.count = 0
+        self.max = 0
+
+    def clear(self):
+        self.buckets = array('Q', bytes(8 * len(self.buckets)))
+        self.count = 0
+        self.max = 0
+
+    def bucket(self, value):
+        if value < self.SUB_BUCKETS:
+            return value
+        shift = min(value.bit_length() - self.SUB_BITS - 1, self.MAX_SHIFT)
+        return self.SUB_BUCKETS * (shift + 1) + min((value >> shift) - self.SUB_BUCKETS, self.SUB_BUCKETS - 1)
+
+    def bucket_value(self, bucket):
+        """Середина корзины"""
+        if bucket < self.SUB_BUCKETS:
+            return bucket
+        shift = bucket // self.SUB_BUCKETS - 1
+        low = (self.SUB_BUCKETS + bucket % self.SUB_BUCKETS) << shift
+        return low + (1 << shift) // 2
+
+    def record(self, value):
+        value = max(0, int(value))
+        self.buckets[self.bucket(value)] += 1
+        self.count += 1
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, p):
+        if not self.count:
+            return 0
+
+        rank = max(1, -(-self.count * p // 100))
+        seen = 0
+        for bucket, hits in enumerate(self.buckets):
+            seen += hits
+            if seen >= rank:
+                return min(self.bucket_value(bucket), self.max)
+        return self.max
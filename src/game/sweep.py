@@ -0,0 +1,219 @@
+import os
+import json
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from game.engine import GameEngine, DEFAULT_MAX_TICKS
+from game.ensemble import Ensemble, summarize
+
+SWEEP_VERSION = 1
+
+# Игры ячейки делятся на пачки: пачка — единица работы процесса и единица продолжения
+DEFAULT_CHUNK = 250
+
+# Сценарии, уже загруженные в процессе-исполнителе
+_engines = {}
+
+
+def parse_grid(text):
+    """Сетка значений: '0,5,10', диапазон 'начало:конец:шаг' (конец включен) или их смесь"""
+    values = []
+    for part in text.split(','):
+        part = part.strip()
+        if not part:
+            continue
+
+        if ':' in part:
+            start, stop, step = (int(value) for value in part.split(':'))
+            if step <= 0:
+                raise ValueError(f"Шаг сетки должен быть положительным: {part}")
+            values.extend(range(start, stop + 1, step))
+        else:
+            values.append(int(part))
+
+    if not values:
+        raise ValueError(f"Пустая сетка: {text!r}")
+    return sorted(set(values))
+
+
+def task_seed(seed, scenario_index, alarm, chunk):
+    """Зерно пачки зависит только от ее места в сетке, а не от порядка выполнения"""
+    return np.random.SeedSequence(seed, spawn_key=(scenario_index, alarm, chunk))
+
+
+def load_engine(path):
+    engine = _engines.get(path)
+    if engine is None:
+        engine = _engines[path] = GameEngine.from_file(path)
+    return engine
+
+
+def run_chunk(task):
+    """Выполняется в процессе-исполнителе: одна пачка игр одной ячейки сетки"""
+    engine = load_engine(task['scenario'])
+
+    ensemble = Ensemble(
+        engine.initial_counts, task['alarm'], task['games'],
+        seed=task_seed(task['seed'], task['scenario_index'], task['alarm'], task['chunk']),
+        weights=engine.weights
+    )
+    ensemble.run_until_complete(max_ticks=task['max_ticks'])
+
+    result = dict(task)
+    result.update({
+        'ticks': ensemble.ticks.tolist(),
+        'alarms': ensemble.alarms.tolist(),
+        'unfinished': int(ensemble.active.size),
+    })
+    return result
+
+
+class Sweep:
+    """Перебор сетки сценарии × вероятность аварии в пуле процессов.
+
+    Результаты пачек дописываются в файл NDJSON по мере готовности: первая
+    строка — параметры перебора, остальные — готовые пачки. Прерванный
+    перебор продолжается с того же файла, выполняются только недостающие пачки."""
+
+    def __init__(self, scenarios, alarms, games, seed=0, chunk=DEFAULT_CHUNK,
+                 max_ticks=DEFAULT_MAX_TICKS):
+        self.params = {
+            'version': SWEEP_VERSION,
+            'scenarios': [os.path.abspath(path) for path in scenarios],
+            'alarms': list(alarms),
+            'games': games,
+            'seed': seed,
+            'chunk': chunk,
+            'max_ticks': max_ticks,
+        }
+
+    def tasks(self):
+        params = self.params
+        for scenario_index, scenario in enumerate(params['scenarios']):
+            for alarm in params['alarms']:
+                for chunk, start in enumerate(range(0, params['games'], params['chunk'])):
+                    yield {
+                        'scenario': scenario,
+                        'scenario_index': scenario_index,
+                        'alarm': alarm,
+                        'chunk': chunk,
+                        'games': min(params['chunk'], params['games'] - start),
+                        'seed': params['seed'],
+                        'max_ticks': params['max_ticks'],
+                    }
+
+    @staticmethod
+    def task_key(task):
+        return task['scenario_index'], task['alarm'], task['chunk']
+
+    def read_results(self, path):
+        """Готовые пачки из файла прерванного перебора.
+
+        Оборванная последняя строка отрезается, чтобы дописывать после целой записи."""
+        results = []
+
+        with open(path, 'r+b') as f:
+            data = f.read()
+            end = data.rfind(b'\n') + 1
+            if end < len(data):
+                f.truncate(end)
+
+        lines = data[:end].decode('utf-8').splitlines()
+        if not lines:
+            return None
+
+        header = json.loads(lines[0])
+        if header != self.params:
+            raise ValueError("Параметры перебора не совпадают с параметрами в файле результатов")
+
+        for line in lines[1:]:
+            results.append(json.loads(line))
+        return results
+
+    def run(self, path, workers=None, resume=False, progress=None):
+        """Выполняет недостающие пачки и возвращает все результаты"""
+        results = None
+        if resume and os.path.exists(path):
+            results = self.read_results(path)
+
+        with open(path, 'a' if results is not None else 'w', encoding='utf-8') as f:
+            if results is None:
+                results = []
+                f.write(json.dumps(self.params) + '\n')
+                f.flush()
+
+            done = {self.task_key(result) for result in results}
+            pending = [task for task in self.tasks() if self.task_key(task) not in done]
+            total = len(done) + len(pending)
+
+            if progress:
+                progress(len(done), total)
+
+            if pending:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    futures = [pool.submit(run_chunk, task) for task in pending]
+
+                    for future in as_completed(futures):
+                        result = future.result()
+                        results.append(result)
+
+                        f.write(json.dumps(result) + '\n')
+                        f.flush()
+
+                        if progress:
+                            progress(len(results), total)
+
+        return results
+
+    def summary(self, results, speeds=()):
+        """Сводка по ячейкам сетки в порядке сценариев и вероятностей аварии"""
+        cells = {}
+        for result in results:
+            cells.setdefault((result['scenario_index'], result['alarm']), []).append(result)
+
+        rows = []
+        for (scenario_index, alarm), chunks in sorted(cells.items()):
+            chunks.sort(key=lambda result: result['chunk'])
+            ticks = np.concatenate([np.asarray(result['ticks']) for result in chunks])
+            alarms = np.concatenate([np.asarray(result['alarms']) for result in chunks])
+
+            row = {
+                'scenario': self.params['scenarios'][scenario_index],
+                'alarm': alarm,
+                'games': int(ticks.size),
+                'unfinished': sum(result['unfinished'] for result in chunks),
+                'ticks': summarize(ticks),
+                'alarms_mean': float(alarms.mean()),
+            }
+
+            # Скорость не влияет на ходы, только на длительность хода в окне
+            if speeds:
+                row['duration_s'] = {
+                    speed: row['ticks']['mean'] * GameEngine(speed=speed).interval / 1000
+                    for speed in speeds
+                }
+
+            rows.append(row)
+
+        return rows
+
+
+def format_summary(rows):
+    speeds = list(rows[0].get('duration_s', {})) if rows else []
+
+    header = (f"{'сценарий':<20} {'авария':>6} {'игр':>7} {'среднее':>10} {'медиана':>10} "
+              f"{'p95':>10} {'аварий':>9} {'не дошли':>8}")
+    header += ''.join(f" {f'время@{speed}, с':>14}" for speed in speeds)
+
+    lines = [header]
+    for row in rows:
+        ticks = row['ticks']
+        line = (f"{os.path.basename(row['scenario']):<20} {row['alarm']:>6} {row['games']:>7} "
+                f"{ticks['mean']:>10.1f} {ticks['median']:>10.1f} {ticks['p95']:>10.1f} "
+                f"{row['alarms_mean']:>9.1f} {row['unfinished']:>8}")
+        line += ''.join(f" {row['duration_s'][speed]:>14.1f}" for speed in speeds)
+        lines.append(line)
+
+    return '\n'.join(lines)
+
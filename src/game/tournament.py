@@ -0,0 +1,86 @@
+import os
+import random
+
+from game.engine import GameEngine
+
+
+class Tournament:
+    """Несколько независимых игр, которые продвигает один планировщик.
+
+    Все незавершенные игры получают одинаковое число ходов: ходы кадра
+    раздаются по кругу пачками, поэтому при нехватке времени кадра ни одна
+    игра не уходит вперед остальных. Места присваиваются в порядке завершения."""
+
+    CHUNK = 256
+
+    def __init__(self, seed=None):
+        self.seed_source = random.Random(seed)
+        self.boards = []
+        self.finish_order = []
+
+    def add(self, name, engine):
+        engine.reset(self.seed_source.getrandbits(63))
+        self.boards.append({'name': name, 'engine': engine, 'place': None})
+
+    @classmethod
+    def from_files(cls, paths, alarms=(), seed=None):
+        """Турнир по файлам игры; с alarms каждый файл играется с каждой вероятностью аварии"""
+        tournament = cls(seed)
+
+        for path in paths:
+            name = os.path.splitext(os.path.basename(path))[0]
+            for alarm in alarms or (None,):
+                engine = GameEngine.from_file(path)
+                if alarm is not None:
+                    engine.alarm = alarm
+                tournament.add(f"{name}, авария {engine.alarm}%", engine)
+
+        return tournament
+
+    @property
+    def finished(self):
+        return len(self.finish_order) == len(self.boards)
+
+    def reset(self):
+        """Новый круг: все игры заново с новыми зернами"""
+        for board in self.boards:
+            board['engine'].reset(self.seed_source.getrandbits(63))
+            board['place'] = None
+        self.finish_order.clear()
+
+    def advance(self, due, out_of_time=None):
+        """Продвигает каждую незавершенную игру на due ходов.
+
+        Возвращает пару: множество индексов изменившихся игр и число
+        выполненных ходов на игру. out_of_time проверяется после каждого круга."""
+        dirty = set()
+        done = 0
+
+        while done < due:
+            chunk = min(self.CHUNK, due - done)
+            active = False
+            finished = []
+
+            for index, board in enumerate(self.boards):
+                if board['place'] is not None:
+                    continue
+
+                engine = board['engine']
+                if engine.step(chunk):
+                    dirty.add(index)
+                    active = True
+
+                if engine.finished:
+                    finished.append((engine.ticks, index))
+
+            # Игры одного круга, закончившиеся раньше, получают места выше
+            for _, index in sorted(finished):
+                self.finish_order.append(index)
+                self.boards[index]['place'] = len(self.finish_order)
+
+            done += chunk
+
+            if not active or (out_of_time and out_of_time()):
+                break
+
+        return dirty, done
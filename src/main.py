@@ -1,12 +1,267 @@
+import time
+
+# Начало отсчета для --profile-startup, до остальных импортов
+STARTED = time.perf_counter()
+
 import sys
+import json
+import argparse
+
+from game.engine import GameEngine, DEFAULT_MAX_TICKS
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Рыбаки")
+    parser.add_argument('--headless', action='store_true',
+                        help="запуск игры без окна с выводом результата в JSON")
+    parser.add_argument('--config', default='src/config.json',
+                        help="файл с начальным состоянием игры")
+    parser.add_argument('--seed', type=int, default=None,
+                        help="зерно генератора случайных чисел")
+    parser.add_argument('--ticks', type=int, default=None,
+                        help=f"максимальное число ходов (по умолчанию {DEFAULT_MAX_TICKS}); "
+                             "незавершенная игра отмечается finished: false")
+    parser.add_argument('--games', type=int, default=None,
+                        help="число одновременно симулируемых игр (требуется numpy)")
+    parser.add_argument('--check', action='store_true',
+                        help="сравнить распределения векторизованной и пошаговой симуляции")
+    parser.add_argument('--record', default=None,
+                        help="каталог для журнала партии (только для одной игры)")
+    parser.add_argument('--profile-startup', action='store_true',
+                        help="вывести время этапов запуска окна и выйти")
+    parser.add_argument('--output', default=None,
+                        help="файл для результата (по умолчанию stdout)")
+    parser.add_argument('--solve', action='store_true',
+                        help="точное распределение длины игры по цепи Маркова; "
+                             "с --games сравнивается с симуляцией")
+    parser.add_argument('--sweep', nargs='+', default=None, metavar='SCENARIO',
+                        help="перебор сетки: файлы сценариев (JSON или .fshs)")
+    parser.add_argument('--alarms', default='0:50:5',
+                        help="сетка вероятностей аварии для --sweep, например 0,5,10 или 0:50:5")
+    parser.add_argument('--speeds', default=None,
+                        help="сетка скоростей для --sweep: добавляет длительность игры в окне")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="число процессов для --sweep (по умолчанию все ядра)")
+    parser.add_argument('--chunk', type=int, default=None,
+                        help="игр в одной пачке --sweep")
+    parser.add_argument('--resume', action='store_true',
+                        help="продолжить прерванный --sweep с файла --output")
+    parser.add_argument('--summary', default=None,
+                        help="файл JSON для сводки --sweep")
+    parser.add_argument('--control', default=None, metavar='ADDRESS',
+                        help="локальный сервер управления: порт, 127.0.0.1:порт или unix:путь")
+
+    return parser.parse_known_args()
+
+def run_sweep(args):
+    from game.sweep import Sweep, parse_grid, format_summary, DEFAULT_CHUNK
+
+    sweep = Sweep(
+        args.sweep, parse_grid(args.alarms), args.games or 1000,
+        seed=args.seed or 0,
+        chunk=args.chunk or DEFAULT_CHUNK,
+        max_ticks=args.ticks or DEFAULT_MAX_TICKS
+    )
+
+    started = time.perf_counter()
+
+    def progress(done, total):
+        elapsed = time.perf_counter() - started
+        sys.stderr.write(f"\r{done}/{total} пачек, {elapsed:.1f} с")
+        sys.stderr.flush()
+
+    results = sweep.run(args.output or 'sweep.ndjson', args.workers, args.resume, progress)
+    sys.stderr.write('\n')
+
+    speeds = parse_grid(args.speeds) if args.speeds else ()
+    rows = sweep.summary(results, speeds)
+    print(format_summary(rows))
+
+    if args.summary:
+        with open(args.summary, 'w', encoding='utf-8') as f:
+            json.dump(rows, f, ensure_ascii=False, indent=4)
+
+def run_solver(args):
+    from game.markov import MarkovSolver, summarize_distribution
+
+    engine = GameEngine.from_file(args.config)
+    if engine.weights is not None:
+        raise SystemExit("Точное решение поддерживает только рыбаков без весов улова")
+
+    counts = list(engine.initial_counts)
+
+    try:
+        solver = MarkovSolver(len(counts), engine.alarm)
+        result = {
+            'fishers': len(counts),
+            'alarm': engine.alarm,
+            'expected_ticks': solver.expected_ticks(counts),
+            'distribution': summarize_distribution(solver.distribution(counts)),
+        }
+    except ValueError as error:
+        raise SystemExit(f"Точное решение не найдено: {error}")
+
+    if args.games:
+        import numpy as np
+        from game.ensemble import Ensemble
+
+        ensemble = Ensemble(counts, engine.alarm, args.games, seed=args.seed)
+        ensemble.run_until_complete(max_ticks=args.ticks or DEFAULT_MAX_TICKS)
+
+        # Отклонение среднего симуляции от точного ожидания в стандартных ошибках
+        error = float(ensemble.ticks.std(ddof=1) / np.sqrt(args.games))
+        mean = float(ensemble.ticks.mean())
+        result['simulated'] = {
+            'games': args.games,
+            'mean': mean,
+            'stderr': error,
+            'z': (mean - result['expected_ticks']) / error if error else 0.0,
+        }
+
+    write_result(args, result)
+
+def run_headless(args):
+    engine = GameEngine.from_file(args.config, seed=args.seed)
+
+    if args.games or args.check:
+        result = run_ensemble(args, engine)
+    else:
+        recorder = None
+        if args.record:
+            from game.event_log import EventLogWriter
+            recorder = EventLogWriter(args.record, engine)
+            engine.recorders.append(recorder)
+
+        engine.run_until_complete(max_ticks=args.ticks or DEFAULT_MAX_TICKS)
+
+        if recorder is not None:
+            recorder.close()
+
+        result = engine.to_dict()
+        result.update({
+            'seed': args.seed,
+            'game_seed': engine.seed,
+            'ticks': engine.ticks,
+            'catches': engine.catches,
+            'alarms': engine.alarms,
+            'finished': engine.finished,
+        })
+
+    write_result(args, result)
 
-from PyQt6.QtWidgets import QApplication
-from windows.main_window import MainWindow
+def run_ensemble(args, engine):
+    from game.ensemble import Ensemble, check_equivalence, summarize
+
+    n_games = args.games or 2000
+
+    if args.check:
+        return check_equivalence(
+            engine.initial_counts, engine.alarm, n_games,
+            seed=args.seed or 0, weights=engine.weights,
+            max_ticks=args.ticks or DEFAULT_MAX_TICKS
+        )
+
+    ensemble = Ensemble(
+        engine.initial_counts, engine.alarm, n_games,
+        seed=args.seed, weights=engine.weights
+    )
+    ensemble.run_until_complete(max_ticks=args.ticks or DEFAULT_MAX_TICKS)
+
+    result = ensemble.to_dict()
+    result.update({
+        'seed': args.seed,
+        'speed': engine.speed,
+        'summary': summarize(ensemble.ticks),
+    })
+    return result
+
+def write_result(args, result):
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False, indent=4)
+    else:
+        json.dump(result, sys.stdout, ensure_ascii=False, indent=4)
+        sys.stdout.write('\n')
+
+class StartupProfiler:
+    """Длительность этапов запуска: каждый этап отсчитывается от конца предыдущего"""
+
+    def __init__(self, started):
+        self.started = started
+        self.last = started
+        self.phases = []
+
+    def mark(self, phase):
+        now = time.perf_counter()
+        self.phases.append((phase, now - self.last))
+        self.last = now
+
+    def report(self, stream=sys.stdout):
+        for phase, seconds in self.phases:
+            stream.write(f"{phase:<14} {seconds * 1000:8.1f} ms\n")
+        stream.write(f"{'total':<14} {(self.last - self.started) * 1000:8.1f} ms\n")
+
+
+def watch_first_paint(app, window, callback):
+    """Вызывает callback, когда поле рыбаков впервые нарисовано"""
+    from PyQt6.QtCore import QObject, QEvent, QTimer
+
+    class FirstPaintFilter(QObject):
+        def eventFilter(self, watched, event):
+            if event.type() == QEvent.Type.Paint and watched.isWidgetType() \
+                    and window.area_container.isAncestorOf(watched):
+                app.removeEventFilter(self)
+                # Отметка ставится после того, как кадр дорисован
+                QTimer.singleShot(0, callback)
+            return False
+
+    paint_filter = FirstPaintFilter(app)
+    app.installEventFilter(paint_filter)
+    return paint_filter
 
 def main():
-    app = QApplication(sys.argv)
+    args, qt_args = parse_args()
+
+    if args.sweep:
+        run_sweep(args)
+        return
+
+    if args.solve:
+        run_solver(args)
+        return
+
+    if args.headless:
+        run_headless(args)
+        return
+
+    profiler = StartupProfiler(STARTED) if args.profile_startup else None
+
+    from PyQt6.QtWidgets import QApplication
+    from windows.main_window import MainWindow
+
+    if profiler:
+        profiler.mark('imports')
+
+    app = QApplication(sys.argv[:1] + qt_args)
+
+    if profiler:
+        profiler.mark('QApplication')
+
+    main_window = MainWindow(profile=profiler.mark if profiler else None)
+
+    if args.control:
+        try:
+            main_window.start_control(args.control)
+        except (OSError, ValueError) as error:
+            raise SystemExit(f"Не удалось запустить сервер управления: {error}")
+
+    if profiler:
+        def first_paint():
+            profiler.mark('first paint')
+            profiler.report()
+            app.quit()
+
+        watch_first_paint(app, main_window, first_paint)
 
-    main_window = MainWindow()
     main_window.show()
 
     app.exec()
@@ -0,0 +1,30 @@
+from PyQt6.QtCore import QRectF
+from PyQt6.QtGui import QPainter, QColor, QPen
+from PyQt6.QtWidgets import QWidget
+
+LAMP_OFF = (QColor("#d1d5db"), QColor("#9ca3af"))
+LAMP_ON = (QColor("#ef4444"), QColor("#dc2626"))
+
+
+class AlarmLamp(QWidget):
+    """Аварийная лампа: два заранее заданных состояния без таблиц стилей"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.is_on = False
+        self.setFixedSize(20, 20)
+
+    def set_on(self, is_on):
+        if is_on != self.is_on:
+            self.is_on = is_on
+            self.update()
+
+    def paintEvent(self, event):
+        fill, border = LAMP_ON if self.is_on else LAMP_OFF
+
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(QPen(border, 1))
+        painter.setBrush(fill)
+        painter.drawEllipse(QRectF(self.rect()).adjusted(0.5, 0.5, -0.5, -0.5))
+        painter.end()
@@ -0,0 +1,195 @@
+from PyQt6.QtCore import QObject, QTimer, QElapsedTimer, QEasingCurve
+
+QUALITY_REDUCED = 0
+QUALITY_FULL = 1
+
+
+class AnimationDriver(QObject):
+    """Единый кадровый таймер для анимаций рыбаков и аварийной лампы.
+
+    Анимации живут в фиксированном пуле слотов. Повторное событие для рыбака,
+    который уже анимируется, перезапускает его слот, а не создает новую анимацию.
+    Поле получает только смещение рисунка и признак аварии через
+    set_fisher_offset(index, offset) и set_alarm_state(index, is_alarm)."""
+
+    FRAME_INTERVAL = 16
+    MOVE_DURATION = 300
+    MOVE_DISTANCE = 20
+    ALARM_DURATION = 500
+    LAMP_DURATION = 500
+
+    # Порог опоздания кадров, после которого отключается движение рыбаков
+    DEGRADE_FACTOR = 1.5
+    RESTORE_FACTOR = 1.15
+    RESTORE_FRAMES = 60
+
+    def __init__(self, pool_size=64, parent=None):
+        super().__init__(parent)
+
+        self.board = None
+        self.lamp = None
+        self.lamp_until = None
+
+        self.pool = [self.empty_slot() for _ in range(pool_size)]
+        self.free = list(self.pool)
+        self.active = {}
+
+        self.quality = QUALITY_FULL
+        self.frame_average = float(self.FRAME_INTERVAL)
+        self.good_frames = 0
+        self.last_frame = None
+
+        self.easing = QEasingCurve(QEasingCurve.Type.OutInQuad)
+        self.clock = QElapsedTimer()
+        self.clock.start()
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(self.FRAME_INTERVAL)
+        self.timer.timeout.connect(self.advance)
+
+    @staticmethod
+    def empty_slot():
+        return {'index': -1, 'move_start': None, 'alarm_until': None, 'offset': 0}
+
+    @property
+    def active_count(self):
+        return len(self.active)
+
+    def set_board(self, board):
+        self.clear()
+        self.board = board
+
+    def set_lamp(self, lamp):
+        self.lamp = lamp
+
+    def acquire(self, index):
+        """Слот рыбака: уже занятый им, свободный или самый старый из занятых"""
+        slot = self.active.get(index)
+        if slot is not None:
+            return slot
+
+        if self.free:
+            slot = self.free.pop()
+        else:
+            slot = min(self.active.values(), key=lambda s: s['move_start'] or 0)
+            self.release(slot)
+            self.free.remove(slot)
+
+        slot['index'] = index
+        self.active[index] = slot
+        return slot
+
+    def release(self, slot):
+        if self.board is not None:
+            if slot['offset']:
+                self.board.set_fisher_offset(slot['index'], 0)
+            if slot['alarm_until'] is not None:
+                self.board.set_alarm_state(slot['index'], False)
+
+        del self.active[slot['index']]
+        slot.update(self.empty_slot())
+        self.free.append(slot)
+
+    def animate_catch(self, index):
+        slot = self.acquire(index)
+        slot['move_start'] = self.clock.elapsed()
+        self.start()
+
+    def animate_alarm(self, index):
+        slot = self.acquire(index)
+        now = self.clock.elapsed()
+        slot['move_start'] = now
+        slot['alarm_until'] = now + self.ALARM_DURATION
+
+        if self.board is not None:
+            self.board.set_alarm_state(index, True)
+        self.start()
+
+    def trigger_lamp(self):
+        self.lamp_until = self.clock.elapsed() + self.LAMP_DURATION
+        if self.lamp is not None:
+            self.lamp.set_on(True)
+        self.start()
+
+    def clear(self):
+        """Сбрасывает все анимации, например при сбросе или смене поля"""
+        for slot in list(self.active.values()):
+            self.release(slot)
+
+        self.lamp_until = None
+        if self.lamp is not None:
+            self.lamp.set_on(False)
+
+        self.timer.stop()
+        self.last_frame = None
+
+    def start(self):
+        if not self.timer.isActive():
+            self.last_frame = None
+            self.timer.start()
+
+    def move_offset(self, slot, now):
+        started = slot['move_start']
+        if started is None:
+            return 0
+
+        # Окончание движения отмечается при любом качестве, иначе ячейка не освободится
+        progress = (now - started) / self.MOVE_DURATION
+        if progress >= 1:
+            slot['move_start'] = None
+            return 0
+        if self.quality == QUALITY_REDUCED:
+            return 0
+
+        # Вниз на MOVE_DISTANCE к середине анимации и обратно
+        value = self.easing.valueForProgress(progress)
+        if value <= 0.5:
+            return round(self.MOVE_DISTANCE * value * 2)
+        return round(self.MOVE_DISTANCE * (1 - value) * 2)
+
+    def measure_frame(self, now):
+        """Следит за опозданием кадров и понижает или восстанавливает качество"""
+        if self.last_frame is not None:
+            interval = now - self.last_frame
+            self.frame_average += (interval - self.frame_average) * 0.1
+
+            if self.frame_average > self.FRAME_INTERVAL * self.DEGRADE_FACTOR:
+                self.quality = QUALITY_REDUCED
+                self.good_frames = 0
+            elif self.frame_average < self.FRAME_INTERVAL * self.RESTORE_FACTOR:
+                self.good_frames += 1
+                if self.good_frames >= self.RESTORE_FRAMES:
+                    self.quality = QUALITY_FULL
+
+        self.last_frame = now
+
+    def advance(self):
+        now = self.clock.elapsed()
+        self.measure_frame(now)
+
+        board = self.board
+
+        for slot in list(self.active.values()):
+            index = slot['index']
+
+            offset = self.move_offset(slot, now)
+            if offset != slot['offset']:
+                slot['offset'] = offset
+                if board is not None:
+                    board.set_fisher_offset(index, offset)
+
+            if slot['alarm_until'] is not None and now >= slot['alarm_until']:
+                slot['alarm_until'] = None
+                if board is not None:
+                    board.set_alarm_state(index, False)
+
+            if slot['move_start'] is None and slot['alarm_until'] is None:
+                self.release(slot)
+
+        if self.lamp_until is not None and now >= self.lamp_until:
+            self.lamp_until = None
+            if self.lamp is not None:
+                self.lamp.set_on(False)
+
+        if not self.active and self.lamp_until is None:
+            self.timer.stop()
@@ -0,0 +1,418 @@
+import math
+
+from PyQt6.QtCore import Qt, QRect, QRectF
+from PyQt6.QtGui import QPainter, QColor, QFont, QStaticText
+from PyQt6.QtWidgets import QAbstractScrollArea, QFrame, QStyle
+
+from game.engine import TARGET_COUNT
+from widgets.fisher_area import FisherArea
+from widgets.fisher_cache import fisher_cache
+
+BACKGROUND_COLOR = QColor("#dbeafe")
+BORDER_COLOR = QColor("#e2e8f0")
+COUNT_COLOR = QColor("black")
+COMPLETED_COUNT_COLOR = QColor("#16a34a")
+ALARM_COUNT_COLOR = QColor("#ef4444")
+HEAD_COLOR = QColor("#FED7AA")
+HISTOGRAM_COLOR = QColor("#7c3aed")
+
+# Уровни детализации от полного рисунка до гистограммы всего поля
+LOD_FULL = 0
+LOD_SILHOUETTE = 1
+LOD_BAR = 2
+LOD_HISTOGRAM = 3
+
+# Наименьшая ширина слота рыбака в пикселях для каждого уровня
+SILHOUETTE_PITCH = 56
+BAR_PITCH = 20
+HISTOGRAM_PITCH = 3
+# Под столбиком помещается счетчик
+BAR_LABEL_PITCH = 12
+
+ZOOM_STEP = 1.25
+MIN_ZOOM = 0.01
+
+
+class BoardWidget(QAbstractScrollArea):
+    """Поле рыбаков, целиком рисуемое одним виджетом.
+
+    Счетчики, рыбаки и подсветка рисуются в paintEvent по состоянию модели,
+    а ход игры перерисовывает только прямоугольник изменившегося рыбака.
+    Поле масштабируется (Ctrl + колесо мыши), и по мере уменьшения слота
+    рыбак рисуется все проще: рисунок, силуэт, столбик со счетчиком и,
+    наконец, общая гистограмма счетчиков, стоимость которой от числа
+    рыбаков не зависит."""
+
+    SLOT_WIDTH = FisherArea.SLOT_WIDTH
+    SPACING = FisherArea.SPACING
+    MARGIN = FisherArea.MARGIN
+
+    FISHER_WIDTH = 112
+    FISHER_HEIGHT = 220
+    LABEL_HEIGHT = 34
+    LABEL_SPACING = 10
+
+    TRAVEL = FisherArea.TRAVEL
+    CHART_HEIGHT = 240
+
+    def __init__(self, model, parent=None):
+        super().__init__(parent)
+
+        self.model = model
+        self.zoom = 1.0
+        self.base_pitch = self.SLOT_WIDTH + self.SPACING
+        self.pitch = self.base_pitch
+        self.scale = 1.0
+        self.lod = LOD_FULL
+
+        # Показанные счетчики и их гистограмма, обновляемые по одному рыбаку
+        self.shown = bytearray()
+        self.histogram = [0] * (TARGET_COUNT + 1)
+
+        self.setFrameShape(QFrame.Shape.NoFrame)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.viewport().setAutoFillBackground(False)
+
+        self.count_font = QFont()
+        self.count_font.setBold(True)
+        self.static_texts = {}
+        self.colors = {}
+
+        # Состояние анимаций, которое задает AnimationDriver
+        self.offsets = {}
+        self.alarmed = set()
+
+        self.resync()
+
+    def fisher_count(self):
+        return len(self.model.counts)
+
+    def static_text(self, text):
+        static = self.static_texts.get(text)
+        if static is None:
+            static = QStaticText(text)
+            static.setTextFormat(Qt.TextFormat.PlainText)
+            static.prepare(font=self.count_font)
+            self.static_texts[text] = static
+        return static
+
+    def color(self, name):
+        color = self.colors.get(name)
+        if color is None:
+            color = self.colors[name] = QColor(name)
+        return color
+
+    def slot_height(self):
+        return (self.LABEL_HEIGHT + self.LABEL_SPACING + self.FISHER_HEIGHT) * self.scale
+
+    def slot_top(self):
+        return max(0, int(self.viewport().height() - self.slot_height()) // 2)
+
+    def slot_x(self, index):
+        return self.MARGIN + index * self.pitch - self.horizontalScrollBar().value()
+
+    def slot_rect(self, index):
+        if self.lod >= LOD_BAR:
+            return QRect(int(self.slot_x(index)), 0, math.ceil(self.pitch) + 1, self.viewport().height())
+
+        height = self.slot_height() + self.TRAVEL * self.scale
+        return QRect(int(self.slot_x(index)), self.slot_top(), math.ceil(self.pitch), math.ceil(height))
+
+    def visible_range(self, left, right):
+        """Индексы рыбаков, пересекающих полосу [left, right] в координатах окна"""
+        scroll = self.horizontalScrollBar().value()
+        first = max(0, int((left + scroll - self.MARGIN) // self.pitch))
+        last = min(self.fisher_count() - 1, int((right + scroll - self.MARGIN) // self.pitch))
+        return first, last
+
+    def is_visible(self, index):
+        first, last = self.visible_range(0, self.viewport().width())
+        return first <= index <= last
+
+    def available_width(self):
+        return max(0, self.viewport().width() - 2 * self.MARGIN + self.SPACING)
+
+    def refresh(self):
+        """Заново читает модель целиком, например после сброса или загрузки"""
+        self.offsets.clear()
+        self.alarmed.clear()
+        self.resync()
+        self.relayout()
+
+    def resync(self):
+        """Пересчитывает показанные счетчики и гистограмму по модели"""
+        self.shown = bytearray(min(count, TARGET_COUNT) for count in self.model.counts)
+        self.histogram = [self.shown.count(value) for value in range(TARGET_COUNT + 1)]
+        self.viewport().update()
+
+    def relayout(self):
+        """Шаг слота и уровень детализации для текущего масштаба и размера окна"""
+        count = self.fisher_count()
+        available = self.available_width()
+
+        self.pitch = self.base_pitch * self.zoom
+        if count and count * self.pitch <= available:
+            self.pitch = available / count
+
+        if self.pitch >= SILHOUETTE_PITCH:
+            self.lod = LOD_FULL
+        elif self.pitch >= BAR_PITCH:
+            self.lod = LOD_SILHOUETTE
+        elif self.pitch >= HISTOGRAM_PITCH:
+            self.lod = LOD_BAR
+        else:
+            self.lod = LOD_HISTOGRAM
+
+        self.scale = min(1.0, self.pitch / self.base_pitch)
+        if self.lod == LOD_BAR:
+            font_size = 9
+        else:
+            font_size = max(9, round(18 * self.scale))
+        if self.count_font.pixelSize() != font_size:
+            self.count_font.setPixelSize(font_size)
+            self.static_texts.clear()
+
+        # Гистограмма показывает все поле сразу, прокручивать нечего
+        content = 0 if self.lod == LOD_HISTOGRAM else math.ceil(count * self.pitch - available)
+
+        scroll_bar = self.horizontalScrollBar()
+        scroll_bar.setRange(0, max(0, content))
+        scroll_bar.setPageStep(max(1, available))
+        scroll_bar.setSingleStep(max(1, int(self.pitch)))
+
+        self.viewport().update()
+
+    def set_zoom(self, zoom, anchor=None):
+        """Меняет масштаб, оставляя на месте рыбака под точкой anchor (x в окне)"""
+        # Мельче, чем нужно, чтобы все поле поместилось, масштаб не становится
+        fit = self.available_width() / (max(1, self.fisher_count()) * self.base_pitch)
+        zoom = min(1.0, max(MIN_ZOOM, min(1.0, fit), zoom))
+        if zoom == self.zoom:
+            return
+
+        if anchor is None:
+            anchor = self.viewport().width() / 2
+        scroll_bar = self.horizontalScrollBar()
+        position = (anchor + scroll_bar.value() - self.MARGIN) / self.pitch
+
+        self.zoom = zoom
+        self.relayout()
+
+        scroll_bar.setValue(round(position * self.pitch + self.MARGIN - anchor))
+
+    def zoom_in(self):
+        self.set_zoom(self.zoom * ZOOM_STEP)
+
+    def zoom_out(self):
+        self.set_zoom(self.zoom / ZOOM_STEP)
+
+    def zoom_to_fit(self):
+        count = max(1, self.fisher_count())
+        self.set_zoom(self.available_width() / (count * self.base_pitch))
+
+    def update_index(self, index):
+        count = min(self.model.counts[index], TARGET_COUNT)
+        old_count = self.shown[index]
+        if count != old_count:
+            self.shown[index] = count
+            self.histogram[old_count] -= 1
+            self.histogram[count] += 1
+
+        if self.lod == LOD_HISTOGRAM:
+            self.viewport().update()
+        elif self.is_visible(index):
+            self.viewport().update(self.slot_rect(index))
+
+    def set_fisher_offset(self, index, offset):
+        if offset:
+            self.offsets[index] = offset
+        else:
+            self.offsets.pop(index, None)
+
+        # Смещение рисунка видно только на двух подробных уровнях
+        if self.lod <= LOD_SILHOUETTE and self.is_visible(index):
+            self.viewport().update(self.slot_rect(index))
+
+    def set_alarm_state(self, index, is_alarm):
+        if is_alarm:
+            self.alarmed.add(index)
+        else:
+            self.alarmed.discard(index)
+
+        if self.lod != LOD_HISTOGRAM and self.is_visible(index):
+            self.viewport().update(self.slot_rect(index))
+
+    def count_pen(self, index, count):
+        if index in self.alarmed:
+            return ALARM_COUNT_COLOR
+        if count >= TARGET_COUNT:
+            return COMPLETED_COUNT_COLOR
+        return COUNT_COLOR
+
+    def paintEvent(self, event):
+        exposed = event.rect()
+
+        painter = QPainter(self.viewport())
+        painter.fillRect(exposed, BACKGROUND_COLOR)
+        painter.setPen(BORDER_COLOR)
+        painter.drawLine(exposed.left(), 0, exposed.right(), 0)
+        painter.setFont(self.count_font)
+
+        if self.lod == LOD_HISTOGRAM:
+            self.paint_histogram(painter)
+        else:
+            first, last = self.visible_range(exposed.left(), exposed.right())
+            if self.lod == LOD_FULL:
+                self.paint_fishers(painter, first, last)
+            elif self.lod == LOD_SILHOUETTE:
+                self.paint_silhouettes(painter, first, last)
+            else:
+                self.paint_bars(painter, first, last)
+
+        painter.end()
+
+    def paint_count(self, painter, index, count, x, top, width, height):
+        painter.setPen(self.count_pen(index, count))
+        static = self.static_text(str(count))
+        size = static.size()
+        painter.drawStaticText(
+            int(x + (width - size.width()) / 2), int(top + (height - size.height()) / 2), static
+        )
+
+    def paint_fishers(self, painter, first, last):
+        """Полный рисунок рыбака из кэша растровых изображений"""
+        counts = self.model.counts
+        colors = self.model.colors
+        scale = self.scale
+
+        margin = self.style().pixelMetric(QStyle.PixelMetric.PM_LayoutLeftMargin, None, self)
+        ratio = self.viewport().devicePixelRatioF()
+        fisher_width = round(self.FISHER_WIDTH * scale)
+        pixmap_width = fisher_width - 2 * margin
+        pixmap_height = round(self.FISHER_HEIGHT * scale) - 2 * margin
+
+        top = self.slot_top()
+        label_height = self.LABEL_HEIGHT * scale
+        fisher_top = top + label_height + self.LABEL_SPACING * scale + margin
+        slot_width = self.pitch - self.SPACING * scale
+        offsets = self.offsets
+
+        for index in range(first, last + 1):
+            x = self.slot_x(index)
+            self.paint_count(painter, index, counts[index], x, top, slot_width, label_height)
+
+            pixmap = fisher_cache.pixmap(colors[index], pixmap_width, pixmap_height, ratio)
+            fisher_left = x + (slot_width - fisher_width) / 2 + margin
+            painter.drawPixmap(
+                int(fisher_left), int(fisher_top + offsets.get(index, 0) * scale), pixmap
+            )
+
+    def paint_silhouettes(self, painter, first, last):
+        """Упрощенный рыбак: голова и туловище без удочки"""
+        counts = self.model.counts
+        colors = self.model.colors
+        scale = self.scale
+
+        top = self.slot_top()
+        label_height = self.LABEL_HEIGHT * scale
+        fisher_top = top + label_height + self.LABEL_SPACING * scale
+        slot_width = self.pitch - self.SPACING * scale
+
+        # Пропорции взяты из рисунка рыбака 115 x 235
+        unit = self.FISHER_HEIGHT * scale / 235
+        body_width = 110 * unit
+        offsets = self.offsets
+
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        for index in range(first, last + 1):
+            x = self.slot_x(index)
+            self.paint_count(painter, index, counts[index], x, top, slot_width, label_height)
+
+            left = x + (slot_width - body_width) / 2
+            y = fisher_top + offsets.get(index, 0) * scale
+
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(HEAD_COLOR)
+            painter.drawEllipse(QRectF(left + 25 * unit, y + 62 * unit, 60 * unit, 60 * unit))
+            painter.setBrush(self.color(colors[index]))
+            painter.drawRoundedRect(
+                QRectF(left, y + 127 * unit, body_width, 106 * unit), 30 * unit, 30 * unit
+            )
+
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, False)
+
+    def chart_rect(self, label_height):
+        """Область столбиков по центру окна: высота ограничена, чтобы заливка оставалась дешевой"""
+        height = min(self.CHART_HEIGHT, self.viewport().height() - 2 * self.MARGIN - 2 * label_height)
+        top = (self.viewport().height() - height) // 2
+        return QRect(self.MARGIN, top, self.viewport().width() - 2 * self.MARGIN, max(1, height))
+
+    def paint_bars(self, painter, first, last):
+        """Столбик цвета рыбака высотой по счетчику, под ним — счетчик, если помещается"""
+        counts = self.model.counts
+        colors = self.model.colors
+
+        label_height = 16 if self.pitch >= BAR_LABEL_PITCH else 0
+        chart = self.chart_rect(label_height)
+        bottom = chart.bottom()
+        bar_width = max(1, int(self.pitch * 0.75))
+        fill_rect = painter.fillRect
+
+        painter.drawLine(chart.left(), bottom + 1, chart.right(), bottom + 1)
+
+        for index in range(first, last + 1):
+            x = int(self.slot_x(index))
+            count = counts[index]
+
+            level = round(chart.height() * min(count, TARGET_COUNT) / TARGET_COUNT)
+            if level:
+                color = ALARM_COUNT_COLOR if index in self.alarmed else self.color(colors[index])
+                fill_rect(x, bottom - level + 1, bar_width, level, color)
+
+            if label_height:
+                self.paint_count(painter, index, count, x, bottom + 2, bar_width, label_height)
+
+    def paint_histogram(self, painter):
+        """Сколько рыбаков стоит на каждом счетчике; последний столбец — завершившие"""
+        label_height = 20
+        chart = self.chart_rect(label_height)
+        histogram = self.histogram
+        total = max(1, max(histogram))
+
+        pitch = chart.width() / len(histogram)
+        bar_width = max(1, int(pitch * 0.7))
+        bottom = chart.bottom()
+
+        painter.setPen(COUNT_COLOR)
+        for value, fishers in enumerate(histogram):
+            x = int(chart.left() + value * pitch + (pitch - bar_width) / 2)
+            level = round(chart.height() * fishers / total)
+
+            color = COMPLETED_COUNT_COLOR if value == TARGET_COUNT else HISTOGRAM_COLOR
+            painter.fillRect(x, bottom - level + 1, bar_width, level, color)
+
+            painter.drawText(
+                QRect(x, bottom - level - label_height, bar_width, label_height),
+                Qt.AlignmentFlag.AlignCenter, str(fishers)
+            )
+            painter.drawText(
+                QRect(x, bottom + 2, bar_width, label_height), Qt.AlignmentFlag.AlignCenter, str(value)
+            )
+
+    def wheelEvent(self, event):
+        if event.modifiers() & Qt.KeyboardModifier.ControlModifier:
+            steps = event.angleDelta().y() / 120
+            if steps:
+                self.set_zoom(self.zoom * ZOOM_STEP ** steps, event.position().x())
+            return
+
+        super().wheelEvent(event)
+
+    def scrollContentsBy(self, dx, dy):
+        self.viewport().update()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.relayout()
@@ -0,0 +1,136 @@
+from PyQt6.QtCore import QThread, pyqtSignal
+from PyQt6.QtWidgets import QLabel
+
+from game.engine import STALL_ALARM
+
+# Дольше решение в фоне не строится: процессор нужнее игре
+SOLVE_SECONDS = 30
+
+
+class SolverWorker(QThread):
+    """Строит решение цепи Маркова вне потока интерфейса"""
+
+    solved = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+    def __init__(self, key, cache_dir, parent=None):
+        super().__init__(parent)
+
+        self.key = key
+        self.cache_dir = cache_dir
+
+    def run(self):
+        # Решатель тянет numpy, поэтому и проверка, и импорт идут в этом потоке
+        from game.markov import MarkovSolver, SolverCancelled, is_solvable
+
+        size, alarm, uniform = self.key
+        if not uniform or not is_solvable(size):
+            self.failed.emit("")
+            return
+
+        try:
+            solver = MarkovSolver(size, alarm, self.cache_dir)
+            solver.expected(self.isInterruptionRequested, SOLVE_SECONDS)
+        except SolverCancelled:
+            return
+        except (OSError, ValueError) as error:
+            self.failed.emit(str(error))
+            return
+
+        self.solved.emit(solver)
+
+
+def format_duration(seconds):
+    minutes, seconds = divmod(round(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"{hours}:{minutes:02d}:{seconds:02d}"
+    return f"{minutes}:{seconds:02d}"
+
+
+class EtaLabel(QLabel):
+    """Точное ожидаемое число оставшихся ходов и время до конца игры.
+
+    Решение для текущего размера поля и вероятности аварии строится в
+    фоновом потоке один раз, после чего обновление — поиск состояния в
+    таблице за несколько микросекунд."""
+
+    def __init__(self, engine, cache_dir, parent=None):
+        super().__init__(parent)
+
+        self.engine = engine
+        self.cache_dir = cache_dir
+        self.solver = None
+        self.worker = None
+        self.failed_key = None
+        self.seconds_per_tick = 0.0
+
+        self.setFixedWidth(150)
+        self.setStyleSheet("font-size: 12px; color: #4b5563; border: none;")
+
+    def key(self):
+        return len(self.engine.counts), self.engine.alarm, self.engine.weights is None
+
+    def refresh(self, seconds_per_tick=None):
+        """Пересчитывает оценку для текущего состояния движка"""
+        if seconds_per_tick is not None:
+            self.seconds_per_tick = seconds_per_tick
+
+        engine = self.engine
+        solver = self.solver
+
+        if solver is None or (solver.size, solver.alarm, True) != self.key():
+            self.request_solver()
+            return
+
+        remaining = solver.expected_ticks(engine.counts)
+        text = f"≈ {remaining:.0f} ход."
+        if self.seconds_per_tick:
+            text += f" · {format_duration(remaining * self.seconds_per_tick)}"
+        self.setText(text)
+
+    def request_solver(self):
+        key = self.key()
+        self.solver = None
+
+        if key == self.failed_key:
+            self.setText("")
+            return
+
+        # Решать нечего: игра не закончится, а проходы решателя заняли бы минуты
+        if self.engine.alarm >= STALL_ALARM:
+            self.setText("не завершится")
+            return
+
+        self.setText("≈ расчет…")
+
+        # Решение для прежних параметров достраивается, затем запускается новое
+        if self.worker is not None:
+            return
+
+        self.worker = SolverWorker(key, self.cache_dir, self)
+        self.worker.solved.connect(self.on_solved)
+        self.worker.failed.connect(self.on_failed)
+        self.worker.finished.connect(self.on_finished)
+        self.worker.start()
+
+    def on_solved(self, solver):
+        self.solver = solver
+
+    def on_failed(self, message):
+        self.failed_key = self.worker.key
+        self.setToolTip(message)
+
+    def on_finished(self):
+        self.worker.deleteLater()
+        self.worker = None
+        self.refresh()
+
+    def stop(self):
+        """Прерывает расчет; отложенный сигнал завершения уже не запустит новый"""
+        if self.worker is not None:
+            self.worker.requestInterruption()
+            self.worker.wait()
+            self.worker.finished.disconnect(self.on_finished)
+            self.worker.deleteLater()
+            self.worker = None
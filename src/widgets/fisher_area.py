@@ -0,0 +1,233 @@
+import math
+
+from PyQt6.QtCore import Qt, QEvent
+from PyQt6.QtGui import QPalette, QColor
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QScrollBar
+
+from game.engine import TARGET_COUNT
+from widgets.fisher import Fisher
+
+# Общая таблица стилей поля: разбирается один раз при создании области
+AREA_STYLE = """
+    QWidget {
+        background-color: #dbeafe;
+        border-top: 1px solid #e2e8f0;
+    }
+    QWidget#slot, QWidget#slot QWidget {
+        border: none;
+    }
+    QLabel#count {
+        font-size: 18px;
+        font-weight: bold;
+        padding: 5px;
+    }
+"""
+
+STATE_NORMAL = 'normal'
+STATE_COMPLETED = 'completed'
+STATE_ALARM = 'alarm'
+
+STATE_COLORS = {
+    STATE_NORMAL: "black",
+    STATE_COMPLETED: "#16a34a",
+    STATE_ALARM: "#ef4444",
+}
+
+_state_palettes = {}
+
+
+def state_palette(state, base):
+    """Заранее подготовленная палитра счетчика для визуального состояния"""
+    palette = _state_palettes.get(state)
+    if palette is None:
+        palette = QPalette(base)
+        palette.setColor(QPalette.ColorRole.WindowText, QColor(STATE_COLORS[state]))
+        _state_palettes[state] = palette
+    return palette
+
+
+class FisherArea(QWidget):
+    """Прокручиваемая область рыбаков произвольного размера.
+
+    Виджеты создаются только для рыбаков, попадающих в видимую часть,
+    и переназначаются на другие индексы при прокрутке."""
+
+    SLOT_WIDTH = 112
+    SLOT_HEIGHT = 300
+    TRAVEL = 20
+    SPACING = 16
+    MARGIN = 16
+
+    def __init__(self, model, parent=None):
+        super().__init__(parent)
+
+        self.model = model
+        self.slots = []
+        self.setStyleSheet(AREA_STYLE)
+        self.first = 0
+        self.pitch = self.SLOT_WIDTH + self.SPACING
+
+        self.viewport = QWidget()
+        self.viewport.installEventFilter(self)
+        self.scroll_bar = QScrollBar(Qt.Orientation.Horizontal)
+        self.scroll_bar.valueChanged.connect(self.on_scroll)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+        layout.addWidget(self.viewport, 1)
+        layout.addWidget(self.scroll_bar)
+
+    def fisher_count(self):
+        return len(self.model.counts)
+
+    def slot(self, index):
+        """Слот, в котором сейчас отображается рыбак, или None, если он не виден"""
+        position = index - self.first
+        if 0 <= position < len(self.slots):
+            character_data = self.slots[position]
+            if character_data['index'] == index:
+                return character_data
+        return None
+
+    def create_slot(self):
+        character_widget = QWidget(self.viewport)
+        character_widget.setObjectName('slot')
+        character_layout = QVBoxLayout()
+        character_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        character_layout.setSpacing(10)
+
+        count_label = QLabel("0")
+        count_label.setObjectName('count')
+        count_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        count_label.setPalette(state_palette(STATE_NORMAL, count_label.palette()))
+
+        fisher_widget = Fisher(travel=self.TRAVEL)
+        fisher_widget.setFixedSize(112, 220 + self.TRAVEL)
+
+        character_layout.addWidget(count_label)
+        character_layout.addWidget(fisher_widget)
+        character_widget.setLayout(character_layout)
+        character_widget.show()
+
+        return {
+            'widget': character_widget,
+            'fisher_widget': fisher_widget,
+            'count_label': count_label,
+            'state': STATE_NORMAL,
+            'index': -1
+        }
+
+    def release_slot(self, character_data):
+        """Сбрасывает смещение рисунка перед переназначением слота"""
+        character_data['fisher_widget'].set_offset(0)
+        character_data['index'] = -1
+
+    def refresh(self):
+        """Перестраивает пул слотов под текущий размер и заново заполняет его из модели"""
+        count = self.fisher_count()
+        available = max(0, self.viewport.width() - 2 * self.MARGIN + self.SPACING)
+
+        # Если все рыбаки помещаются, распределяем их по ширине, как раньше
+        self.pitch = self.SLOT_WIDTH + self.SPACING
+        if count and count * self.pitch <= available:
+            self.pitch = available / count
+
+        content_width = count * self.pitch
+        self.scroll_bar.blockSignals(True)
+        self.scroll_bar.setRange(0, max(0, math.ceil(content_width - available)))
+        self.scroll_bar.setPageStep(max(1, available))
+        self.scroll_bar.setSingleStep(int(self.pitch))
+        self.scroll_bar.blockSignals(False)
+        self.scroll_bar.setVisible(self.scroll_bar.maximum() > 0)
+
+        slot_count = min(count, math.ceil(available / self.pitch) + 1)
+
+        while len(self.slots) < slot_count:
+            self.slots.append(self.create_slot())
+
+        while len(self.slots) > slot_count:
+            character_data = self.slots.pop()
+            self.release_slot(character_data)
+            character_data['widget'].deleteLater()
+
+        for character_data in self.slots:
+            self.release_slot(character_data)
+
+        self.on_scroll(self.scroll_bar.value())
+
+    def on_scroll(self, value):
+        first = int(value // self.pitch)
+        offset = value - first * self.pitch
+        self.first = first
+
+        count = self.fisher_count()
+        top = max(0, (self.viewport.height() - self.SLOT_HEIGHT) // 2)
+        width = int(self.pitch) - self.SPACING
+
+        for position, character_data in enumerate(self.slots):
+            index = first + position
+            widget = character_data['widget']
+
+            if index >= count:
+                self.release_slot(character_data)
+                widget.hide()
+                continue
+
+            x = self.MARGIN + position * self.pitch - offset
+            widget.setGeometry(int(x), top, width, self.SLOT_HEIGHT)
+
+            if character_data['index'] != index:
+                self.release_slot(character_data)
+                self.bind(character_data, index)
+                widget.show()
+
+    def bind(self, character_data, index):
+        character_data['index'] = index
+        character_data['fisher_widget'].update_color(self.model.colors[index])
+        self.update_label(character_data, self.model.counts[index])
+
+    def set_state(self, character_data, state):
+        """Переключает цвет счетчика, только если состояние действительно изменилось"""
+        if character_data['state'] != state:
+            character_data['state'] = state
+            label = character_data['count_label']
+            label.setPalette(state_palette(state, label.palette()))
+
+    def update_label(self, character_data, count):
+        character_data['count_label'].setText(str(count))
+
+        if count >= TARGET_COUNT:
+            self.set_state(character_data, STATE_COMPLETED)
+        else:
+            self.set_state(character_data, STATE_NORMAL)
+
+    def update_index(self, index):
+        """Обновляет счетчик рыбака, если он сейчас виден"""
+        character_data = self.slot(index)
+        if character_data is not None:
+            self.update_label(character_data, self.model.counts[index])
+
+    def set_fisher_offset(self, index, offset):
+        character_data = self.slot(index)
+        if character_data is not None:
+            character_data['fisher_widget'].set_offset(offset)
+
+    def set_alarm_state(self, index, is_alarm):
+        """Красный счетчик на время аварии, затем обычный цвет по значению"""
+        character_data = self.slot(index)
+        if character_data is not None:
+            if is_alarm:
+                self.set_state(character_data, STATE_ALARM)
+            else:
+                self.update_label(character_data, self.model.counts[index])
+
+    def eventFilter(self, watched, event):
+        if watched is self.viewport and event.type() == QEvent.Type.Resize:
+            self.refresh()
+        return super().eventFilter(watched, event)
+
+    def wheelEvent(self, event):
+        delta = event.angleDelta()
+        steps = delta.y() or delta.x()
+        self.scroll_bar.setValue(self.scroll_bar.value() - steps * int(self.pitch) // 120)
@@ -0,0 +1,166 @@
+import time
+
+from PyQt6.QtCore import Qt, QObject, QEvent, QTimer, QRectF
+from PyQt6.QtGui import QPainter, QColor, QFont, QFontMetrics
+from PyQt6.QtWidgets import QWidget
+
+from game.stats import Histogram
+
+HUD_BACKGROUND = QColor(15, 23, 42, 200)
+HUD_TEXT = QColor("#e2e8f0")
+
+REFRESH_INTERVAL = 250
+
+
+class PerfMonitor(QObject):
+    """Замеры хода игры и кадров окна в гистограммы.
+
+    Главное окно вызывает tick_started/tick_finished вокруг обработчика
+    таймера игры, а кадры окна отмечаются фильтром событий UpdateRequest.
+    Монитор существует только пока показан HUD."""
+
+    def __init__(self, window):
+        super().__init__(window)
+
+        self.main_window = window
+
+        self.tick_duration = Histogram()
+        self.tick_interval = Histogram()
+        self.frame_interval = Histogram()
+        self.latency = Histogram()
+
+        self.last_tick = None
+        self.last_frame = None
+        self.tick_start = 0
+        self.pending_tick = None
+
+        window.installEventFilter(self)
+
+    def clear(self):
+        for histogram in (self.tick_duration, self.tick_interval, self.frame_interval, self.latency):
+            histogram.clear()
+        self.restart()
+
+    def restart(self):
+        """Таймер игры перезапущен: промежуток до следующего хода не считается"""
+        self.last_tick = None
+        self.pending_tick = None
+
+    def close(self):
+        self.main_window.removeEventFilter(self)
+
+    def tick_started(self):
+        now = time.perf_counter_ns()
+
+        if self.last_tick is not None:
+            self.tick_interval.record((now - self.last_tick) // 1000)
+        self.last_tick = now
+        self.tick_start = now
+
+        # Задержка до кадра отсчитывается от первого хода, еще не показанного на экране
+        if self.pending_tick is None:
+            self.pending_tick = now
+
+    def tick_finished(self):
+        self.tick_duration.record((time.perf_counter_ns() - self.tick_start) // 1000)
+
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.Type.UpdateRequest:
+            now = time.perf_counter_ns()
+
+            if self.last_frame is not None:
+                self.frame_interval.record((now - self.last_frame) // 1000)
+            self.last_frame = now
+
+            if self.pending_tick is not None:
+                self.latency.record((now - self.pending_tick) // 1000)
+                self.pending_tick = None
+
+        return False
+
+
+def format_ms(microseconds):
+    return f"{microseconds / 1000:6.2f}"
+
+
+class PerfHud(QWidget):
+    """Полупрозрачная панель поверх окна с процентилями замеров PerfMonitor"""
+
+    def __init__(self, window):
+        super().__init__(window)
+
+        self.main_window = window
+        self.monitor = None
+        self.lines = []
+
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+
+        self.hud_font = QFont("monospace", 9)
+        self.hud_font.setStyleHint(QFont.StyleHint.Monospace)
+        self.metrics = QFontMetrics(self.hud_font)
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(REFRESH_INTERVAL)
+        self.timer.timeout.connect(self.refresh)
+
+        self.hide()
+
+    def start(self, monitor):
+        self.monitor = monitor
+        self.refresh()
+        self.show()
+        self.raise_()
+        self.timer.start()
+
+    def stop(self):
+        self.timer.stop()
+        self.monitor = None
+        self.hide()
+
+    def refresh(self):
+        monitor = self.monitor
+        window = self.main_window
+
+        objects = len(window.findChildren(QObject))
+        target = window.timer_interval()
+
+        self.lines = [
+            f"{'':<12}" + "  ".join(f"{name:>6}" for name in ("p50", "p95", "p99", "max")) + " мс",
+            self.row("Ход", monitor.tick_duration),
+            self.row("Интервал", monitor.tick_interval),
+            self.row("Ход→кадр", monitor.latency),
+            self.row("Кадр", monitor.frame_interval),
+            f"Цель интервала: {target} мс   ходов: {monitor.tick_duration.count}",
+            f"QObject: {objects}   анимаций: {window.animations.active_count}",
+        ]
+
+        width = max(self.metrics.horizontalAdvance(line) for line in self.lines) + 16
+        height = self.metrics.lineSpacing() * len(self.lines) + 12
+        self.setGeometry(window.width() - width - 8, window.menuBar().height() + 8, width, height)
+        self.update()
+
+    @staticmethod
+    def row(title, histogram):
+        values = (
+            histogram.percentile(50), histogram.percentile(95),
+            histogram.percentile(99), histogram.max
+        )
+        return f"{title:<12}" + "  ".join(format_ms(value) for value in values)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(HUD_BACKGROUND)
+        painter.drawRoundedRect(QRectF(self.rect()), 4, 4)
+
+        painter.setFont(self.hud_font)
+        painter.setPen(HUD_TEXT)
+
+        y = 6 + self.metrics.ascent()
+        for line in self.lines:
+            painter.drawText(8, y, line)
+            y += self.metrics.lineSpacing()
+
+        painter.end()
@@ -0,0 +1,186 @@
+from PyQt6.QtCore import Qt, QTimer, QElapsedTimer, QPointF
+from PyQt6.QtGui import QPainter, QColor, QPen, QPolygonF
+from PyQt6.QtWidgets import QDockWidget, QWidget, QVBoxLayout, QFormLayout, QLabel
+
+from game.engine import TARGET_COUNT
+from game.stats import GameStats
+
+RATE_COLOR = QColor("#7c3aed")
+ALARM_COLOR = QColor("#ef4444")
+SETTING_COLOR = QColor("#fca5a5")
+GRID_COLOR = QColor("#e2e8f0")
+
+PANEL_STYLE = """
+    QLabel {
+        font-size: 12px;
+        color: #4b5563;
+    }
+"""
+
+
+def format_elapsed(seconds):
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}"
+
+
+class StatsChart(QWidget):
+    """График скорости и частоты аварий за последние секунды игры"""
+
+    def __init__(self, stats, parent=None):
+        super().__init__(parent)
+        self.stats = stats
+        self.setMinimumSize(240, 140)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        rect = self.rect().adjusted(4, 4, -4, -4)
+        painter.setPen(QPen(GRID_COLOR, 1))
+        painter.drawRect(rect)
+
+        # Каждая линия масштабируется по своему максимуму, аварии — не ниже заданной частоты
+        alarm = self.stats.engine.alarm
+        alarm_top = max(self.stats.alarm_rate.max(), alarm, 1.0)
+
+        if alarm > 0:
+            y = rect.bottom() - rect.height() * alarm / alarm_top
+            painter.setPen(QPen(SETTING_COLOR, 1, Qt.PenStyle.DashLine))
+            painter.drawLine(QPointF(rect.left(), y), QPointF(rect.right(), y))
+
+        self.draw_series(painter, rect, self.stats.rate, max(self.stats.rate.max(), 1.0), RATE_COLOR)
+        self.draw_series(painter, rect, self.stats.alarm_rate, alarm_top, ALARM_COLOR)
+
+        painter.end()
+
+    def draw_series(self, painter, rect, buffer, top, color):
+        values = buffer.values()
+        if len(values) < 2:
+            return
+
+        # Ось времени фиксирована: новые точки появляются справа
+        step = rect.width() / (buffer.capacity - 1)
+        left = rect.right() - step * (len(values) - 1)
+        bottom = rect.bottom()
+        scale = rect.height() / top
+
+        polygon = QPolygonF([
+            QPointF(left + i * step, bottom - value * scale) for i, value in enumerate(values)
+        ])
+
+        painter.setPen(QPen(color, 1.5))
+        painter.drawPolyline(polygon)
+
+
+class StatsPanel(QDockWidget):
+    """Прикрепляемая панель статистики идущей игры.
+
+    Показания снимаются по таймеру не чаще SAMPLE_INTERVAL всю игру, а
+    перерисовывается панель, только пока она видна, поэтому на ходы игры
+    панель не влияет. is_active сообщает, идет ли игра (не на паузе)."""
+
+    def __init__(self, engine, is_active, parent=None):
+        super().__init__("Статистика", parent)
+
+        self.engine = engine
+        self.is_active = is_active
+        self.stats = GameStats(engine)
+        self.is_obscured = False
+
+        self.clock = QElapsedTimer()
+        self.timer = QTimer(self)
+        self.timer.setInterval(int(self.stats.interval * 1000))
+        self.timer.timeout.connect(self.on_timer)
+
+        self.setAllowedAreas(
+            Qt.DockWidgetArea.LeftDockWidgetArea | Qt.DockWidgetArea.RightDockWidgetArea
+        )
+
+        self.init_ui()
+
+    def init_ui(self):
+        container = QWidget()
+        container.setStyleSheet(PANEL_STYLE)
+
+        layout = QVBoxLayout(container)
+        layout.setContentsMargins(8, 8, 8, 8)
+
+        form = QFormLayout()
+        self.rate_label = QLabel()
+        self.catches_label = QLabel()
+        self.alarms_label = QLabel()
+        self.alarm_rate_label = QLabel()
+        self.elapsed_label = QLabel()
+        self.completed_label = QLabel()
+
+        form.addRow("Ходов в секунду:", self.rate_label)
+        form.addRow("Уловов:", self.catches_label)
+        form.addRow("Аварий:", self.alarms_label)
+        form.addRow("Частота аварий:", self.alarm_rate_label)
+        form.addRow("Время игры:", self.elapsed_label)
+        form.addRow(f"Поймали {TARGET_COUNT}:", self.completed_label)
+
+        self.chart = StatsChart(self.stats)
+
+        legend = QLabel(
+            f'<span style="color: {RATE_COLOR.name()}">━ ходов в секунду</span>&nbsp;&nbsp;'
+            f'<span style="color: {ALARM_COLOR.name()}">━ аварии, %</span>'
+        )
+
+        layout.addLayout(form)
+        layout.addWidget(self.chart, 1)
+        layout.addWidget(legend)
+
+        self.setWidget(container)
+        self.update_labels()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.refresh()
+        self.update_timer()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.update_timer()
+
+    def update_timer(self):
+        """Показания снимаются, пока идет игра или видна панель; видимость
+        влияет только на перерисовку, поэтому время игры не теряется"""
+        needed = self.is_active() or self.isVisible()
+        if needed and not self.timer.isActive():
+            self.clock.start()
+            self.timer.start()
+        elif not needed and self.timer.isActive():
+            # Последний неполный промежуток тоже относится к игре
+            self.on_timer()
+            self.timer.stop()
+
+    def on_timer(self):
+        dt = self.clock.restart() / 1000
+        self.stats.sample(dt, self.is_active())
+
+        if self.isVisible() and not self.is_obscured:
+            self.refresh()
+
+    def refresh(self):
+        self.update_labels()
+        self.chart.update()
+
+    def set_obscured(self, obscured):
+        """Пока окно не видно, панель только не перерисовывается; показания
+        снимаются по-прежнему (см. update_timer)"""
+        self.is_obscured = obscured
+        if not obscured and self.isVisible():
+            self.refresh()
+
+    def update_labels(self):
+        stats = self.stats
+        engine = self.engine
+
+        self.rate_label.setText(f"{stats.rate.last():.0f}")
+        self.catches_label.setText(str(engine.catches))
+        self.alarms_label.setText(str(engine.alarms))
+        self.alarm_rate_label.setText(f"{stats.observed_alarm_rate():.1f}% (задано {engine.alarm}%)")
+        self.elapsed_label.setText(format_elapsed(stats.elapsed))
+        self.completed_label.setText(f"{engine.completed} из {len(engine.counts)}")
@@ -1,30 +1,213 @@
+import os
+import re
 import json
-import random
+import time
+import shutil
+import tempfile
+import importlib
 
-from PyQt6.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve
+from PyQt6.QtCore import Qt, QTimer, QElapsedTimer, QEvent
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QDialog, QFileDialog,
-    QLineEdit, QSlider, QPushButton, QMessageBox, QLabel
+    QLineEdit, QSlider, QPushButton, QMessageBox, QLabel, QInputDialog
 )
-from PyQt6.QtGui import QAction
-from dialogs.author_dialog import AuthorDialog
-from dialogs.about_dialog import AboutDialog
-from dialogs.color_dialog import ColorDialog
-from dialogs.initial_dialog import InitialDialog
-from widgets.fisher import Fisher
+from PyQt6.QtGui import QAction, QKeySequence
+from widgets.fisher_area import FisherArea
+from widgets.alarm_lamp import AlarmLamp
+from widgets.animation_driver import AnimationDriver
+from widgets.eta_label import EtaLabel
+from game.engine import GameEngine, EVENT_ALARM, EVENT_FINISH
+from game.autosave import Autosave, write_json_atomic
+from game.scenario import (
+    Scenario, SCENARIO_SUFFIX, write_scenario, json_to_scenario, scenario_to_json
+)
+
+WINDOW_STYLE = """
+    QMainWindow {
+        background-color: #ffffff;
+    }
+    QPushButton {
+        width: 80px;
+        padding: 10px 20px;
+        font-size: 12px;
+        font-weight: bold;
+        border: none;
+        border-radius: 4px;
+        background-color: #7c3aed;
+        color: #ffffff;
+    }
+    QPushButton:hover {
+        background-color: #8b5cf6;
+    }
+    QPushButton:disabled {
+        background-color: #a78bfa;
+    }
+    QLineEdit {
+        padding: 6.5px;
+        border: none;
+        border: 1px solid #cbd5e1;
+        border-radius: 4px;
+    }
+    QLineEdit:focus {
+        border-color: #7c3aed;
+        outline: 0;
+    }
+    QSpinBox {
+        padding: 6.5px;
+        border: none;
+        border: 1px solid #cbd5e1;
+        border-radius: 4px;
+    }
+    QSpinBox:focus {
+        border-color: #7c3aed;
+        outline: 0;
+    }
+    QSpinBox::up-button {
+        subcontrol-origin: border;
+        subcontrol-position: top right;
+        width: 20px;
+        border-left: 1px solid #cbd5e1;
+        border-bottom: 1px solid #cbd5e1;
+        border-top-right-radius: 4px;
+    }
+    QSpinBox::down-button {
+        subcontrol-origin: border;
+        subcontrol-position: bottom right;
+        width: 20px;
+        border-left: 1px solid #cbd5e1;
+        border-bottom-right-radius: 4px;
+    }
+    QSpinBox::up-arrow {
+        width: 10px;
+        height: 10px;
+        image: url(src/resources/chevron-up.svg);
+    }
+    QSpinBox::down-arrow {
+        width: 10px;
+        height: 10px;
+        image: url(src/resources/chevron-down.svg);
+    }
+    QSlider::groove:horizontal {
+        border: 1px solid #cbd5e1;
+        height: 6px;
+        background: #f1f5f9;
+        border-radius: 3px;
+    }
+    QSlider::handle:horizontal {
+        background: #7c3aed;
+        border: 1px solid #6d28d9;
+        width: 16px;
+        height: 16px;
+        border-radius: 8px;
+        margin: -6px 0;
+    }
+    QSlider::handle:horizontal:hover {
+        background: #6d28d9;
+        border: 1px solid #5b21b6;
+    }
+    QSlider::handle:horizontal:pressed {
+        background: #5b21b6;
+    }
+    QSlider::sub-page:horizontal {
+        background: #7c3aed;
+        border-radius: 3px;
+    }
+"""
+
+
+def remove_file(path):
+    """Удаляет временный файл; занятый или уже удаленный файл пропускается"""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
 
 class MainWindow(QMainWindow):
-    speed = 0
-    alarm = 0
     game_timer = None
     is_running = False
     is_paused = False
+    is_turbo = False
+
+    # Турбо-режим: частота кадров и доля кадра, отдаваемая под ходы игры
+    FRAME_INTERVAL = 16
+    MINIMUM_WIDTH = 1024
+    MINIMUM_HEIGHT = 600
+    TURBO_BUDGET_MS = 8
+    # Пока окно не видно, кадры турбо-режима реже, а доля времени под ходы та же
+    OBSCURED_FRAME_INTERVAL = 100
+    TURBO_CHUNK = 2048
+
+    # Каталог, в который записываются журналы партий
+    LOG_DIR = 'logs'
+    # Сколько последних журналов партий хранится в LOG_DIR
+    MAX_LOGS = 20
+    # Каталог автосохранения идущей игры и период передачи ходов потоку записи
+    AUTOSAVE_DIR = 'autosave'
+    AUTOSAVE_INTERVAL = 500
+
+    # Каталог решенных таблиц точной длины игры для оценки оставшегося времени
+    SOLVER_CACHE_DIR = 'cache'
+
+    # JSON больше этого размера открывается через фоновое преобразование в сценарий
+    LARGE_JSON_SIZE = 1 << 20
+
+    FILE_FILTER = (
+        "Файлы игры (*.json *.fshs);;JSON Files (*.json);;"
+        "Бинарные сценарии (*.fshs);;All Files (*)"
+    )
+
+    # Справочные окна создаются при первом открытии или заранее, в простое после первого кадра
+    REFERENCE_DIALOGS = {
+        'author': ('dialogs.author_dialog', 'AuthorDialog'),
+        'about': ('dialogs.about_dialog', 'AboutDialog'),
+    }
+    # Модули, не нужные для первого кадра, подгружаются в простое по одному
+    PREWARM_MODULES = (
+        'dialogs.color_dialog',
+        'dialogs.initial_dialog',
+        'widgets.board',
+        'game.event_log',
+        'dialogs.convert_dialog',
+        'windows.replay_window',
+        'widgets.stats_panel',
+        'windows.tournament_window',
+    )
+    PREWARM_DELAY = 300
+
+    def __init__(self, profile=None):
+        super().__init__()
 
-    people = []
-    initial_people = []
+        # Отметки этапов запуска для --profile-startup
+        self.profile = profile or (lambda phase: None)
+        self.dialogs = {}
 
-    def __init__(self):
-        super().__init__()
+        self.engine = GameEngine()
+        self.animations = AnimationDriver(parent=self)
+
+        self.turbo_clock = QElapsedTimer()
+        self.turbo_debt = 0.0
+        self.turbo_dirty = set()
+
+        self.recorder = None
+        self.autosave = Autosave(self.AUTOSAVE_DIR)
+
+        # Сценарий, преобразованный из большого JSON во временный файл
+        self.temp_scenario = None
+
+        self.stats_panel = None
+
+        # Замеры для монитора производительности; пока он скрыт, ход игры не замеряется
+        self.perf = None
+        self.perf_hud = None
+
+        # Локальный сервер управления, включается параметром --control
+        self.control = None
+
+        # Окно свернуто, скрыто или закрыто другими окнами: идет только игра,
+        # а поле один раз обновляется по модели, когда окно снова видно
+        self.is_obscured = False
+        self.exposure_window = None
 
         central_widget = QWidget()
 
@@ -33,125 +216,153 @@ class MainWindow(QMainWindow):
         self.main_layout.setSpacing(0)
 
         self.setWindowTitle("Рыбаки")
-        self.setFixedSize(1366, 768)
+        self.resize(1366, 768)
+        self.setMinimumSize(self.MINIMUM_WIDTH, self.MINIMUM_HEIGHT)
         self.setCentralWidget(central_widget)
 
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #ffffff;
-            }
-            QPushButton {
-                width: 80px;
-                padding: 10px 20px;
-                font-size: 12px;
-                font-weight: bold;
-                border: none;
-                border-radius: 4px;
-                background-color: #7c3aed;
-                color: #ffffff;
-            }
-            QPushButton:hover {
-                background-color: #8b5cf6;
-            }
-            QPushButton:disabled {
-                background-color: #a78bfa;
-            }
-            QLineEdit {
-                padding: 6.5px;
-                border: none;
-                border: 1px solid #cbd5e1;
-                border-radius: 4px;
-            }
-            QLineEdit:focus {
-                border-color: #7c3aed;
-                outline: 0;
-            }
-            QSpinBox {
-                padding: 6.5px;
-                border: none;
-                border: 1px solid #cbd5e1;
-                border-radius: 4px;
-            }
-            QSpinBox:focus {
-                border-color: #7c3aed;
-                outline: 0;
-            }
-            QSpinBox::up-button {
-                subcontrol-origin: border;
-                subcontrol-position: top right;
-                width: 20px;
-                border-left: 1px solid #cbd5e1;
-                border-bottom: 1px solid #cbd5e1;
-                border-top-right-radius: 4px;
-            }
-            QSpinBox::down-button {
-                subcontrol-origin: border;
-                subcontrol-position: bottom right;
-                width: 20px;
-                border-left: 1px solid #cbd5e1;
-                border-bottom-right-radius: 4px;
-            }
-            QSpinBox::up-arrow {
-                width: 10px;
-                height: 10px;
-                image: url(src/resources/chevron-up.svg);
-            }
-            QSpinBox::down-arrow {
-                width: 10px;
-                height: 10px;
-                image: url(src/resources/chevron-down.svg);
-            }
-            QSlider::groove:horizontal {
-                border: 1px solid #cbd5e1;
-                height: 6px;
-                background: #f1f5f9;
-                border-radius: 3px;
-            }
-            QSlider::handle:horizontal {
-                background: #7c3aed;
-                border: 1px solid #6d28d9;
-                width: 16px;
-                height: 16px;
-                border-radius: 8px;
-                margin: -6px 0;
-            }
-            QSlider::handle:horizontal:hover {
-                background: #6d28d9;
-                border: 1px solid #5b21b6;
-            }
-            QSlider::handle:horizontal:pressed {
-                background: #5b21b6;
-            }
-            QSlider::sub-page:horizontal {
-                background: #7c3aed;
-                border-radius: 3px;
-            }
-        """)
+        # Стили задаются до создания дочерних виджетов, чтобы они не пересчитывались повторно
+        self.setStyleSheet(WINDOW_STYLE)
+        self.profile('stylesheet')
 
         self.load_config('src/config.json')
+        self.profile('config load')
+
         self.init_menu_bar()
+        self.profile('menu')
+
         self.init_area()
+        self.profile('area build')
+
         self.init_controls()
         self.update_controls()
+        self.profile('controls')
 
         self.game_timer = QTimer()
-        self.game_timer.timeout.connect(self.game_tick)
+        self.game_timer.timeout.connect(self.on_game_timer)
+
+        self.autosave_timer = QTimer(self)
+        self.autosave_timer.setInterval(self.AUTOSAVE_INTERVAL)
+        self.autosave_timer.timeout.connect(self.autosave.flush)
+
+        # Предложение продолжить игру показываем, когда окно уже на экране
+        QTimer.singleShot(0, self.offer_resume)
+
+        self.prewarm_queue = None
+
+    @property
+    def speed(self):
+        return self.engine.speed
+
+    @speed.setter
+    def speed(self, value):
+        self.engine.speed = value
+
+    @property
+    def alarm(self):
+        return self.engine.alarm
+
+    @alarm.setter
+    def alarm(self, value):
+        self.engine.alarm = value
+
+    @property
+    def people(self):
+        return self.engine.get_people()
+
+    @people.setter
+    def people(self, people):
+        self.engine.set_people(people)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+
+        # О перекрытии другими окнами сообщает только QWindow событиями Expose
+        if self.exposure_window is None and self.windowHandle() is not None:
+            self.exposure_window = self.windowHandle()
+            self.exposure_window.installEventFilter(self)
+        self.update_obscured()
+
+        if self.prewarm_queue is None:
+            self.prewarm_queue = [
+                (importlib.import_module, module) for module in self.PREWARM_MODULES
+            ] + [(self.dialog, name) for name in self.REFERENCE_DIALOGS]
+            QTimer.singleShot(self.PREWARM_DELAY, self.prewarm_step)
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.update_obscured()
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.WindowStateChange:
+            self.update_obscured()
+
+    def eventFilter(self, watched, event):
+        if watched is self.exposure_window and event.type() == QEvent.Type.Expose:
+            self.update_obscured()
+        return super().eventFilter(watched, event)
+
+    def update_obscured(self):
+        """Отключает отображение, пока окно не видно, и обновляет поле, когда оно появляется"""
+        handle = self.exposure_window
+        obscured = (
+            not self.isVisible() or self.isMinimized()
+            or (handle is not None and not handle.isExposed())
+        )
+        if obscured == self.is_obscured:
+            return
+
+        self.is_obscured = obscured
+        if self.stats_panel is not None:
+            self.stats_panel.set_obscured(obscured)
 
-    def load_config(self, file_path):
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        if obscured:
+            self.animations.clear()
+            self.turbo_dirty.clear()
+        else:
+            self.update_characters_display()
+
+        if self.is_running and not self.is_paused and self.is_turbo:
+            self.game_timer.setInterval(self.timer_interval())
+
+    def prewarm_step(self):
+        """Готовит один отложенный модуль или окно и уступает циклу событий"""
+        if not self.prewarm_queue:
+            return
+
+        action, argument = self.prewarm_queue.pop(0)
+        action(argument)
+        QTimer.singleShot(0, self.prewarm_step)
+
+    def dialog(self, name):
+        dialog = self.dialogs.get(name)
 
-        self.speed = data['speed']
-        self.alarm = data['alarm']
-        self.people = data['people']
-        self.initial_people = []
+        if dialog is None:
+            module_name, class_name = self.REFERENCE_DIALOGS[name]
+            dialog_class = getattr(importlib.import_module(module_name), class_name)
+            dialog = self.dialogs[name] = dialog_class(self)
 
-        for i, person in enumerate(data['people']):
-            self.initial_people.append({
-                'color': person['color'],
-                'count': person['count']
-            })
-            self.people[i]['id'] = i
+        return dialog
+
+    def load_config(self, file_path, temporary=False):
+        """temporary — файл удаляется, когда его сменит другой или окно закроется"""
+        if file_path.endswith(SCENARIO_SUFFIX):
+            self.engine.load_scenario(Scenario(file_path))
+        else:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+
+            self.engine.load(data)
+
+        if file_path != self.temp_scenario:
+            self.remove_temp_scenario()
+        if temporary:
+            self.temp_scenario = file_path
+
+    def remove_temp_scenario(self):
+        if self.temp_scenario is not None:
+            remove_file(self.temp_scenario)
+            self.temp_scenario = None
 
     def init_menu_bar(self):
         menu_bar = self.menuBar()
@@ -171,14 +382,28 @@ class MainWindow(QMainWindow):
 
         self.open_file_action = QAction("Открыть", self)
         self.save_file_action = QAction("Сохранить", self)
+        replay_action = QAction("Открыть запись", self)
+        tournament_action = QAction("Турнир…", self)
+        self.import_action = QAction("Импорт JSON в сценарий", self)
+        self.export_action = QAction("Экспорт сценария в JSON", self)
         exit_action = QAction("Выход", self)
 
         self.open_file_action.triggered.connect(self.open_file)
         self.save_file_action.triggered.connect(self.save_file)
+        replay_action.triggered.connect(self.open_replay)
+        tournament_action.triggered.connect(self.open_tournament)
+        self.import_action.triggered.connect(self.import_scenario)
+        self.export_action.triggered.connect(self.export_scenario)
         exit_action.triggered.connect(self.close)
 
         file_menu.addAction(self.open_file_action)
         file_menu.addAction(self.save_file_action)
+        file_menu.addAction(replay_action)
+        file_menu.addAction(tournament_action)
+        file_menu.addSeparator()
+        file_menu.addAction(self.import_action)
+        file_menu.addAction(self.export_action)
+        file_menu.addSeparator()
         file_menu.addAction(exit_action)
     
     def open_file(self):
@@ -186,23 +411,93 @@ class MainWindow(QMainWindow):
             self,
             "Открыть файл",
             "",
-            "JSON Files (*.json);;All Files (*)"
+            self.FILE_FILTER
         )
 
         if file_path[0]:
-            self.load_config(file_path[0])
+            path = file_path[0]
+
+            # Большой JSON разбирается в фоне в бинарный сценарий, который затем отображается в память
+            temporary = not path.endswith(SCENARIO_SUFFIX) and os.path.getsize(path) > self.LARGE_JSON_SIZE
+            if temporary:
+                fd, scenario_path = tempfile.mkstemp(suffix=SCENARIO_SUFFIX)
+                os.close(fd)
+
+                if not self.convert_file("Загрузка файла", json_to_scenario, path, scenario_path):
+                    remove_file(scenario_path)
+                    return
+                path = scenario_path
+
+            try:
+                self.load_config(path, temporary)
+            except (OSError, ValueError, KeyError) as error:
+                if temporary:
+                    remove_file(path)
+                QMessageBox.warning(self, "Ошибка", f"Не удалось открыть файл:\n{error}")
+                return
+
             self.update_controls()
             self.update_characters_display()
 
+    def convert_file(self, title, convert, source, target):
+        from dialogs.convert_dialog import ConvertDialog
+
+        dialog = ConvertDialog(self, title, convert, source, target)
+        succeeded = dialog.run()
+
+        if dialog.error:
+            QMessageBox.warning(self, "Ошибка", f"Не удалось преобразовать файл:\n{dialog.error}")
+
+        return succeeded
+
+    def import_scenario(self):
+        source, _ = QFileDialog.getOpenFileName(
+            self, "Импорт JSON", "", "JSON Files (*.json);;All Files (*)"
+        )
+        if not source:
+            return
+
+        target, _ = QFileDialog.getSaveFileName(
+            self, "Сохранить сценарий", os.path.splitext(source)[0] + SCENARIO_SUFFIX,
+            "Бинарные сценарии (*.fshs)"
+        )
+        if target:
+            if not target.endswith(SCENARIO_SUFFIX):
+                target += SCENARIO_SUFFIX
+            self.convert_file("Импорт JSON", json_to_scenario, source, target)
+
+    def export_scenario(self):
+        source, _ = QFileDialog.getOpenFileName(
+            self, "Экспорт сценария", "", "Бинарные сценарии (*.fshs);;All Files (*)"
+        )
+        if not source:
+            return
+
+        target, _ = QFileDialog.getSaveFileName(
+            self, "Сохранить JSON", os.path.splitext(source)[0] + '.json',
+            "JSON Files (*.json)"
+        )
+        if target:
+            if not target.endswith('.json'):
+                target += '.json'
+            self.convert_file("Экспорт в JSON", scenario_to_json, source, target)
+
     def save_file(self):
         file_path, _ = QFileDialog.getSaveFileName(
             self,
             "Сохранить файл",
             "",
-            "JSON Files (*.json);;All Files (*)"
+            self.FILE_FILTER
         )
 
         if file_path:
+            if file_path.endswith(SCENARIO_SUFFIX):
+                write_scenario(
+                    file_path, self.speed, self.alarm,
+                    self.engine.counts, self.engine.colors, self.engine.weights
+                )
+                return
+
             if not file_path.endswith('.json'):
                 file_path += '.json'
         
@@ -212,8 +507,105 @@ class MainWindow(QMainWindow):
                 'people': self.people,
             }
 
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(saved_data, f, ensure_ascii=False, indent=4)
+            write_json_atomic(file_path, saved_data, indent=4)
+
+    def offer_resume(self):
+        """Предлагает продолжить игру, прерванную закрытием или сбоем"""
+        if not self.autosave.has_saved_game():
+            return
+
+        answer = QMessageBox.question(
+            self,
+            "Незавершенная игра",
+            "Найдена незавершенная игра.\n"
+            "Продолжить ее?"
+        )
+
+        if answer != QMessageBox.StandardButton.Yes or self.autosave.restore(self.engine) is None:
+            self.autosave.clear()
+            return
+
+        self.update_controls()
+        self.update_characters_display()
+
+        self.start_game()
+        self.pause_game()
+
+    def open_replay(self):
+        path = QFileDialog.getExistingDirectory(self, "Открыть запись", self.LOG_DIR)
+
+        if path:
+            from windows.replay_window import ReplayWindow
+
+            try:
+                replay_window = ReplayWindow(path, self)
+            except (OSError, ValueError, KeyError) as error:
+                QMessageBox.warning(self, "Ошибка", f"Не удалось открыть запись:\n{error}")
+                return
+
+            replay_window.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+            replay_window.show()
+
+    def open_tournament(self):
+        paths, _ = QFileDialog.getOpenFileNames(self, "Файлы турнира", "", self.FILE_FILTER)
+        if not paths:
+            return
+
+        text, ok = QInputDialog.getText(
+            self, "Турнир",
+            "Вероятности аварии, например 0,10,20 или 0:50:10\n(пусто — из файлов):"
+        )
+        if not ok:
+            return
+
+        from game.sweep import parse_grid
+        from game.tournament import Tournament
+        from windows.tournament_window import TournamentWindow
+
+        try:
+            alarms = parse_grid(text) if text.strip() else ()
+            tournament = Tournament.from_files(paths, alarms)
+        except (OSError, ValueError, KeyError) as error:
+            QMessageBox.warning(self, "Ошибка", f"Не удалось подготовить турнир:\n{error}")
+            return
+
+        tournament_window = TournamentWindow(tournament, self)
+        tournament_window.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        tournament_window.show()
+
+    def start_recording(self):
+        """Начинает журнал партии, если запись включена"""
+        if self.recorder is not None or not self.record_action.isChecked():
+            return
+
+        from game.event_log import EventLogWriter
+
+        self.remove_old_logs(self.MAX_LOGS - 1)
+
+        name = f"{time.strftime('%Y%m%d-%H%M%S')}-{self.engine.seed}"
+        self.recorder = EventLogWriter(os.path.join(self.LOG_DIR, name), self.engine)
+        self.engine.recorders.append(self.recorder)
+
+    def remove_old_logs(self, keep):
+        """Удаляет журналы партий, кроме keep последних; имена начинаются с даты и времени"""
+        try:
+            names = sorted(
+                name for name in os.listdir(self.LOG_DIR)
+                if re.match(r'\d{8}-\d{6}-', name) and os.path.isdir(os.path.join(self.LOG_DIR, name))
+            )
+        except OSError:
+            return
+
+        for name in names[:max(0, len(names) - keep)]:
+            shutil.rmtree(os.path.join(self.LOG_DIR, name), ignore_errors=True)
+
+    def stop_recording(self):
+        if self.recorder is None:
+            return
+
+        self.engine.recorders.remove(self.recorder)
+        self.recorder.close()
+        self.recorder = None
 
     def update_controls(self):
         self.speed_slider.setValue(self.speed)
@@ -231,49 +623,118 @@ class MainWindow(QMainWindow):
         self.initial_action = QAction("Начальное заполнение", self)
         self.initial_action.triggered.connect(self.show_initial_dialog)
 
+        self.board_action = QAction("Быстрая отрисовка", self)
+        self.board_action.setCheckable(True)
+        self.board_action.toggled.connect(self.set_board_renderer)
+
+        # Масштаб есть только у поля, рисуемого одним виджетом: оно включается при первом вызове
+        zoom_in_action = QAction("Крупнее", self)
+        zoom_in_action.setShortcuts([QKeySequence("Ctrl+="), QKeySequence("Ctrl++")])
+        zoom_in_action.triggered.connect(lambda: self.zoom_board('zoom_in'))
+
+        zoom_out_action = QAction("Мельче", self)
+        zoom_out_action.setShortcut(QKeySequence("Ctrl+-"))
+        zoom_out_action.triggered.connect(lambda: self.zoom_board('zoom_out'))
+
+        zoom_fit_action = QAction("Все поле целиком", self)
+        zoom_fit_action.setShortcut(QKeySequence("Ctrl+0"))
+        zoom_fit_action.triggered.connect(lambda: self.zoom_board('zoom_to_fit'))
+
+        self.turbo_action = QAction("Турбо-режим", self)
+        self.turbo_action.setCheckable(True)
+        self.turbo_action.toggled.connect(self.set_turbo)
+
+        self.stats_action = QAction("Статистика", self)
+        self.stats_action.setCheckable(True)
+        self.stats_action.toggled.connect(self.set_stats_visible)
+
+        self.perf_action = QAction("Монитор производительности", self)
+        self.perf_action.setCheckable(True)
+        self.perf_action.setShortcut(QKeySequence("F3"))
+        self.perf_action.toggled.connect(self.set_perf_hud_visible)
+
+        self.record_action = QAction("Записывать партии", self)
+        self.record_action.setCheckable(True)
+        self.record_action.setChecked(False)
+
         settings_menu.addAction(self.colors_action)
         settings_menu.addAction(self.initial_action)
+        settings_menu.addSeparator()
+        settings_menu.addAction(self.board_action)
+        settings_menu.addAction(zoom_in_action)
+        settings_menu.addAction(zoom_out_action)
+        settings_menu.addAction(zoom_fit_action)
+        settings_menu.addAction(self.turbo_action)
+        settings_menu.addAction(self.record_action)
+        settings_menu.addSeparator()
+        settings_menu.addAction(self.stats_action)
+        settings_menu.addAction(self.perf_action)
+
+    def set_stats_visible(self, visible):
+        """Панель статистики создается при первом включении"""
+        if self.stats_panel is None:
+            if not visible:
+                return
+
+            from widgets.stats_panel import StatsPanel
+
+            self.stats_panel = StatsPanel(
+                self.engine, lambda: self.is_running and not self.is_paused, self
+            )
+            self.stats_panel.visibilityChanged.connect(self.on_stats_visibility_changed)
+            self.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, self.stats_panel)
+            self.stats_panel.update_timer()
+
+        self.stats_panel.setVisible(visible)
+
+    def on_stats_visibility_changed(self, visible):
+        # Панель могли закрыть кнопкой на ее заголовке
+        if not visible and self.stats_panel.isHidden():
+            self.stats_action.setChecked(False)
+
+    def set_perf_hud_visible(self, visible):
+        if visible:
+            from widgets.perf_hud import PerfMonitor, PerfHud
+
+            if self.perf_hud is None:
+                self.perf_hud = PerfHud(self)
+
+            self.perf = PerfMonitor(self)
+            self.perf_hud.start(self.perf)
+            return
+
+        if self.perf is not None:
+            self.perf_hud.stop()
+            self.perf.close()
+            self.perf.deleteLater()
+            self.perf = None
 
     def show_color_dialog(self):
+        from dialogs.color_dialog import ColorDialog
+
         dialog = ColorDialog(self, people=self.people)
 
         if dialog.exec() == QDialog.DialogCode.Accepted:
             self.people = dialog.updated_people
-            self.initial_people = []
-
-            for i, person in enumerate(self.people):
-                self.initial_people.append({
-                    'color': person['color'],
-                    'count': person['count']
-                })
-                person['id'] = i
-
             self.update_characters_display()
 
     def show_initial_dialog(self):
+        from dialogs.initial_dialog import InitialDialog
+
         dialog = InitialDialog(self, people=self.people)
 
         if dialog.exec() == QDialog.DialogCode.Accepted:
             self.people = dialog.get_updated_people()
-            self.initial_people = []
-
-            for i, person in enumerate(self.people):
-                self.initial_people.append({
-                    'color': person['color'],
-                    'count': person['count']
-                })
-                person['id'] = i
-
             self.update_characters_display()
 
     def init_reference_menu(self, menu_bar):
         reference_menu = menu_bar.addMenu("Справка")
 
         author_action = QAction("Об авторе", self)
-        author_action.triggered.connect(AuthorDialog(self).exec)
+        author_action.triggered.connect(lambda: self.dialog('author').exec())
 
         about_menu = QAction("О программе", self)
-        about_menu.triggered.connect(AboutDialog(self).exec)
+        about_menu.triggered.connect(lambda: self.dialog('about').exec())
 
         reference_menu.addAction(author_action)
         reference_menu.addAction(about_menu)
@@ -308,16 +769,8 @@ class MainWindow(QMainWindow):
         self.speed_input = QLineEdit()
         self.alarm_input = QLineEdit()
 
-        self.alarm_lamp = QLabel()
-        self.alarm_lamp.setFixedSize(20, 20)
-        self.alarm_lamp.setStyleSheet("""
-            QLabel {
-                background-color: #d1d5db;
-                border-radius: 10px;
-                border: 1px solid #9ca3af;
-            }
-        """)
-        self.alarm_lamp.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.alarm_lamp = AlarmLamp()
+        self.animations.set_lamp(self.alarm_lamp)
 
         self.start_button.clicked.connect(self.toggle_game)
         self.pause_button.clicked.connect(self.toggle_pause)
@@ -343,6 +796,15 @@ class MainWindow(QMainWindow):
         speed_label.setFixedWidth(60)
         speed_label.setStyleSheet("font-size: 12px; color: #4b5563; font-weight: bold; border: none;")
         
+        # Скорость турбо-режима в ходах в секунду, видна только в этом режиме
+        self.rate_label = QLabel()
+        self.rate_label.setFixedWidth(90)
+        self.rate_label.setStyleSheet("font-size: 12px; color: #4b5563; border: none;")
+        self.rate_label.setVisible(False)
+
+        # Ожидаемое число оставшихся ходов и время по точному решению цепи Маркова
+        self.eta_label = EtaLabel(self.engine, self.SOLVER_CACHE_DIR)
+
         alarm_label = QLabel("Аварийная лампа")
         alarm_label.setFixedWidth(110)
         alarm_label.setStyleSheet("font-size: 12px; color: #4b5563; font-weight: bold; border: none;")
@@ -355,6 +817,8 @@ class MainWindow(QMainWindow):
         controls_layout.addWidget(speed_label)
         controls_layout.addWidget(self.speed_slider)
         controls_layout.addWidget(self.speed_input)
+        controls_layout.addWidget(self.rate_label)
+        controls_layout.addWidget(self.eta_label)
         
         # Добавляем аварийную лампу с подписью слева
         controls_layout.addWidget(alarm_label)
@@ -368,14 +832,16 @@ class MainWindow(QMainWindow):
     def on_speed_changed(self, value):
         self.speed_input.setText(str(value))
         self.speed = value
+        self.update_rate_label()
+        self.update_eta()
 
         if self.is_running and not self.is_paused:
-            interval = max(10, 1000 - self.speed * 7)
-            self.game_timer.setInterval(interval)
+            self.game_timer.setInterval(self.timer_interval())
 
     def on_alarm_changed(self, value):
         self.alarm_input.setText(str(value))
         self.alarm = value
+        self.update_eta()
 
     def on_speed_input_changed(self, text):
         if text == "":
@@ -413,9 +879,10 @@ class MainWindow(QMainWindow):
             self.speed_slider.setValue(value)
             self.speed = value
 
+            self.update_rate_label()
+
             if self.is_running and not self.is_paused:
-                interval = max(10, 1000 - self.speed * 7)
-                self.game_timer.setInterval(interval)
+                self.game_timer.setInterval(self.timer_interval())
         else:
             # Введены нечисловые символы - восстанавливаем предыдущее значение
             self.speed_input.blockSignals(True)
@@ -476,270 +943,192 @@ class MainWindow(QMainWindow):
             )
 
     def init_area(self):
-        self.area_container = QWidget()
-        self.area_container.setStyleSheet("""
-            QWidget {
-                background-color: #dbeafe;
-                border-top: 1px solid #e2e8f0;
-            }
-        """)
-
-        self.area_layout = QHBoxLayout()
-        self.area_layout.setContentsMargins(16, 16, 16, 16)
-        self.area_layout.setSpacing(16)
-        self.area_layout.setAlignment(Qt.AlignmentFlag.AlignVCenter)
-
-        self.character_widgets = []
-        for i in range(10):
-            character_widget = QWidget()
-            character_widget.setStyleSheet("""border: none""")
-            character_layout = QVBoxLayout()
-            character_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            character_layout.setSpacing(10)
-
-            count_label = QLabel("0")
-            count_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            count_label.setStyleSheet("""
-                font-size: 18px; 
-                font-weight: bold;
-                padding: 5px;
-                color: black;
-            """)
-
-            fisher_widget = Fisher()
-            fisher_widget.setFixedSize(112, 220)
-
-            character_layout.addWidget(count_label)
-            character_layout.addWidget(fisher_widget)
-            character_widget.setLayout(character_layout)
-
-            self.character_widgets.append({
-                'widget': character_widget,
-                'fisher_widget': fisher_widget,
-                'count_label': count_label,
-                'highlight_timer': None,
-                'animation': None
-            })
-
-            self.area_layout.addWidget(character_widget)
-
-        self.area_container.setLayout(self.area_layout)
-        self.main_layout.addWidget(self.area_container, 1)
+        self.area_container = self.create_area(self.board_action.isChecked())
+        self.main_layout.insertWidget(0, self.area_container, 1)
+        self.animations.set_board(self.area_container)
 
         self.update_characters_display()
 
-    def update_characters_display(self):
-        for i, character_data in enumerate(self.character_widgets):
-            if i < len(self.people):
-                person = self.people[i]
+    def create_area(self, use_board):
+        """Поле из отдельных виджетов или поле, рисуемое одним виджетом"""
+        if use_board:
+            from widgets.board import BoardWidget
 
-                character_data['fisher_widget'].update_color(person['color'])
-                character_data['count_label'].setText(str(person['count']))
-                
-                if person['count'] >= 10:
-                    character_data['count_label'].setStyleSheet("""
-                        font-size: 18px; 
-                        font-weight: bold; 
-                        padding: 5px;
-                        color: #16a34a;
-                    """)
-                else:
-                    character_data['count_label'].setStyleSheet("""
-                        font-size: 18px; 
-                        font-weight: bold; 
-                        padding: 5px;
-                        color: black;
-                    """)
-            else:
-                character_data['fisher_widget'].update_color("#ffffff")
-                character_data['count_label'].setText("0")
-                character_data['count_label'].setStyleSheet("""
-                    font-size: 18px; 
-                    font-weight: bold; 
-                    padding: 5px;
-                    color: black;
-                """)
+            return BoardWidget(self.engine)
+
+        return FisherArea(self.engine)
+
+    def set_board_renderer(self, use_board):
+        if not hasattr(self, 'area_container'):
+            return
+
+        self.main_layout.removeWidget(self.area_container)
+        self.area_container.deleteLater()
+
+        self.init_area()
+
+    def zoom_board(self, method):
+        if not self.board_action.isChecked():
+            self.board_action.setChecked(True)
+        getattr(self.area_container, method)()
+
+    def update_characters_display(self):
+        self.turbo_dirty.clear()
+        self.animations.clear()
+        self.area_container.refresh()
+        self.update_eta()
 
     def update_character_display(self, index):
-        if index < len(self.people):
-            person = self.people[index]
-            character_data = self.character_widgets[index]
-            character_data['count_label'].setText(str(person['count']))
-            
-            if person['count'] >= 10:
-                character_data['count_label'].setStyleSheet("""
-                    font-size: 18px; 
-                    font-weight: bold; 
-                    padding: 5px;
-                    color: #16a34a;
-                """)
-            else:
-                character_data['count_label'].setStyleSheet("""
-                    font-size: 18px; 
-                    font-weight: bold; 
-                    padding: 5px;
-                    color: black;
-                """)
+        self.area_container.update_index(index)
 
     def highlight_character(self, index):
         """Обычная подсветка персонажа (без изменения цвета счетчика)"""
-        if index < len(self.character_widgets):
-            character_data = self.character_widgets[index]
-            
-            # Анимация движения Fisher вниз и обратно
-            self.animate_fisher_movement(index)
-            
-            if character_data['highlight_timer']:
-                character_data['highlight_timer'].stop()
-            
-            character_data['highlight_timer'] = QTimer()
-            character_data['highlight_timer'].setSingleShot(True)
-            character_data['highlight_timer'].timeout.connect(
-                lambda: self.restore_character_style(index)
-            )
-            character_data['highlight_timer'].start(200)
+        self.animations.animate_catch(index)
 
     def highlight_character_with_red_counter(self, index):
         """Подсветка персонажа с красным цветом счетчика при аварии"""
-        if index < len(self.character_widgets):
-            character_data = self.character_widgets[index]
-            
-            # Устанавливаем красный цвет счетчика
-            character_data['count_label'].setStyleSheet("""
-                font-size: 18px; 
-                font-weight: bold; 
-                padding: 5px;
-                color: #ef4444;
-            """)
-            
-            # Анимация движения Fisher вниз и обратно
-            self.animate_fisher_movement(index)
-            
-            if character_data['highlight_timer']:
-                character_data['highlight_timer'].stop()
-            
-            character_data['highlight_timer'] = QTimer()
-            character_data['highlight_timer'].setSingleShot(True)
-            character_data['highlight_timer'].timeout.connect(
-                lambda: self.restore_character_style_after_alarm(index)
-            )
-            character_data['highlight_timer'].start(500)  # Увеличиваем время до 500 мс
-
-    def animate_fisher_movement(self, index):
-        """Анимация движения Fisher вниз и обратно"""
-        if index < len(self.character_widgets):
-            character_data = self.character_widgets[index]
-            fisher_widget = character_data['fisher_widget']
-            
-            animation = QPropertyAnimation(fisher_widget, b"geometry")
-            animation.setDuration(300)
-            animation.setEasingCurve(QEasingCurve.Type.OutInQuad)
-            
-            current_geometry = fisher_widget.geometry()
-            
-            down_geometry = current_geometry.translated(0, 20)
-            up_geometry = current_geometry
-            
-            animation.setKeyValueAt(0, current_geometry)
-            animation.setKeyValueAt(0.5, down_geometry)
-            animation.setKeyValueAt(1, up_geometry)
-
-            animation.start()
-            character_data['animation'] = animation
-
-    def restore_character_style(self, index):
-        """Восстанавливаем стиль Fisher (убираем обводку)"""
-        if index < len(self.character_widgets):
-            character_data = self.character_widgets[index]
-            # Убираем обводку
-            character_data['fisher_widget'].setStyleSheet("")
-
-    def restore_character_style_after_alarm(self, index):
-        """Восстанавливаем нормальный цвет счетчика после аварии"""
-        if index < len(self.character_widgets):
-            character_data = self.character_widgets[index]
-            
-            # Восстанавливаем нормальный цвет счетчика
-            person = self.people[index]
-            if person['count'] >= 10:
-                character_data['count_label'].setStyleSheet("""
-                    font-size: 18px; 
-                    font-weight: bold; 
-                    padding: 5px;
-                    color: #16a34a;
-                """)
-            else:
-                character_data['count_label'].setStyleSheet("""
-                    font-size: 18px; 
-                    font-weight: bold; 
-                    padding: 5px;
-                    color: black;
-                """)
-            
-            # Убираем обводку с Fisher
-            character_data['fisher_widget'].setStyleSheet("")
+        self.animations.animate_alarm(index)
 
     def trigger_alarm_lamp(self):
-        self.alarm_lamp.setStyleSheet("""
-            QLabel {
-                background-color: #ef4444;
-                border-radius: 10px;
-                border: 1px solid #dc2626;
-            }
-        """)
-        
-        QTimer.singleShot(500, self.reset_alarm_lamp)
-
-    def reset_alarm_lamp(self):
-        self.alarm_lamp.setStyleSheet("""
-            QLabel {
-                background-color: #d1d5db;
-                border-radius: 10px;
-                border: 1px solid #9ca3af;
-            }
-        """)
+        self.animations.trigger_lamp()
 
-    def game_tick(self):
-        # Проверяем, должна ли произойти авария (с процентной вероятностью)
-        if self.alarm > 0 and random.randint(1, 100) <= self.alarm:
-            self.trigger_alarm()
+    def set_turbo(self, enabled):
+        """Турбо-режим: скорость по логарифмической шкале от 1 до 100 000 ходов в секунду,
+        ходы выполняются пачками, а поле обновляется один раз за кадр"""
+        self.is_turbo = enabled
+        self.rate_label.setVisible(enabled)
+        self.update_rate_label()
+        self.update_eta()
+
+        if self.is_running and not self.is_paused:
+            self.flush_turbo()
+            self.start_game_timer()
+
+    def update_rate_label(self):
+        if self.is_turbo:
+            self.rate_label.setText(f"{self.engine.turbo_rate} ход/с")
+
+    def update_eta(self):
+        """Оценка оставшихся ходов: поиск текущего состояния в готовой таблице"""
+        if not hasattr(self, 'eta_label'):
+            return
+
+        if self.is_turbo:
+            seconds_per_tick = 1 / self.engine.turbo_rate
+        else:
+            seconds_per_tick = self.engine.interval / 1000
+        self.eta_label.refresh(seconds_per_tick)
+
+    def timer_interval(self):
+        if self.is_turbo:
+            return self.OBSCURED_FRAME_INTERVAL if self.is_obscured else self.FRAME_INTERVAL
+        return self.engine.interval
+
+    def start_game_timer(self):
+        if self.perf is not None:
+            self.perf.restart()
+
+        self.turbo_clock.start()
+        self.turbo_debt = 0.0
+        self.game_timer.start(self.timer_interval())
+
+    def on_game_timer(self):
+        perf = self.perf
+        if perf is not None:
+            perf.tick_started()
+
+        if self.is_turbo:
+            self.turbo_frame()
         else:
-            # Обычный ход игры - увеличение счетчика
-            self.normal_game_tick()
+            self.game_tick()
 
-    def normal_game_tick(self):
-        """Обычный ход игры - увеличение счетчика"""
-        available_people = [p for p in self.people if p['count'] < 10]
+        if self.control is not None:
+            self.control.flush()
 
-        if not available_people:
+        if perf is not None:
+            perf.tick_finished()
+
+    def turbo_frame(self):
+        """Выполняет ходы, накопившиеся за кадр, в пределах бюджета времени кадра"""
+        elapsed = self.turbo_clock.restart()
+        self.turbo_debt += elapsed * self.engine.turbo_rate / 1000
+        due = int(self.turbo_debt)
+
+        # При малой скорости ход за кадр не больше одного: показываем его как обычно
+        if due <= 1:
+            if due == 1:
+                self.turbo_debt -= 1
+                self.game_tick()
+            return
+
+        alarms = self.engine.alarms
+        budget = QElapsedTimer()
+        budget.start()
+
+        # Изменившихся рыбаков собираем, только если поле видно
+        dirty = None if self.is_obscured else self.turbo_dirty
+        budget_ms = self.TURBO_BUDGET_MS * self.game_timer.interval() // self.FRAME_INTERVAL
+
+        done = 0
+        while done < due and not self.engine.finished:
+            done += self.engine.step(min(self.TURBO_CHUNK, due - done), dirty)
+            if budget.elapsed() >= budget_ms:
+                # Не успеваем: отбрасываем долг, чтобы интерфейс оставался отзывчивым
+                self.turbo_debt = 0.0
+                break
+        else:
+            self.turbo_debt -= done
+
+        if not self.is_obscured:
+            if self.engine.alarms != alarms:
+                self.trigger_alarm_lamp()
+
+            self.flush_turbo()
+            self.update_eta()
+
+        if self.engine.finished:
+            self.stop_game_with_message()
+
+    def flush_turbo(self):
+        """Переносит изменившихся за кадр рыбаков на поле"""
+        for index in self.turbo_dirty:
+            self.update_character_display(index)
+        self.turbo_dirty.clear()
+
+    def game_tick(self):
+        event, index = self.engine.tick()
+        if not self.is_obscured:
+            self.update_eta()
+
+        if event == EVENT_FINISH:
             self.stop_game_with_message()
             return
 
-        selected_person = random.choice(available_people)
-        person_index = self.people.index(selected_person)
-        selected_person['count'] += 1
+        if not self.is_obscured:
+            if event == EVENT_ALARM:
+                self.show_alarm(index)
+            else:
+                self.show_catch(index)
 
-        self.update_character_display(person_index)
-        self.highlight_character(person_index)
+        if self.engine.finished:
+            self.stop_game_with_message()
+
+    def show_catch(self, index):
+        """Отображение улова - увеличение счетчика"""
+        self.update_character_display(index)
+        self.highlight_character(index)
 
-    def trigger_alarm(self):
-        """Обработка аварии - уменьшение счетчика и включение лампы"""
+    def show_alarm(self, index):
+        """Отображение аварии - уменьшение счетчика и включение лампы"""
         # Включаем красную лампу
         self.trigger_alarm_lamp()
-        
-        # Находим подходящих персонажей для уменьшения счетчика
-        eligible_people = [p for p in self.people if 1 <= p['count'] <= 9]
 
-        if not eligible_people:
+        # Авария могла никого не затронуть
+        if index < 0:
             return
-        
-        # Уменьшаем счетчик случайному персонажу
-        selected_person = random.choice(eligible_people)
-        person_index = self.people.index(selected_person)
-        selected_person['count'] -= 1
-        
-        self.update_character_display(person_index)
-        self.highlight_character_with_red_counter(person_index)
+
+        self.update_character_display(index)
+        self.highlight_character_with_red_counter(index)
 
     def toggle_game(self):
         if not self.is_running:
@@ -753,19 +1142,29 @@ class MainWindow(QMainWindow):
         self.start_button.setText("Стоп")
         self.set_menu_enabled(False)
 
-        interval = max(10, 1000 - self.speed * 7)
-        self.game_timer.start(interval)
+        if self.perf is not None:
+            self.perf.clear()
+
+        if not self.engine.finished:
+            self.start_recording()
+            self.autosave.start(self.engine)
+            self.autosave_timer.start()
+        self.start_game_timer()
+        self.update_stats_timer()
 
     def stop_game(self):
         self.is_running = False
         self.is_paused = False
         self.start_button.setText("Старт")
 
+        self.stop_recording()
+        self.stop_autosave()
         self.reset_game()        
         self.set_menu_enabled(True)
         self.update_characters_display()
 
         self.game_timer.stop()
+        self.update_stats_timer()
 
     def stop_game_with_message(self):
         """Остановка игры с сообщением о завершении (без сброса)"""
@@ -775,6 +1174,13 @@ class MainWindow(QMainWindow):
         
         self.set_menu_enabled(True)
         self.game_timer.stop()
+        self.stop_recording()
+        self.stop_autosave()
+        self.update_stats_timer()
+
+        # Клиенты узнают о завершении до того, как окно сообщения остановит кадры
+        if self.control is not None:
+            self.control.flush(force=True)
         
         # Показываем сообщение о завершении игры
         QMessageBox.information(
@@ -784,22 +1190,22 @@ class MainWindow(QMainWindow):
             "Нажмите 'Старт' для начала новой игры."
         )
 
+    def stop_autosave(self):
+        """Игра окончена или сброшена: продолжать нечего"""
+        self.autosave_timer.stop()
+        self.autosave.clear()
+
     def set_menu_enabled(self, enabled):
         self.open_file_action.setEnabled(enabled)
         self.save_file_action.setEnabled(enabled)
+        self.import_action.setEnabled(enabled)
         self.colors_action.setEnabled(enabled)
+        self.record_action.setEnabled(enabled)
         self.initial_action.setEnabled(enabled)
 
     def reset_game(self):
         """Сброс игры к начальным значениям"""
-        self.people = []
-
-        for i, person in enumerate(self.initial_people):
-            self.people.append({
-                'id': i,
-                'color': person['color'],
-                'count': person['count']
-            })
+        self.engine.reset()
 
     def toggle_pause(self):
         if not self.is_paused:
@@ -812,8 +1218,36 @@ class MainWindow(QMainWindow):
         self.pause_button.setText("Продолжить")
         self.game_timer.stop()
 
+        self.autosave_timer.stop()
+        self.autosave.snapshot()
+        self.update_stats_timer()
+
     def resume_game(self):
         self.is_paused = False
         self.pause_button.setText("Пауза")
-        interval = max(10, 1000 - self.speed * 7)
-        self.game_timer.start(interval)
\ No newline at end of file
+        self.autosave_timer.start()
+        self.start_game_timer()
+        self.update_stats_timer()
+
+    def update_stats_timer(self):
+        if self.stats_panel is not None:
+            self.stats_panel.update_timer()
+
+    def start_control(self, address):
+        """Включает локальный сервер управления и потока событий"""
+        from windows.remote_control import RemoteControl
+
+        self.control = RemoteControl(self, address)
+
+    def closeEvent(self, event):
+        self.game_timer.stop()
+        self.eta_label.stop()
+        if self.control is not None:
+            self.control.close()
+        self.stop_recording()
+
+        if self.is_running:
+            self.autosave.snapshot()
+        self.autosave.close()
+        self.remove_temp_scenario()
+        super().closeEvent(event)
@@ -0,0 +1,141 @@
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from game.control import ControlServer, EventBuffer
+
+
+class RemoteControl(QObject):
+    """Управление главным окном через локальный сервер.
+
+    Сервер работает в своем потоке и передает команды сигналом, поэтому
+    каждая команда выполняется в потоке интерфейса так же, как нажатие
+    кнопки. События хода собираются, только пока есть подписчики."""
+
+    requested = pyqtSignal(object, object)
+    subscribers_changed = pyqtSignal(int)
+
+    def __init__(self, window, address):
+        super().__init__(window)
+
+        self.window = window
+        self.buffer = EventBuffer()
+        self.subscribers = 0
+
+        self.commands = {
+            'load': self.load,
+            'start': self.start,
+            'pause': self.pause,
+            'resume': self.resume,
+            'stop': self.stop,
+            'speed': self.set_speed,
+            'alarm': self.set_alarm,
+            'turbo': self.set_turbo,
+            'state': lambda request: None,
+            'subscribe': lambda request: None,
+            'unsubscribe': lambda request: None,
+        }
+
+        self.requested.connect(self.on_request)
+        self.subscribers_changed.connect(self.on_subscribers_changed)
+
+        self.server = ControlServer(address, self.requested.emit, self.subscribers_changed.emit)
+        self.server.start()
+
+    def state(self):
+        window = self.window
+        engine = window.engine
+        return {
+            'running': window.is_running,
+            'paused': window.is_paused,
+            'turbo': window.is_turbo,
+            'speed': engine.speed,
+            'alarm': engine.alarm,
+            'seed': engine.seed,
+            'fishers': len(engine.counts),
+            'ticks': engine.ticks,
+            'catches': engine.catches,
+            'alarms': engine.alarms,
+            'completed': engine.completed,
+            'finished': engine.finished,
+        }
+
+    def on_request(self, request, reply):
+        handler = self.commands.get(request.get('cmd'))
+
+        try:
+            if handler is None:
+                raise ValueError(f"Неизвестная команда: {request.get('cmd')!r}")
+            handler(request)
+        except (OSError, ValueError, KeyError, TypeError) as error:
+            reply({'ok': False, 'error': str(error)})
+            return
+
+        reply({'ok': True, 'state': self.state()})
+        self.flush(force=True)
+
+    def on_subscribers_changed(self, count):
+        recorders = self.window.engine.recorders
+
+        if count and not self.subscribers:
+            self.buffer.events.clear()
+            recorders.append(self.buffer)
+        elif not count and self.subscribers:
+            recorders.remove(self.buffer)
+
+        self.subscribers = count
+
+    def flush(self, force=False):
+        """Отдает подписчикам события кадра одной пачкой"""
+        if not self.subscribers:
+            return
+
+        events = self.buffer.take()
+        if events or force:
+            self.server.publish(events, self.state())
+
+    def load(self, request):
+        window = self.window
+        if window.is_running:
+            raise ValueError("Игра идет: сначала остановите ее командой stop")
+
+        window.load_config(request['path'])
+        window.update_controls()
+        window.update_characters_display()
+        window.update_eta()
+
+    def start(self, request):
+        if not self.window.is_running:
+            self.window.start_game()
+        elif self.window.is_paused:
+            self.window.resume_game()
+
+    def pause(self, request):
+        if self.window.is_running and not self.window.is_paused:
+            self.window.pause_game()
+
+    def resume(self, request):
+        if self.window.is_running and self.window.is_paused:
+            self.window.resume_game()
+
+    def stop(self, request):
+        self.window.stop_game()
+
+    @staticmethod
+    def percent(request):
+        value = request['value']
+        if not isinstance(value, int) or isinstance(value, bool) or not 0 <= value <= 100:
+            raise ValueError(f"Значение должно быть целым от 0 до 100: {value!r}")
+        return value
+
+    def set_speed(self, request):
+        self.window.speed_slider.setValue(self.percent(request))
+
+    def set_alarm(self, request):
+        self.window.alarm_slider.setValue(self.percent(request))
+
+    def set_turbo(self, request):
+        self.window.turbo_action.setChecked(bool(request['enabled']))
+
+    def close(self):
+        self.server.close()
+        if self.subscribers:
+            self.on_subscribers_changed(0)
@@ -0,0 +1,124 @@
+from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtWidgets import (
+    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QSlider, QPushButton, QLabel
+)
+
+from widgets.board import BoardWidget
+from game.event_log import EventLogReader
+from game.engine import EVENT_ALARM
+
+class ReplayWindow(QMainWindow):
+    """Просмотр записанной партии с перемоткой по шкале ходов"""
+
+    PLAY_INTERVAL = 16
+    PLAY_RATES = (1, 10, 100, 1000, 10000)
+
+    def __init__(self, path, parent=None):
+        super().__init__(parent)
+
+        self.reader = EventLogReader(path)
+        self.play_rate = self.PLAY_RATES[0]
+
+        self.setWindowTitle(f"Запись партии (зерно {self.reader.seed})")
+        self.resize(1366, 520)
+
+        central_widget = QWidget()
+        layout = QVBoxLayout(central_widget)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+        self.setCentralWidget(central_widget)
+
+        self.board = BoardWidget(self.reader)
+        layout.addWidget(self.board, 1)
+
+        controls_layout = QHBoxLayout()
+        controls_layout.setContentsMargins(8, 8, 8, 8)
+
+        self.play_button = QPushButton("Воспроизвести")
+        self.play_button.clicked.connect(self.toggle_play)
+        self.play_button.setMinimumWidth(150)
+
+        self.rate_button = QPushButton()
+        self.rate_button.clicked.connect(self.next_rate)
+
+        self.timeline = QSlider(Qt.Orientation.Horizontal)
+        self.timeline.valueChanged.connect(self.seek)
+
+        self.tick_label = QLabel()
+        self.tick_label.setMinimumWidth(220)
+
+        controls_layout.addWidget(self.play_button)
+        controls_layout.addWidget(self.rate_button)
+        controls_layout.addWidget(self.timeline, 1)
+        controls_layout.addWidget(self.tick_label)
+        layout.addLayout(controls_layout)
+
+        self.play_timer = QTimer(self)
+        self.play_timer.setInterval(self.PLAY_INTERVAL)
+        self.play_timer.timeout.connect(self.play_frame)
+
+        self.update_range()
+        self.update_rate_button()
+        self.seek(self.reader.first_tick)
+
+    def update_range(self):
+        """Журнал может дописываться идущей игрой, поэтому границы читаются заново"""
+        self.timeline.blockSignals(True)
+        self.timeline.setRange(self.reader.first_tick, self.reader.last_tick)
+        self.timeline.setPageStep(max(1, (self.reader.last_tick - self.reader.first_tick) // 100))
+        self.timeline.blockSignals(False)
+
+    def seek(self, tick):
+        changed = self.reader.seek(tick)
+
+        if changed is None or len(changed) > 64:
+            self.board.resync()
+        else:
+            for index in changed:
+                self.board.update_index(index)
+
+        self.update_tick_label()
+
+    def update_tick_label(self):
+        text = f"Ход {self.reader.tick} из {self.reader.last_tick}"
+
+        event = self.reader.event_at(self.reader.tick)
+        if event is not None:
+            kind, index = event
+            if kind == EVENT_ALARM:
+                text += " — авария" if index < 0 else f" — авария у рыбака {index + 1}"
+            else:
+                text += f" — улов у рыбака {index + 1}"
+
+        self.tick_label.setText(text)
+
+    def toggle_play(self):
+        if self.play_timer.isActive():
+            self.play_timer.stop()
+            self.play_button.setText("Воспроизвести")
+        else:
+            self.update_range()
+            self.play_timer.start()
+            self.play_button.setText("Пауза")
+
+    def next_rate(self):
+        position = self.PLAY_RATES.index(self.play_rate)
+        self.play_rate = self.PLAY_RATES[(position + 1) % len(self.PLAY_RATES)]
+        self.update_rate_button()
+
+    def update_rate_button(self):
+        self.rate_button.setText(f"x{self.play_rate}")
+
+    def play_frame(self):
+        if self.reader.tick >= self.reader.last_tick:
+            self.update_range()
+            if self.reader.tick >= self.reader.last_tick:
+                self.toggle_play()
+                return
+
+        self.timeline.setValue(self.reader.tick + self.play_rate)
+
+    def closeEvent(self, event):
+        self.play_timer.stop()
+        self.reader.close()
+        super().closeEvent(event)
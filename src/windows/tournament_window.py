@@ -0,0 +1,288 @@
+from PyQt6.QtCore import Qt, QTimer, QElapsedTimer, QRect
+from PyQt6.QtGui import QPainter, QColor, QFont, QFontMetrics
+from PyQt6.QtWidgets import (
+    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QScrollArea, QSlider, QPushButton, QLabel
+)
+
+from game.engine import GameEngine, TARGET_COUNT
+
+BACKGROUND_COLOR = QColor("#ffffff")
+BOARD_COLOR = QColor("#dbeafe")
+BORDER_COLOR = QColor("#cbd5e1")
+TEXT_COLOR = QColor("#1f2937")
+MUTED_COLOR = QColor("#4b5563")
+WINNER_COLOR = QColor("#16a34a")
+HISTOGRAM_COLOR = QColor("#7c3aed")
+
+# Больше рыбаков не помещается столбиками: поле показывается гистограммой счетчиков
+MAX_BARS = 80
+# Гистограмма большого поля строится по равномерной выборке рыбаков
+HISTOGRAM_SAMPLE = 4096
+
+
+class TournamentView(QWidget):
+    """Все поля турнира, нарисованные одним виджетом.
+
+    Поле перерисовывается только в своем прямоугольнике, а запросы update
+    за кадр Qt объединяет в одну отрисовку."""
+
+    BOARD_WIDTH = 260
+    BOARD_HEIGHT = 150
+    SPACING = 8
+    TITLE_HEIGHT = 20
+    FOOTER_HEIGHT = 18
+
+    def __init__(self, tournament, parent=None):
+        super().__init__(parent)
+
+        self.tournament = tournament
+        self.columns = 1
+
+        self.text_font = QFont()
+        self.text_font.setPixelSize(12)
+        self.bold_font = QFont(self.text_font)
+        self.bold_font.setBold(True)
+        self.metrics = QFontMetrics(self.text_font)
+
+        # Цвета рыбаков малых полей разбираются один раз
+        self.colors = [
+            [QColor(color) for color in board['engine'].colors]
+            if len(board['engine'].counts) <= MAX_BARS else None
+            for board in tournament.boards
+        ]
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+
+        # Поля раскладываются по ширине области прокрутки, высота — по числу строк
+        pitch = self.BOARD_WIDTH + self.SPACING
+        self.columns = max(1, (self.width() - self.SPACING) // pitch)
+        rows = -(-len(self.tournament.boards) // self.columns)
+        self.setMinimumHeight(self.SPACING + rows * (self.BOARD_HEIGHT + self.SPACING))
+
+    def board_rect(self, index):
+        row, column = divmod(index, self.columns)
+        return QRect(
+            self.SPACING + column * (self.BOARD_WIDTH + self.SPACING),
+            self.SPACING + row * (self.BOARD_HEIGHT + self.SPACING),
+            self.BOARD_WIDTH, self.BOARD_HEIGHT
+        )
+
+    def update_board(self, index):
+        self.update(self.board_rect(index))
+
+    def paintEvent(self, event):
+        exposed = event.rect()
+
+        painter = QPainter(self)
+        painter.fillRect(exposed, BACKGROUND_COLOR)
+
+        for index in range(len(self.tournament.boards)):
+            rect = self.board_rect(index)
+            if rect.intersects(exposed):
+                self.paint_board(painter, index, rect)
+
+        painter.end()
+
+    def paint_board(self, painter, index, rect):
+        board = self.tournament.boards[index]
+        engine = board['engine']
+
+        painter.fillRect(rect, BORDER_COLOR)
+        painter.fillRect(rect.adjusted(1, 1, -1, -1), BOARD_COLOR)
+
+        inner = rect.adjusted(8, 4, -8, -4)
+        title_rect = QRect(inner.left(), inner.top(), inner.width(), self.TITLE_HEIGHT)
+        footer_rect = QRect(inner.left(), inner.bottom() - self.FOOTER_HEIGHT, inner.width(), self.FOOTER_HEIGHT)
+        bars_rect = QRect(
+            inner.left(), title_rect.bottom() + 4,
+            inner.width(), footer_rect.top() - title_rect.bottom() - 8
+        )
+
+        place = board['place']
+        painter.setFont(self.bold_font)
+        painter.setPen(WINNER_COLOR if place == 1 else TEXT_COLOR)
+        status = f"{place} место" if place else f"ход {engine.ticks}"
+        status_width = self.metrics.horizontalAdvance(status) + 12
+        painter.drawText(
+            title_rect.adjusted(0, 0, -status_width, 0),
+            Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+            self.metrics.elidedText(board['name'], Qt.TextElideMode.ElideRight, title_rect.width() - status_width)
+        )
+        painter.drawText(title_rect, Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter, status)
+
+        if self.colors[index] is not None:
+            self.paint_bars(painter, engine, self.colors[index], bars_rect)
+        else:
+            self.paint_histogram(painter, engine, bars_rect)
+
+        painter.setFont(self.text_font)
+        painter.setPen(MUTED_COLOR)
+        painter.drawText(
+            footer_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+            f"поймали {TARGET_COUNT}: {engine.completed} из {len(engine.counts)} · аварий {engine.alarms}"
+        )
+
+    def paint_bars(self, painter, engine, colors, rect):
+        """Столбик на рыбака высотой по счетчику"""
+        counts = engine.counts
+        pitch = rect.width() / max(1, len(counts))
+        width = max(1, int(pitch) - 1)
+
+        left = rect.left()
+        bottom = rect.bottom()
+        scale = rect.height() / TARGET_COUNT
+        fill_rect = painter.fillRect
+        for index, count in enumerate(counts):
+            height = round(scale * min(count, TARGET_COUNT))
+            fill_rect(int(left + index * pitch), bottom - height, width, height, colors[index])
+
+    def paint_histogram(self, painter, engine, rect):
+        """Сколько рыбаков на каждом счетчике от 0 до TARGET_COUNT"""
+        counts = engine.counts
+        step = max(1, len(counts) // HISTOGRAM_SAMPLE)
+        sample = counts[::step]
+
+        # Последний столбец — завершившие рыбаки
+        bins = [sample.count(value) for value in range(TARGET_COUNT)]
+        bins.append(max(1, len(sample) - sum(bins)))
+
+        pitch = rect.width() / len(bins)
+        scale = rect.height() / max(bins)
+        for value, hits in enumerate(bins):
+            height = round(scale * hits)
+            painter.fillRect(
+                int(rect.left() + value * pitch), rect.bottom() - height,
+                max(1, int(pitch) - 2), height, HISTOGRAM_COLOR
+            )
+
+
+class TournamentWindow(QMainWindow):
+    """Несколько игр рядом: один таймер продвигает все поля, а изменившиеся
+    поля перерисовываются вместе раз в кадр"""
+
+    FRAME_INTERVAL = 16
+    FRAME_BUDGET_MS = 8
+
+    def __init__(self, tournament, parent=None):
+        super().__init__(parent)
+
+        self.tournament = tournament
+        self.debt = 0.0
+        self.rate = 0
+
+        self.setWindowTitle(f"Турнир ({len(tournament.boards)} полей)")
+        self.resize(1366, 768)
+
+        central_widget = QWidget()
+        layout = QVBoxLayout(central_widget)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+        self.setCentralWidget(central_widget)
+
+        self.view = TournamentView(tournament)
+        self.scroll_area = QScrollArea()
+        self.scroll_area.setWidgetResizable(True)
+        self.scroll_area.setWidget(self.view)
+        layout.addWidget(self.scroll_area, 1)
+
+        controls_layout = QHBoxLayout()
+        controls_layout.setContentsMargins(8, 8, 8, 8)
+
+        self.start_button = QPushButton("Старт")
+        self.start_button.setMinimumWidth(100)
+        self.start_button.clicked.connect(self.toggle_run)
+
+        restart_button = QPushButton("Заново")
+        restart_button.clicked.connect(self.restart)
+
+        self.speed_slider = QSlider(Qt.Orientation.Horizontal)
+        self.speed_slider.setRange(0, 100)
+        self.speed_slider.setValue(30)
+        self.speed_slider.valueChanged.connect(self.on_speed_changed)
+
+        self.rate_label = QLabel()
+        self.rate_label.setMinimumWidth(110)
+
+        self.status_label = QLabel()
+        self.status_label.setMinimumWidth(200)
+
+        controls_layout.addWidget(self.start_button)
+        controls_layout.addWidget(restart_button)
+        controls_layout.addWidget(QLabel("Скорость"))
+        controls_layout.addWidget(self.speed_slider, 1)
+        controls_layout.addWidget(self.rate_label)
+        controls_layout.addWidget(self.status_label)
+        layout.addLayout(controls_layout)
+
+        self.clock = QElapsedTimer()
+        self.timer = QTimer(self)
+        self.timer.setInterval(self.FRAME_INTERVAL)
+        self.timer.timeout.connect(self.frame)
+
+        self.on_speed_changed(self.speed_slider.value())
+        self.update_status()
+
+    def on_speed_changed(self, value):
+        # Ходов в секунду на каждое поле: та же шкала, что и в турбо-режиме
+        self.rate = GameEngine(speed=value).turbo_rate
+        self.rate_label.setText(f"{self.rate} ход/с")
+
+    def update_status(self):
+        boards = self.tournament.boards
+        text = f"Завершено {len(self.tournament.finish_order)} из {len(boards)}"
+        if self.tournament.finish_order:
+            text += f" · первое: {boards[self.tournament.finish_order[0]]['name']}"
+        self.status_label.setText(text)
+
+    def toggle_run(self):
+        if self.timer.isActive():
+            self.timer.stop()
+            self.start_button.setText("Старт")
+            return
+
+        if self.tournament.finished:
+            self.restart()
+
+        self.debt = 0.0
+        self.clock.start()
+        self.timer.start()
+        self.start_button.setText("Пауза")
+
+    def restart(self):
+        self.tournament.reset()
+        self.debt = 0.0
+        self.clock.start()
+        self.view.update()
+        self.update_status()
+
+    def frame(self):
+        """Ходы, накопившиеся за кадр, раздаются всем полям в пределах бюджета кадра"""
+        self.debt += self.clock.restart() * self.rate / 1000
+        due = int(self.debt)
+        if not due:
+            return
+
+        budget = QElapsedTimer()
+        budget.start()
+
+        dirty, done = self.tournament.advance(
+            due, lambda: budget.elapsed() >= self.FRAME_BUDGET_MS
+        )
+
+        # Не успеваем: долг отбрасывается, чтобы окно оставалось отзывчивым
+        self.debt = self.debt - done if done >= due else 0.0
+
+        for index in dirty:
+            self.view.update_board(index)
+
+        if dirty:
+            self.update_status()
+
+        if self.tournament.finished:
+            self.timer.stop()
+            self.start_button.setText("Старт")
+
+    def closeEvent(self, event):
+        self.timer.stop()
+        super().closeEvent(event)